@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, status
 
 from app.db.deps import get_repository
+from app.db.models import to_dict
+from app.db.queries import StatusMessageQuery, WorkItemQuery
 
 router = APIRouter(prefix="/api/v1")
 
 
-def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int]:
+def _validate_page(limit: int, offset: int) -> None:
     if limit < 1 or limit > 200:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -23,30 +24,60 @@ def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="offset must be >= 0",
         )
-    total = len(items)
-    return items[offset : offset + limit], total, limit, offset
-
-
-def _order_by_created_desc(items: list) -> list:
-    return sorted(items, key=lambda item: (item.created_at, item.id), reverse=True)
 
 
 @router.get("/status-messages")
-def list_status_messages(limit: int = 25, offset: int = 0) -> dict:
+def list_status_messages(
+    platform_id: Optional[str] = None,
+    state: Optional[str] = None,
+    limit: int = 25,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> dict:
+    _validate_page(limit, offset)
     repo = get_repository()
-    messages = _order_by_created_desc(list(repo.list_status_messages()))
-    page, total, limit, offset = _paginate(messages, limit, offset)
+    # Cursor pages skip the count; the client has it from the first page.
+    page = repo.query_status_messages(
+        StatusMessageQuery(
+            platform_id=platform_id,
+            state=state,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=cursor is None,
+        )
+    )
     return {
-        "items": [asdict(message) for message in page],
-        "total": total,
+        "items": [to_dict(message) for message in page.items],
+        "total": page.total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": page.next_cursor,
     }
 
 
 @router.get("/work-items")
-def list_work_items(state: Optional[str] = None, limit: int = 25, offset: int = 0) -> dict:
+def list_work_items(
+    state: Optional[str] = None,
+    limit: int = 25,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> dict:
+    _validate_page(limit, offset)
     repo = get_repository()
-    items = [asdict(item) for item in repo.list_work_items(state=state)]
-    page, total, limit, offset = _paginate(items, limit, offset)
-    return {"items": page, "total": total, "limit": limit, "offset": offset}
+    page = repo.query_work_items(
+        WorkItemQuery(
+            state=state,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=cursor is None,
+        )
+    )
+    return {
+        "items": [to_dict(item) for item in page.items],
+        "total": page.total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": page.next_cursor,
+    }
@@ -1,6 +1,6 @@
 """Health and readiness endpoints."""
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 
 router = APIRouter(prefix="/api/v1")
 
@@ -11,6 +11,9 @@ def healthz() -> dict:
 
 
 @router.get("/readyz", status_code=status.HTTP_200_OK)
-def readyz() -> dict:
-    # Stubbed readiness check; will be expanded with real checks later.
+def readyz(request: Request, response: Response) -> dict:
+    warmup = getattr(request.app.state, "warmup", None)
+    if warmup is not None and not warmup.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "warming", "ready": False}
     return {"status": "ok", "ready": True}
@@ -0,0 +1,27 @@
+"""Operational metrics endpoints."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from app.db.deps import get_circuit_breaker, get_query_instrumentation
+
+router = APIRouter(prefix="/api/v1")
+
+
+@router.get("/metrics/queries")
+def query_metrics() -> dict:
+    """Warehouse time per endpoint since startup, most expensive first."""
+    instrumentation = get_query_instrumentation()
+    items = []
+    for stats in instrumentation.snapshot():
+        item = asdict(stats)
+        item["total_seconds"] = stats.total_seconds
+        items.append(item)
+    return {
+        "items": items,
+        "slow_query_threshold_ms": instrumentation.slow_query_threshold_seconds * 1000,
+        "circuit": asdict(get_circuit_breaker().stats()),
+    }
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
@@ -10,6 +10,8 @@ from app.auth.deps import get_current_user
 from app.auth.identity import Identity
 from app.auth.permissions import PermissionContext, require_role
 from app.core.exceptions import ForbiddenError
+from app.db.models import to_dict
+from app.db.queries import PlatformQuery
 from app.models.platform import PlatformCreate, PlatformListResponse, PlatformRead
 from app.services.platform_service import PlatformService, get_platform_service
 from app.services.rbac_service import ROLE_ADMIN
@@ -17,7 +19,7 @@ from app.services.rbac_service import ROLE_ADMIN
 router = APIRouter(prefix="/api/v1")
 
 
-def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int]:
+def _validate_page(limit: int, offset: int) -> None:
     if limit < 1 or limit > 200:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -28,27 +30,26 @@ def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="offset must be >= 0",
         )
-    total = len(items)
-    return items[offset : offset + limit], total, limit, offset
-
-
-def _order_by_created_desc(items: list) -> list:
-    return sorted(items, key=lambda item: (item.created_at, item.id), reverse=True)
 
 
 @router.get("/platforms", response_model=PlatformListResponse)
 def list_platforms(
     limit: int = 25,
     offset: int = 0,
+    cursor: Optional[str] = None,
     service: PlatformService = Depends(get_platform_service),
 ) -> dict:
-    platforms = _order_by_created_desc(list(service.list_platforms()))
-    page, total, limit, offset = _paginate(platforms, limit, offset)
+    _validate_page(limit, offset)
+    # Cursor pages skip the count; the client has it from the first page.
+    page = service.query_platforms(
+        PlatformQuery(limit=limit, offset=offset, cursor=cursor, include_total=cursor is None)
+    )
     return {
-        "items": [asdict(platform) for platform in page],
-        "total": total,
+        "items": [to_dict(platform) for platform in page.items],
+        "total": page.total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": page.next_cursor,
     }
 
 
@@ -57,7 +58,7 @@ def get_platform(
     platform_id: str, service: PlatformService = Depends(get_platform_service)
 ) -> dict:
     platform = service.get_platform(platform_id)
-    return asdict(platform)
+    return to_dict(platform)
 
 
 @router.post(
@@ -74,4 +75,4 @@ def create_platform(
     if not permissions.granted:
         raise ForbiddenError("Admin role required")
     platform = service.create_platform(payload, identity)
-    return asdict(platform)
+    return to_dict(platform)
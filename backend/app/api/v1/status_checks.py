@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -11,6 +10,8 @@ from app.auth.deps import get_current_user
 from app.auth.identity import Identity
 from app.auth.permissions import PermissionContext, require_role
 from app.core.exceptions import ForbiddenError
+from app.db.models import to_dict
+from app.db.queries import StatusCheckQuery
 from app.models.status_check import (
     StatusCheckCreate,
     StatusCheckListResponse,
@@ -26,7 +27,7 @@ from app.services.status_check_service import (
 router = APIRouter(prefix="/api/v1")
 
 
-def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int]:
+def _validate_page(limit: int, offset: int) -> None:
     if limit < 1 or limit > 200:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -37,12 +38,6 @@ def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="offset must be >= 0",
         )
-    total = len(items)
-    return items[offset : offset + limit], total, limit, offset
-
-
-def _order_by_created_desc(items: list) -> list:
-    return sorted(items, key=lambda item: (item.created_at, item.id), reverse=True)
 
 
 @router.get("/status-checks", response_model=StatusCheckListResponse)
@@ -50,17 +45,26 @@ def list_status_checks(
     platform_id: Optional[str] = None,
     limit: int = 25,
     offset: int = 0,
+    cursor: Optional[str] = None,
     service: StatusCheckService = Depends(get_status_check_service),
 ) -> dict:
-    checks = _order_by_created_desc(
-        list(service.list_status_checks(platform_id=platform_id))
+    _validate_page(limit, offset)
+    # Cursor pages skip the count; the client has it from the first page.
+    page = service.query_status_checks(
+        StatusCheckQuery(
+            platform_id=platform_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=cursor is None,
+        )
     )
-    page, total, limit, offset = _paginate(checks, limit, offset)
     return {
-        "items": [asdict(check) for check in page],
-        "total": total,
+        "items": [to_dict(check) for check in page.items],
+        "total": page.total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": page.next_cursor,
     }
 
 
@@ -69,7 +73,7 @@ def get_status_check(
     check_id: str, service: StatusCheckService = Depends(get_status_check_service)
 ) -> dict:
     check = service.get_status_check(check_id)
-    return asdict(check)
+    return to_dict(check)
 
 
 @router.post(
@@ -86,7 +90,7 @@ def create_status_check(
     if not permissions.granted:
         raise ForbiddenError("Admin role required")
     check = service.create_status_check(payload, identity)
-    return asdict(check)
+    return to_dict(check)
 
 
 @router.put("/status-checks/{check_id}", response_model=StatusCheckRead)
@@ -100,4 +104,4 @@ def update_status_check(
     if not permissions.granted:
         raise ForbiddenError("Admin role required")
     check = service.update_status_check(check_id, payload, identity)
-    return asdict(check)
+    return to_dict(check)
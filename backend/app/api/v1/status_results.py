@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, status
 
+from app.db.decoders import format_timestamp, parse_timestamp
 from app.db.deps import get_repository
-from app.db.models import StatusResult
+from app.db.models import to_dict
+from app.db.queries import DEFAULT_BUCKET_POINTS, SlaQuery, StatusBucketQuery, StatusResultQuery
+from app.db.sla import platform_rollups
 
 router = APIRouter(prefix="/api/v1")
 
+MAX_BUCKET_POINTS = 1000
+MIN_BUCKET_SECONDS = 60
+DEFAULT_SLA_WINDOW = timedelta(days=30)
+MAX_SLA_WINDOW = timedelta(days=400)
 
-def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int]:
+
+def _validate_page(limit: int, offset: int) -> None:
     if limit < 1 or limit > 200:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -25,26 +32,11 @@ def _paginate(items: list, limit: int, offset: int) -> tuple[list, int, int, int
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="offset must be >= 0",
         )
-    total = len(items)
-    return items[offset : offset + limit], total, limit, offset
-
-
-def _normalize_timestamp(value: str) -> str:
-    if value.endswith("Z"):
-        return f"{value[:-1]}+00:00"
-    return value
-
-
-def _parse_timestamp(value: str) -> datetime:
-    parsed = datetime.fromisoformat(_normalize_timestamp(value))
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed
 
 
 def _parse_query_timestamp(value: str, label: str) -> datetime:
     try:
-        return _parse_timestamp(value)
+        return parse_timestamp(value)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -52,28 +44,6 @@ def _parse_query_timestamp(value: str, label: str) -> datetime:
         ) from exc
 
 
-def _parse_result_timestamp(value: str) -> datetime:
-    try:
-        return _parse_timestamp(value)
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Invalid timestamp in status results",
-        ) from exc
-
-
-def _sort_key(result: StatusResult) -> tuple[datetime, datetime, str]:
-    return (
-        _parse_result_timestamp(result.measured_at),
-        _parse_result_timestamp(result.created_at),
-        result.id,
-    )
-
-
-def _order_by_measured_desc(items: list[StatusResult]) -> list[StatusResult]:
-    return sorted(items, key=_sort_key, reverse=True)
-
-
 def _validate_time_range(
     start_at: Optional[str], end_at: Optional[str]
 ) -> tuple[Optional[datetime], Optional[datetime]]:
@@ -87,29 +57,6 @@ def _validate_time_range(
     return start_dt, end_dt
 
 
-def _filter_results(
-    results: list[StatusResult],
-    platform_id: Optional[str],
-    check_id: Optional[str],
-    start_at: Optional[str],
-    end_at: Optional[str],
-) -> list[StatusResult]:
-    start_dt, end_dt = _validate_time_range(start_at, end_at)
-    filtered: list[StatusResult] = []
-    for result in results:
-        if platform_id and result.platform_id != platform_id:
-            continue
-        if check_id and result.check_id != check_id:
-            continue
-        measured_dt = _parse_result_timestamp(result.measured_at)
-        if start_dt and measured_dt < start_dt:
-            continue
-        if end_dt and measured_dt > end_dt:
-            continue
-        filtered.append(result)
-    return filtered
-
-
 @router.get("/status-results")
 def list_status_results(
     platform_id: Optional[str] = None,
@@ -118,17 +65,30 @@ def list_status_results(
     end_at: Optional[str] = None,
     limit: int = 25,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> dict:
+    _validate_page(limit, offset)
+    start_dt, end_dt = _validate_time_range(start_at, end_at)
     repo = get_repository()
-    results = list(repo.list_status_results())
-    filtered = _filter_results(results, platform_id, check_id, start_at, end_at)
-    ordered = _order_by_measured_desc(filtered)
-    page, total, limit, offset = _paginate(ordered, limit, offset)
+    # Cursor pages skip the count; the client has it from the first page.
+    page = repo.query_status_results(
+        StatusResultQuery(
+            platform_id=platform_id,
+            check_id=check_id,
+            start_at=start_dt,
+            end_at=end_dt,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=cursor is None,
+        )
+    )
     return {
-        "items": [asdict(result) for result in page],
-        "total": total,
+        "items": [to_dict(result) for result in page.items],
+        "total": page.total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": page.next_cursor,
     }
 
 
@@ -140,27 +100,130 @@ def list_latest_status_results(
     end_at: Optional[str] = None,
     limit: int = 25,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> dict:
+    _validate_page(limit, offset)
+    start_dt, end_dt = _validate_time_range(start_at, end_at)
     repo = get_repository()
-    results = list(repo.list_status_results())
-    filtered = _filter_results(results, platform_id, check_id, start_at, end_at)
-
-    latest_by_check: dict[
-        str,
-        tuple[tuple[datetime, datetime, str], StatusResult],
-    ] = {}
-    for result in filtered:
-        sort_key = _sort_key(result)
-        existing = latest_by_check.get(result.check_id)
-        if existing is None or sort_key > existing[0]:
-            latest_by_check[result.check_id] = (sort_key, result)
-
-    latest = [entry[1] for entry in latest_by_check.values()]
-    ordered = _order_by_measured_desc(latest)
-    page, total, limit, offset = _paginate(ordered, limit, offset)
+    page = repo.query_latest_status_results(
+        StatusResultQuery(
+            platform_id=platform_id,
+            check_id=check_id,
+            start_at=start_dt,
+            end_at=end_dt,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=cursor is None,
+        )
+    )
     return {
-        "items": [asdict(result) for result in page],
-        "total": total,
+        "items": [to_dict(result) for result in page.items],
+        "total": page.total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": page.next_cursor,
+    }
+
+
+@router.get("/status-results/timeseries")
+def status_results_timeseries(
+    platform_id: Optional[str] = None,
+    check_id: Optional[str] = None,
+    start_at: Optional[str] = None,
+    end_at: Optional[str] = None,
+    bucket_seconds: Optional[int] = None,
+    points: int = DEFAULT_BUCKET_POINTS,
+) -> dict:
+    """Per-bucket aggregates for charting one check or platform.
+
+    Buckets are sized to about ``points`` over the window unless
+    ``bucket_seconds`` is given; empty buckets are omitted.
+    """
+    if not platform_id and not check_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="platform_id or check_id is required",
+        )
+    if points < 1 or points > MAX_BUCKET_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"points must be between 1 and {MAX_BUCKET_POINTS}",
+        )
+    start_dt, end_dt = _validate_time_range(start_at, end_at)
+    repo = get_repository()
+    if bucket_seconds is not None:
+        if bucket_seconds < MIN_BUCKET_SECONDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"bucket_seconds must be >= {MIN_BUCKET_SECONDS}",
+            )
+        first, last = start_dt, end_dt
+        if first is None or last is None:
+            # Open ends reach as far as the matching data does.
+            extent = repo.query_status_result_extent(
+                StatusResultQuery(
+                    platform_id=platform_id, check_id=check_id, start_at=first, end_at=last
+                )
+            )
+            if extent is not None:
+                first, last = first or extent[0], last or extent[1]
+        span = (last - first).total_seconds() if first and last else 0
+        if span / bucket_seconds > MAX_BUCKET_POINTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"bucket_seconds yields more than {MAX_BUCKET_POINTS} buckets",
+            )
+    series = repo.query_status_buckets(
+        StatusBucketQuery(
+            platform_id=platform_id,
+            check_id=check_id,
+            start_at=start_dt,
+            end_at=end_dt,
+            bucket_seconds=bucket_seconds,
+            points=points,
+        )
+    )
+    return {
+        "items": [to_dict(bucket) for bucket in series.items],
+        "bucket_seconds": series.bucket_seconds,
+        "start_at": format_timestamp(start_dt) if start_dt else None,
+        "end_at": format_timestamp(end_dt) if end_dt else None,
+    }
+
+
+@router.get("/status-results/sla")
+def status_results_sla(
+    platform_id: Optional[str] = None,
+    check_id: Optional[str] = None,
+    start_at: Optional[str] = None,
+    end_at: Optional[str] = None,
+) -> dict:
+    """Time-weighted uptime, time per state, breaches and MTTR over ``[start_at, end_at)``.
+
+    Reports cover each live check in scope plus one rollup per platform. The
+    window defaults to the 30 days ending now.
+    """
+    start_dt, end_dt = _validate_time_range(start_at, end_at)
+    end_dt = end_dt or datetime.now(timezone.utc)
+    start_dt = start_dt or end_dt - DEFAULT_SLA_WINDOW
+    if start_dt >= end_dt:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_at must be < end_at",
+        )
+    if end_dt - start_dt > MAX_SLA_WINDOW:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"window must be at most {MAX_SLA_WINDOW.days} days",
+        )
+    repo = get_repository()
+    reports = repo.query_sla(
+        SlaQuery(start_at=start_dt, end_at=end_dt, platform_id=platform_id, check_id=check_id)
+    )
+    return {
+        "checks": [to_dict(report) for report in reports],
+        "platforms": [to_dict(report) for report in platform_rollups(reports)],
+        "start_at": format_timestamp(start_dt),
+        "end_at": format_timestamp(end_dt),
     }
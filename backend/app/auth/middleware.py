@@ -9,6 +9,11 @@ from fastapi import Request, Response
 
 from app.auth.identity import extract_identity
 from app.core.config import get_settings
+from app.core.request_context import (
+    RequestContext,
+    reset_request_context,
+    set_request_context,
+)
 
 
 def _get_request_id(request: Request) -> str:
@@ -21,6 +26,20 @@ async def request_context_middleware(request: Request, call_next: Callable) -> R
     settings = get_settings()
     request.state.identity = extract_identity(request.headers, settings)
 
-    response = await call_next(request)
+    context = RequestContext(
+        request_id=request_id,
+        method=request.method,
+        path=request.url.path,
+        scope=request.scope,
+    )
+    token = set_request_context(context)
+    try:
+        response = await call_next(request)
+    finally:
+        reset_request_context(token)
     response.headers["X-Request-Id"] = request_id
+    if context.stale_data_age_seconds is not None:
+        # Served from last-known-good results while the warehouse is unavailable.
+        response.headers["X-Data-Stale"] = "true"
+        response.headers["X-Data-Age-Seconds"] = f"{context.stale_data_age_seconds:.0f}"
     return response
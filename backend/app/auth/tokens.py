@@ -0,0 +1,219 @@
+"""OAuth token provider for the app service principal."""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.core.logging import APP_LOGGER_NAME
+
+DEFAULT_SCOPE = "all-apis"
+DEFAULT_REFRESH_MARGIN_SECONDS = 300.0
+DEFAULT_RETRY_SECONDS = 30.0
+
+logger = logging.getLogger(f"{APP_LOGGER_NAME}.tokens")
+
+HeaderFactory = Callable[[], dict[str, str]]
+
+
+class TokenRefreshError(RuntimeError):
+    """Raised when no valid access token can be obtained."""
+
+
+@dataclass(frozen=True)
+class AccessToken:
+    value: str
+    expires_at: float
+
+
+TokenFetcher = Callable[[], AccessToken]
+
+
+def databricks_token_url(server_hostname: str) -> str:
+    return f"https://{server_hostname}/oidc/v1/token"
+
+
+def client_credentials_fetcher(
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    scope: str = DEFAULT_SCOPE,
+    timeout_seconds: float = 10.0,
+    clock: Callable[[], float] = time.time,
+) -> TokenFetcher:
+    """Build a fetcher for the OAuth client-credentials (M2M) grant."""
+    credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+    body = urllib.parse.urlencode({"grant_type": "client_credentials", "scope": scope}).encode()
+
+    def fetch() -> AccessToken:
+        request = urllib.request.Request(
+            token_url,
+            data=body,
+            method="POST",
+            headers={
+                "Authorization": f"Basic {credentials}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+        )
+        requested_at = clock()
+        try:
+            with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            raise TokenRefreshError(f"Token request to {token_url} failed: {exc}") from exc
+        access_token = payload.get("access_token")
+        if not access_token:
+            raise TokenRefreshError("Token response did not include an access_token")
+        expires_in = float(payload.get("expires_in", 3600))
+        return AccessToken(value=str(access_token), expires_at=requested_at + expires_in)
+
+    return fetch
+
+
+class OAuthTokenProvider:
+    """Cache a service principal token and refresh it before it expires.
+
+    Concurrent callers that need a refresh share a single in-flight request.
+    ``start()`` adds a background thread that refreshes ``refresh_margin``
+    seconds ahead of expiry, so request threads normally never wait on the
+    token endpoint. If a refresh fails while the current token is still
+    valid, callers keep using it and the refresh is retried.
+    """
+
+    def __init__(
+        self,
+        fetcher: TokenFetcher,
+        refresh_margin_seconds: float = DEFAULT_REFRESH_MARGIN_SECONDS,
+        retry_seconds: float = DEFAULT_RETRY_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._fetcher = fetcher
+        self._margin = refresh_margin_seconds
+        self._retry = retry_seconds
+        self._clock = clock
+        self._condition = threading.Condition(threading.Lock())
+        self._token: Optional[AccessToken] = None
+        self._refreshing = False
+        self._last_error: Optional[BaseException] = None
+        self._refresh_count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_service_principal(
+        cls, server_hostname: str, client_id: str, client_secret: str
+    ) -> "OAuthTokenProvider":
+        return cls(
+            client_credentials_fetcher(
+                databricks_token_url(server_hostname), client_id, client_secret
+            )
+        )
+
+    @property
+    def refresh_count(self) -> int:
+        return self._refresh_count
+
+    def get_token(self) -> str:
+        token = self._token
+        if token is not None and not self._needs_refresh(token):
+            return token.value
+        return self.refresh(force=False).value
+
+    def refresh(self, force: bool = True) -> AccessToken:
+        """Refresh now (single-flight) and return the current token."""
+        with self._condition:
+            token = self._token
+            if not force and token is not None and not self._needs_refresh(token):
+                return token
+            if self._refreshing:
+                while self._refreshing:
+                    self._condition.wait()
+                return self._usable_token_locked()
+            self._refreshing = True
+
+        try:
+            fresh = self._fetcher()
+        except BaseException as exc:
+            with self._condition:
+                self._refreshing = False
+                self._last_error = exc
+                self._condition.notify_all()
+                current = self._token
+            if current is not None and current.expires_at > self._clock():
+                logger.warning(
+                    "token refresh failed; using current token", extra={"error": str(exc)}
+                )
+                return current
+            if isinstance(exc, TokenRefreshError):
+                raise
+            raise TokenRefreshError(f"Token refresh failed: {exc}") from exc
+
+        with self._condition:
+            self._token = fresh
+            self._refreshing = False
+            self._last_error = None
+            self._refresh_count += 1
+            self._condition.notify_all()
+        return fresh
+
+    def header_factory(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.get_token()}"}
+
+    def credentials_provider(self) -> HeaderFactory:
+        """Entry point for the Databricks SQL connector's ``credentials_provider``.
+
+        The connector asks the header factory for headers on every request, so
+        pooled connections pick up refreshed tokens without being reopened.
+        """
+        return self.header_factory
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="oauth-token-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def seconds_until_refresh(self) -> float:
+        token = self._token
+        if token is None:
+            return 0.0
+        return max(0.0, token.expires_at - self._margin - self._clock())
+
+    def _needs_refresh(self, token: AccessToken) -> bool:
+        return token.expires_at - self._margin <= self._clock()
+
+    def _usable_token_locked(self) -> AccessToken:
+        token = self._token
+        if token is not None and token.expires_at > self._clock():
+            return token
+        error = self._last_error
+        raise TokenRefreshError(f"Token refresh failed: {error}") from error
+
+    def _run(self) -> None:
+        delay = 0.0
+        while not self._stop.wait(delay):
+            try:
+                self.refresh(force=self._token is not None)
+            except TokenRefreshError as exc:
+                logger.warning("background token refresh failed", extra={"error": str(exc)})
+                delay = self._retry
+                continue
+            if self._last_error is not None:
+                delay = self._retry
+            else:
+                delay = max(self.seconds_until_refresh(), 1.0)
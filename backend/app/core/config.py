@@ -12,6 +12,24 @@ class Settings(BaseSettings):
     databricks_app_port: int = 8000
     dev_user: str | None = None
     dev_email: str | None = None
+    databricks_warehouse_http_path: str | None = None
+    databricks_token: str | None = None
+    databricks_client_id: str | None = None
+    databricks_client_secret: str | None = None
+    databricks_catalog: str | None = None
+    databricks_schema: str | None = None
+    warehouse_pool_min_size: int = 1
+    warehouse_pool_max_size: int = 4
+    warehouse_pool_acquire_timeout_seconds: float = 10.0
+    warehouse_warmup_enabled: bool = True
+    warehouse_warmup_tables: str = "platforms,status_checks,status_results,status_messages"
+    warehouse_keepalive_interval_seconds: float = 0.0
+    warehouse_keepalive_hours: str | None = None
+    slow_query_threshold_ms: float = 1000.0
+    warehouse_query_timeout_seconds: float = 15.0
+    warehouse_breaker_failure_threshold: int = 5
+    warehouse_breaker_slow_call_seconds: float = 5.0
+    warehouse_breaker_open_seconds: float = 30.0
 
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -23,6 +41,12 @@ class Settings(BaseSettings):
     def dev_override_enabled(self) -> bool:
         return not self.databricks_host
 
+    @property
+    def databricks_server_hostname(self) -> str | None:
+        if not self.databricks_host:
+            return None
+        return self.databricks_host.removeprefix("https://").removeprefix("http://").rstrip("/")
+
 
 @lru_cache
 def get_settings() -> Settings:
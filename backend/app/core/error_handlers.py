@@ -10,6 +10,7 @@ from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.exceptions import AppError
+from app.db.queries import InvalidCursorError
 
 HTTP_422_UNPROCESSABLE = getattr(status, "HTTP_422_UNPROCESSABLE_CONTENT", 422)
 
@@ -48,6 +49,17 @@ def register_error_handlers(app: FastAPI) -> None:
             response.headers["X-Request-Id"] = request_id
         return response
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+        request_id = _get_request_id(request)
+        response = JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=_error_payload("invalid_cursor", "cursor is invalid", request_id),
+        )
+        if request_id:
+            response.headers["X-Request-Id"] = request_id
+        return response
+
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(
         request: Request, exc: StarletteHTTPException
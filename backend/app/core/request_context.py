@@ -0,0 +1,64 @@
+"""Per-request context visible to code that has no access to the Request."""
+
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, MutableMapping, Optional
+
+BACKGROUND_ENDPOINT = "background"
+
+
+@dataclass
+class RequestContext:
+    request_id: str
+    method: str
+    path: str
+    scope: MutableMapping[str, Any] = field(default_factory=dict, repr=False)
+    # Age of the oldest last-known-good result served instead of a fresh read.
+    stale_data_age_seconds: Optional[float] = None
+
+    @property
+    def endpoint(self) -> str:
+        """Route template once routing has run (``/platforms/{platform_id}``), else the path.
+
+        Using the template keeps per-endpoint aggregates bounded no matter how
+        many ids are requested.
+        """
+        route = self.scope.get("route")
+        template = getattr(route, "path", None)
+        return f"{self.method} {template or self.path}"
+
+
+_CURRENT: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    return _CURRENT.get()
+
+
+def set_request_context(context: Optional[RequestContext]) -> Token:
+    return _CURRENT.set(context)
+
+
+def reset_request_context(token: Token) -> None:
+    _CURRENT.reset(token)
+
+
+def current_request_id() -> Optional[str]:
+    context = _CURRENT.get()
+    return context.request_id if context is not None else None
+
+
+def current_endpoint() -> str:
+    context = _CURRENT.get()
+    return context.endpoint if context is not None else BACKGROUND_ENDPOINT
+
+
+def note_stale_read(age_seconds: float) -> None:
+    """Mark the current request as answered, at least in part, from stale data."""
+    context = _CURRENT.get()
+    if context is None:
+        return
+    previous = context.stale_data_age_seconds
+    context.stale_data_age_seconds = age_seconds if previous is None else max(previous, age_seconds)
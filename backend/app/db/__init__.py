@@ -1,13 +1,18 @@
 """Database adapters and repositories."""
 
+from app.db.async_query import AsyncQueryRunner
+from app.db.cache import CachingQueryRunner
 from app.db.connection import DatabricksSqlConnector, WarehouseConfig
 from app.db.databricks import DatabricksRepository
 from app.db.fixtures import LocalFixtureRepository
 from app.db.interfaces import PlatformRepository, StatusRepository, WorkItemRepository
 from app.db.models import Platform, StatusCheck, StatusMessage, StatusResult, WorkItem
+from app.db.pool import PoolConfig, PoolStats, ThreadSafeConnectionPool
 from app.db.query import MockQueryRunner, QueryRunner, SqlQueryRunner
 
 __all__ = [
+    "AsyncQueryRunner",
+    "CachingQueryRunner",
     "DatabricksSqlConnector",
     "DatabricksRepository",
     "LocalFixtureRepository",
@@ -16,11 +21,14 @@ __all__ = [
     "StatusRepository",
     "WorkItemRepository",
     "Platform",
+    "PoolConfig",
+    "PoolStats",
     "QueryRunner",
     "SqlQueryRunner",
     "StatusCheck",
     "StatusMessage",
     "StatusResult",
+    "ThreadSafeConnectionPool",
     "WarehouseConfig",
     "WorkItem",
 ]
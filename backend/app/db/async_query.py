@@ -0,0 +1,148 @@
+"""Async facade over blocking query runners."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Sequence, TypeVar
+
+from app.db.query import (
+    DEFAULT_BATCH_SIZE,
+    ModelT,
+    QueryParams,
+    QueryRunner,
+    QueryTimeoutError,
+    RowMapping,
+    close_iterator,
+)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+def _discard_outcome(future: "asyncio.Future[Any]") -> None:
+    # Retrieve late results/errors of timed-out calls so asyncio does not warn.
+    if not future.cancelled():
+        future.exception()
+
+
+class AsyncQueryRunner:
+    """Run a blocking ``QueryRunner`` on a dedicated, separately sized executor.
+
+    Warehouse calls never occupy the event loop or Starlette's shared threadpool,
+    so a slow query only competes with other queries for executor threads. The
+    wrapped runner keeps its semantics (and ``MockQueryRunner`` keeps recording
+    calls). Timeouts stop the caller from waiting; the DB-API call itself cannot
+    be interrupted and finishes in the background.
+    """
+
+    def __init__(
+        self,
+        runner: QueryRunner,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout_seconds: float | None = DEFAULT_TIMEOUT_SECONDS,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        self._runner = runner
+        self._timeout = timeout_seconds
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="warehouse-query"
+        )
+
+    @property
+    def runner(self) -> QueryRunner:
+        return self._runner
+
+    async def fetch_all(
+        self, sql: str, params: QueryParams | None = None, timeout: float | None = None
+    ) -> list[RowMapping]:
+        return await self._run(timeout, self._runner.fetch_all, sql, params)
+
+    async def fetch_one(
+        self, sql: str, params: QueryParams | None = None, timeout: float | None = None
+    ) -> RowMapping | None:
+        return await self._run(timeout, self._runner.fetch_one, sql, params)
+
+    async def execute(
+        self, sql: str, params: QueryParams | None = None, timeout: float | None = None
+    ) -> None:
+        await self._run(timeout, self._runner.execute, sql, params)
+
+    async def execute_many(
+        self,
+        sql: str,
+        params_seq: Sequence[QueryParams],
+        timeout: float | None = None,
+    ) -> None:
+        await self._run(timeout, self._runner.execute_many, sql, params_seq)
+
+    async def fetch_models(
+        self,
+        sql: str,
+        model: type[ModelT],
+        params: QueryParams | None = None,
+        timeout: float | None = None,
+    ) -> list[ModelT]:
+        return await self._run(timeout, self._runner.fetch_models, sql, model, params)
+
+    async def iter_rows(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        timeout: float | None = None,
+    ) -> AsyncIterator[RowMapping]:
+        """Yield rows while fetching each batch on the executor.
+
+        ``timeout`` applies per batch. Closing the iterator early releases the
+        underlying connection on the executor thread.
+        """
+        loop = asyncio.get_running_loop()
+        batches = self._runner.iter_batches(sql, params, batch_size)
+        pending: asyncio.Future[Any] | None = None
+        try:
+            while True:
+                pending = self._submit(loop, next, batches, None)
+                batch = await self._wait(pending, timeout)
+                pending = None
+                if batch is None:
+                    return
+                for row in batch:
+                    yield row
+        finally:
+            if pending is not None and not pending.done():
+                # A batch is still being fetched; close once that thread is done.
+                pending.add_done_callback(lambda _: self._executor.submit(close_iterator, batches))
+            else:
+                await loop.run_in_executor(self._executor, close_iterator, batches)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    async def _run(self, timeout: float | None, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await self._wait(self._submit(loop, func, *args), timeout)
+
+    def _submit(
+        self, loop: asyncio.AbstractEventLoop, func: Callable[..., T], *args: Any
+    ) -> "asyncio.Future[T]":
+        # Copy context so request-scoped context vars reach the executor thread.
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args)
+        return loop.run_in_executor(self._executor, call)
+
+    async def _wait(self, future: "asyncio.Future[T]", timeout: float | None) -> T:
+        effective = self._timeout if timeout is None else timeout
+        if effective is None:
+            return await future
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), effective)
+        except asyncio.TimeoutError as exc:
+            future.add_done_callback(_discard_outcome)
+            raise QueryTimeoutError(f"Query exceeded {effective:g}s timeout") from exc
@@ -0,0 +1,122 @@
+"""Time-bucket aggregation shared by the status-result repositories.
+
+Buckets are aligned to the Unix epoch, so the same width always yields the same
+boundaries whatever window is asked for. Only buckets holding at least one
+result are returned.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, Iterable, Mapping, Optional
+
+from app.db.models import StatusBucket
+
+# Worst state wins a bucket. States outside this table rank as "unknown".
+STATE_SEVERITY = {"green": 0, "unknown": 1, "yellow": 2, "red": 3}
+
+# Candidate widths for automatic sizing; beyond a day, whole days.
+NICE_BUCKET_SECONDS = (60, 300, 900, 1800, 3600, 3 * 3600, 6 * 3600, 12 * 3600, 86400)
+
+# First number in an observed value: "freshness=6m" -> 6, "utilization=92%" -> 92.
+# Kept to syntax Databricks ``regexp_extract`` (Java regex) reads the same way.
+OBSERVED_NUMBER = r"[-+]?[0-9]+(\.[0-9]+)?"
+_OBSERVED_NUMBER = re.compile(OBSERVED_NUMBER)
+
+
+def state_severity(state: str) -> int:
+    return STATE_SEVERITY.get(state, STATE_SEVERITY["unknown"])
+
+
+def worst_state(states: Iterable[str]) -> str:
+    """The most severe state; ties between unranked states go to the first by name."""
+    return max(sorted(states), key=state_severity)
+
+
+def observed_number(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    match = _OBSERVED_NUMBER.search(value)
+    return float(match.group(0)) if match else None
+
+
+def bucket_seconds_for(start_us: int, end_us: int, points: int) -> int:
+    """The smallest nice width that covers ``[start_us, end_us]`` in about ``points`` buckets."""
+    target = max(1, end_us - start_us) / 1_000_000 / max(1, points)
+    for width in NICE_BUCKET_SECONDS:
+        if width >= target:
+            return width
+    day = NICE_BUCKET_SECONDS[-1]
+    return -(-int(target) // day) * day
+
+
+class BucketAccumulator:
+    """Running aggregates for one bucket, fed per series or per SQL group."""
+
+    __slots__ = (
+        "state_counts",
+        "first_us",
+        "last_us",
+        "observed_count",
+        "observed_min",
+        "observed_max",
+        "observed_sum",
+    )
+
+    def __init__(self) -> None:
+        self.state_counts: dict[str, int] = {}
+        self.first_us: Optional[int] = None
+        self.last_us: Optional[int] = None
+        self.observed_count = 0
+        self.observed_min: Optional[float] = None
+        self.observed_max: Optional[float] = None
+        self.observed_sum = 0.0
+
+    def add_states(self, counts: Mapping[str, int], first_us: int, last_us: int) -> None:
+        for state, count in counts.items():
+            self.state_counts[state] = self.state_counts.get(state, 0) + count
+        if self.first_us is None or first_us < self.first_us:
+            self.first_us = first_us
+        if self.last_us is None or last_us > self.last_us:
+            self.last_us = last_us
+
+    def add_observed(self, count: int, minimum: float, maximum: float, total: float) -> None:
+        if not count:
+            return
+        self.observed_count += count
+        self.observed_sum += total
+        if self.observed_min is None or minimum < self.observed_min:
+            self.observed_min = minimum
+        if self.observed_max is None or maximum > self.observed_max:
+            self.observed_max = maximum
+
+    def bucket(self, start_us: int, width_us: int, format_us: Callable[[int], str]) -> StatusBucket:
+        assert self.first_us is not None and self.last_us is not None
+        return StatusBucket(
+            start_at=format_us(start_us),
+            end_at=format_us(start_us + width_us),
+            count=sum(self.state_counts.values()),
+            worst_state=worst_state(self.state_counts),
+            state_counts=dict(sorted(self.state_counts.items())),
+            first_measured_at=format_us(self.first_us),
+            last_measured_at=format_us(self.last_us),
+            observed_count=self.observed_count,
+            observed_min=self.observed_min,
+            observed_max=self.observed_max,
+            observed_avg=(self.observed_sum / self.observed_count if self.observed_count else None),
+        )
+
+
+def finish(
+    accumulators: Mapping[int, BucketAccumulator],
+    width_us: int,
+    format_us: Callable[[int], str],
+) -> list[StatusBucket]:
+    """Buckets oldest first from ``{bucket index: accumulator}``.
+
+    ``format_us`` renders epoch microseconds, normally ``timeseries.format_epoch_us``.
+    """
+    return [
+        accumulators[index].bucket(index * width_us, width_us, format_us)
+        for index in sorted(accumulators)
+    ]
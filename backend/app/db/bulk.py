@@ -0,0 +1,182 @@
+"""Bulk INSERT/MERGE statement builders for Delta writes."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
+
+from app.db.query import QueryRunner
+
+# Databricks SQL caps named parameter markers per statement; stay below it.
+DEFAULT_MAX_PARAMS = 256
+DEFAULT_MAX_STATEMENT_BYTES = 1024 * 1024
+
+_TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*){0,2}$")
+_COLUMN_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+BulkRow = Mapping[str, Any] | Sequence[Any]
+
+
+@dataclass(frozen=True)
+class BulkStatement:
+    sql: str
+    params: dict[str, Any]
+    row_count: int
+
+
+def _check_table(table: str) -> str:
+    if not _TABLE_NAME.match(table):
+        raise ValueError(f"Invalid table name: {table!r}")
+    return table
+
+
+def _check_columns(columns: Sequence[str]) -> tuple[str, ...]:
+    if not columns:
+        raise ValueError("At least one column is required")
+    for column in columns:
+        if not _COLUMN_NAME.match(column):
+            raise ValueError(f"Invalid column name: {column!r}")
+    if len(set(columns)) != len(columns):
+        raise ValueError("Column names must be unique")
+    return tuple(columns)
+
+
+def _row_values(row: BulkRow, columns: tuple[str, ...]) -> tuple[Any, ...]:
+    if isinstance(row, Mapping):
+        return tuple(row.get(column) for column in columns)
+    values = tuple(row)
+    if len(values) != len(columns):
+        raise ValueError(f"Expected {len(columns)} values per row, got {len(values)}")
+    return values
+
+
+def _value_bytes(value: Any) -> int:
+    return 4 if value is None else len(str(value).encode("utf-8"))
+
+
+def _pack_rows(
+    prefix: str,
+    suffix: str,
+    columns: tuple[str, ...],
+    rows: Iterable[BulkRow],
+    max_params: int,
+    max_statement_bytes: int,
+) -> Iterator[BulkStatement]:
+    """Pack VALUES tuples into as few statements as the budgets allow."""
+    if len(columns) > max_params:
+        raise ValueError("A single row needs more parameters than max_params allows")
+    fixed_bytes = len(prefix.encode("utf-8")) + len(suffix.encode("utf-8"))
+    tuples: list[str] = []
+    params: dict[str, Any] = {}
+    statement_bytes = fixed_bytes
+
+    def flush() -> BulkStatement:
+        return BulkStatement(
+            sql=f"{prefix}{', '.join(tuples)}{suffix}",
+            params=params,
+            row_count=len(tuples),
+        )
+
+    for row in rows:
+        values = _row_values(row, columns)
+        markers = [f"p{len(params) + offset}" for offset in range(len(columns))]
+        placeholder = "(" + ", ".join(f":{marker}" for marker in markers) + ")"
+        row_bytes = len(placeholder) + 2 + sum(_value_bytes(value) for value in values)
+        over_params = len(params) + len(columns) > max_params
+        over_bytes = statement_bytes + row_bytes > max_statement_bytes
+        if tuples and (over_params or over_bytes):
+            yield flush()
+            tuples, params, statement_bytes = [], {}, fixed_bytes
+            markers = [f"p{offset}" for offset in range(len(columns))]
+            placeholder = "(" + ", ".join(f":{marker}" for marker in markers) + ")"
+        tuples.append(placeholder)
+        params.update(zip(markers, values))
+        statement_bytes += row_bytes
+    if tuples:
+        yield flush()
+
+
+def build_insert_statements(
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[BulkRow],
+    max_params: int = DEFAULT_MAX_PARAMS,
+    max_statement_bytes: int = DEFAULT_MAX_STATEMENT_BYTES,
+) -> Iterator[BulkStatement]:
+    """Yield multi-row ``INSERT INTO ... VALUES`` statements within the budgets."""
+    names = _check_columns(columns)
+    prefix = f"INSERT INTO {_check_table(table)} ({', '.join(names)}) VALUES "
+    return _pack_rows(prefix, "", names, rows, max_params, max_statement_bytes)
+
+
+def build_merge_statements(
+    table: str,
+    columns: Sequence[str],
+    key_columns: Sequence[str],
+    rows: Iterable[BulkRow],
+    update_columns: Optional[Sequence[str]] = None,
+    max_params: int = DEFAULT_MAX_PARAMS,
+    max_statement_bytes: int = DEFAULT_MAX_STATEMENT_BYTES,
+) -> Iterator[BulkStatement]:
+    """Yield ``MERGE INTO`` upserts keyed on ``key_columns`` within the budgets.
+
+    Matched rows update ``update_columns`` (default: every non-key column);
+    unmatched rows are inserted.
+    """
+    names = _check_columns(columns)
+    keys = _check_columns(key_columns)
+    if not set(keys) <= set(names):
+        raise ValueError("key_columns must be a subset of columns")
+    updates = _check_columns(
+        update_columns
+        if update_columns is not None
+        else [name for name in names if name not in keys] or list(keys)
+    )
+    target = _check_table(table)
+    on_clause = " AND ".join(f"target.{key} = source.{key}" for key in keys)
+    set_clause = ", ".join(f"target.{name} = source.{name}" for name in updates)
+    insert_values = ", ".join(f"source.{name}" for name in names)
+    prefix = f"MERGE INTO {target} AS target USING (SELECT * FROM VALUES "
+    suffix = (
+        f" AS source({', '.join(names)})) AS source ON {on_clause}"
+        f" WHEN MATCHED THEN UPDATE SET {set_clause}"
+        f" WHEN NOT MATCHED THEN INSERT ({', '.join(names)}) VALUES ({insert_values})"
+    )
+    return _pack_rows(prefix, suffix, names, rows, max_params, max_statement_bytes)
+
+
+def bulk_insert(
+    runner: QueryRunner,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[BulkRow],
+    max_params: int = DEFAULT_MAX_PARAMS,
+    max_statement_bytes: int = DEFAULT_MAX_STATEMENT_BYTES,
+) -> int:
+    """Insert ``rows`` with as few statements as possible; returns rows written."""
+    written = 0
+    for statement in build_insert_statements(table, columns, rows, max_params, max_statement_bytes):
+        runner.execute(statement.sql, statement.params)
+        written += statement.row_count
+    return written
+
+
+def bulk_merge(
+    runner: QueryRunner,
+    table: str,
+    columns: Sequence[str],
+    key_columns: Sequence[str],
+    rows: Iterable[BulkRow],
+    update_columns: Optional[Sequence[str]] = None,
+    max_params: int = DEFAULT_MAX_PARAMS,
+    max_statement_bytes: int = DEFAULT_MAX_STATEMENT_BYTES,
+) -> int:
+    """Upsert ``rows`` with as few MERGE statements as possible; returns rows sent."""
+    written = 0
+    for statement in build_merge_statements(
+        table, columns, key_columns, rows, update_columns, max_params, max_statement_bytes
+    ):
+        runner.execute(statement.sql, statement.params)
+        written += statement.row_count
+    return written
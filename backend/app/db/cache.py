@@ -0,0 +1,263 @@
+"""Result cache decorator for query runners."""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Iterator, Mapping, Optional, Sequence
+
+from app.db.decoders import decode_mappings
+from app.db.query import (
+    DEFAULT_BATCH_SIZE,
+    ColumnData,
+    ModelT,
+    QueryParams,
+    QueryRunner,
+    RowMapping,
+)
+
+# Tables written by a status ingestion run.
+INGESTION_TABLES = ("status_results", "status_ingestion_runs", "status_rollups")
+
+_TABLE_REFERENCE = re.compile(
+    r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE|USING)\s+([`\w][`\w.]*)",
+    re.IGNORECASE,
+)
+_NON_TABLE_WORDS = {"select", "values", "lateral", "unnest"}
+
+
+def referenced_tables(sql: str) -> frozenset[str]:
+    """Best-effort set of unqualified, lower-cased table names used by ``sql``."""
+    tables: set[str] = set()
+    for match in _TABLE_REFERENCE.finditer(sql):
+        name = match.group(1).replace("`", "").rsplit(".", 1)[-1].lower()
+        if name and name not in _NON_TABLE_WORDS:
+            tables.add(name)
+    return frozenset(tables)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    rows: list[RowMapping]
+    tables: frozenset[str]
+    expires_at: float
+    size_bytes: int
+
+
+def freeze_params(value: Any) -> Hashable:
+    """Hashable form of query parameters; raises TypeError for unhashable values."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), freeze_params(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_params(item) for item in value)
+    hash(value)
+    return value
+
+
+def _estimate_size(rows: list[RowMapping]) -> int:
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row.values():
+            size += sys.getsizeof(value)
+    return size
+
+
+class CachingQueryRunner(QueryRunner):
+    """LRU result cache keyed on ``(sql, params)`` with table-tagged invalidation.
+
+    Only ``fetch_all``/``fetch_one`` are cached; streaming and columnar reads are
+    meant for large results and pass straight through. Every entry is tagged
+    with the tables its SQL references, and ``execute()`` drops the entries for
+    any table the statement touches.
+    """
+
+    def __init__(
+        self,
+        runner: QueryRunner,
+        default_ttl_seconds: float = 60.0,
+        table_ttl_seconds: Mapping[str, float] | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._runner = runner
+        self._default_ttl = default_ttl_seconds
+        self._table_ttls = {name.lower(): ttl for name, ttl in (table_ttl_seconds or {}).items()}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        # Bumped on every invalidation so in-flight fetches never repopulate
+        # the cache with rows read before the write that invalidated them.
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def fetch_all(self, sql: str, params: QueryParams | None = None) -> list[RowMapping]:
+        try:
+            key: Hashable = (sql, freeze_params(params))
+        except TypeError:
+            return self._runner.fetch_all(sql, params)
+
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self._hits += 1
+                return [dict(row) for row in entry.rows]
+            self._misses += 1
+            generation = self._generation
+
+        rows = self._runner.fetch_all(sql, params)
+        tables = referenced_tables(sql)
+        cached = [dict(row) for row in rows]
+        with self._lock:
+            if generation == self._generation:
+                self._store(key, cached, tables)
+        return rows
+
+    def fetch_one(self, sql: str, params: QueryParams | None = None) -> RowMapping | None:
+        rows = self.fetch_all(sql, params)
+        return rows[0] if rows else None
+
+    def execute(self, sql: str, params: QueryParams | None = None) -> None:
+        try:
+            self._runner.execute(sql, params)
+        finally:
+            self.invalidate_tables(referenced_tables(sql))
+
+    def execute_many(self, sql: str, params_seq: Sequence[QueryParams]) -> None:
+        try:
+            self._runner.execute_many(sql, params_seq)
+        finally:
+            self.invalidate_tables(referenced_tables(sql))
+
+    def iter_batches(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[RowMapping]]:
+        return self._runner.iter_batches(sql, params, batch_size)
+
+    def iter_rows(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[RowMapping]:
+        return self._runner.iter_rows(sql, params, batch_size)
+
+    def fetch_columns(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ColumnData:
+        return self._runner.fetch_columns(sql, params, batch_size)
+
+    def fetch_arrow(self, sql: str, params: QueryParams | None = None) -> Any:
+        return self._runner.fetch_arrow(sql, params)
+
+    def fetch_models(
+        self, sql: str, model: type[ModelT], params: QueryParams | None = None
+    ) -> list[ModelT]:
+        return decode_mappings(self.fetch_all(sql, params), model)
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        """Drop entries tagged with any of ``tables``; returns how many were dropped."""
+        names = {name.lower() for name in tables}
+        with self._lock:
+            self._generation += 1
+            if not names:
+                return 0
+            stale = [key for key, entry in self._entries.items() if entry.tables & names]
+            for key in stale:
+                self._remove(key)
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def on_ingestion_complete(self, run_id: Optional[str] = None) -> int:
+        """Signal that a status ingestion run landed new results."""
+        return self.invalidate_tables(INGESTION_TABLES)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def _lookup(self, key: Hashable) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Hashable, rows: list[RowMapping], tables: frozenset[str]) -> None:
+        size = _estimate_size(rows)
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(
+            rows=rows,
+            tables=tables,
+            expires_at=self._clock() + self._ttl_for(tables),
+            size_bytes=size,
+        )
+        self._size_bytes += size
+        while len(self._entries) > self._max_entries or self._size_bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def _ttl_for(self, tables: frozenset[str]) -> float:
+        ttls = [self._table_ttls[name] for name in tables if name in self._table_ttls]
+        return min(ttls) if ttls else self._default_ttl
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
@@ -0,0 +1,428 @@
+"""Circuit breaker with last-known-good fallback for warehouse reads."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator, Optional, Sequence, TypeVar
+
+from app.core.logging import APP_LOGGER_NAME
+from app.core.request_context import note_stale_read
+from app.db.cache import freeze_params
+from app.db.decoders import decode_mappings
+from app.db.pool import PoolTimeoutError
+from app.db.query import (
+    DEFAULT_BATCH_SIZE,
+    ColumnData,
+    ModelT,
+    QueryError,
+    QueryParams,
+    QueryRunner,
+    QueryTimeoutError,
+    RowMapping,
+)
+
+T = TypeVar("T")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+PROBE_SQL = "SELECT 1"
+
+logger = logging.getLogger(f"{APP_LOGGER_NAME}.circuit")
+
+# DB-API error classes raised when the connection, not the statement, failed.
+# Matched by name because the driver is an optional dependency.
+_CONNECTIVITY_ERROR_NAMES = frozenset({"OperationalError", "InterfaceError"})
+
+
+class CircuitOpenError(QueryError):
+    """Raised when the breaker is open and no last-known-good result exists."""
+
+
+def is_warehouse_failure(exc: BaseException) -> bool:
+    """True when ``exc`` means the warehouse is unreachable or too slow.
+
+    Everything else (bad SQL, bad parameters, decoding bugs) is the caller's
+    error: it would fail again on a healthy warehouse, so it neither trips the
+    breaker nor is answered with stale rows.
+    """
+    if isinstance(exc, (QueryTimeoutError, CircuitOpenError, PoolTimeoutError, OSError)):
+        return True
+    return any(cls.__name__ in _CONNECTIVITY_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    # Consecutive warehouse failures or slow calls that trip the breaker.
+    failure_threshold: int = 5
+    slow_call_seconds: float = 5.0
+    call_timeout_seconds: Optional[float] = 15.0
+    open_seconds: float = 30.0
+    probe_interval_seconds: float = 5.0
+    max_workers: int = 8
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if self.open_seconds <= 0:
+            raise ValueError("open_seconds must be > 0")
+
+
+@dataclass(frozen=True)
+class BreakerStats:
+    state: str
+    consecutive_failures: int
+    failures: int
+    slow_calls: int
+    timeouts: int
+    rejected: int
+    stale_served: int
+    opened: int
+
+
+@dataclass(frozen=True)
+class ReadResult:
+    rows: list[RowMapping]
+    stale: bool = False
+    age_seconds: float = 0.0
+
+
+class CircuitBreaker:
+    """Process-wide breaker state shared by every guarded runner.
+
+    Closed: calls run with a timeout; warehouse failures (see
+    ``is_warehouse_failure``), timeouts, and calls slower than
+    ``slow_call_seconds`` count toward ``failure_threshold``, a fast success
+    resets the count, and caller errors are re-raised without being counted.
+    Open: calls are rejected until ``open_seconds`` pass, then a single trial
+    call is let through (half-open). A background probe can close
+    the breaker without waiting for user traffic.
+    """
+
+    def __init__(
+        self,
+        config: BreakerConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        self._config = config or BreakerConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._slow_calls = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._stale_served = 0
+        self._opened = 0
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=self._config.max_workers, thread_name_prefix="warehouse-breaker"
+        )
+        self._stop = threading.Event()
+        self._probe_thread: Optional[threading.Thread] = None
+
+    @property
+    def config(self) -> BreakerConfig:
+        return self._config
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run ``func`` under the breaker; raises CircuitOpenError when rejected."""
+        trial = self._admit()
+        start = self._clock()
+        try:
+            result = self._run_with_timeout(func, *args)
+        except QueryTimeoutError:
+            self._record_failure(trial, timeout=True)
+            raise
+        except Exception as exc:
+            if is_warehouse_failure(exc):
+                self._record_failure(trial)
+            else:
+                self._end_trial(trial)
+            raise
+        self._record_success(trial, self._clock() - start)
+        return result
+
+    def allow_passthrough(self) -> None:
+        """Gate calls that cannot be timed out (streams); raises when open."""
+        self._admit(trial_allowed=False)
+
+    def note_stale_served(self) -> None:
+        with self._lock:
+            self._stale_served += 1
+
+    def probe_once(self, probe: Callable[[], Any]) -> bool:
+        """Run ``probe`` if the breaker is not closed; closes it on success."""
+        if self.state == STATE_CLOSED:
+            return False
+        try:
+            self._run_with_timeout(probe)
+        except Exception as exc:
+            logger.info("warehouse probe failed", extra={"error": str(exc)})
+            with self._lock:
+                self._opened_at = self._clock()
+            return False
+        self._close("probe succeeded")
+        return True
+
+    def start_probing(self, probe: Callable[[], Any]) -> None:
+        if self._probe_thread is not None:
+            return
+        self._stop.clear()
+        self._probe_thread = threading.Thread(
+            target=self._probe_loop, args=(probe,), name="warehouse-probe", daemon=True
+        )
+        self._probe_thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._probe_thread is not None:
+            self._probe_thread.join(timeout)
+            self._probe_thread = None
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> BreakerStats:
+        with self._lock:
+            return BreakerStats(
+                state=self._state,
+                consecutive_failures=self._consecutive_failures,
+                failures=self._failures,
+                slow_calls=self._slow_calls,
+                timeouts=self._timeouts,
+                rejected=self._rejected,
+                stale_served=self._stale_served,
+                opened=self._opened,
+            )
+
+    def _admit(self, trial_allowed: bool = True) -> bool:
+        """Return True when this call is the half-open trial."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return False
+            cooled_down = self._clock() - self._opened_at >= self._config.open_seconds
+            if trial_allowed and cooled_down and not self._trial_in_flight:
+                self._state = STATE_HALF_OPEN
+                self._trial_in_flight = True
+                return True
+            self._rejected += 1
+        raise CircuitOpenError("Warehouse circuit is open")
+
+    def _run_with_timeout(self, func: Callable[..., T], *args: Any) -> T:
+        timeout = self._config.call_timeout_seconds
+        if timeout is None:
+            return func(*args)
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, func, *args)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError as exc:
+            # The DB-API call cannot be interrupted; it finishes in the background.
+            raise QueryTimeoutError(f"Warehouse call exceeded {timeout:g}s") from exc
+
+    def _record_success(self, trial: bool, elapsed: float) -> None:
+        slow = elapsed >= self._config.slow_call_seconds
+        if slow:
+            with self._lock:
+                self._slow_calls += 1
+            self._record_failure(trial, counted=False)
+            return
+        if trial or self.state != STATE_CLOSED:
+            self._close("trial call succeeded")
+            return
+        with self._lock:
+            self._consecutive_failures = 0
+
+    def _end_trial(self, trial: bool) -> None:
+        # A caller error says nothing about the warehouse; let another call try.
+        if trial:
+            with self._lock:
+                self._trial_in_flight = False
+
+    def _record_failure(self, trial: bool, timeout: bool = False, counted: bool = True) -> None:
+        with self._lock:
+            if counted:
+                self._failures += 1
+            if timeout:
+                self._timeouts += 1
+            self._consecutive_failures += 1
+            if trial:
+                self._trial_in_flight = False
+            should_open = trial or (
+                self._state == STATE_CLOSED
+                and self._consecutive_failures >= self._config.failure_threshold
+            )
+            if should_open:
+                if self._state == STATE_CLOSED:
+                    self._opened += 1
+                self._state = STATE_OPEN
+                self._opened_at = self._clock()
+        if should_open:
+            logger.warning(
+                "warehouse circuit opened",
+                extra={"consecutive_failures": self._consecutive_failures},
+            )
+
+    def _close(self, reason: str) -> None:
+        with self._lock:
+            was_closed = self._state == STATE_CLOSED
+            self._state = STATE_CLOSED
+            self._trial_in_flight = False
+            self._consecutive_failures = 0
+        if not was_closed:
+            logger.info("warehouse circuit closed", extra={"reason": reason})
+
+    def _probe_loop(self, probe: Callable[[], Any]) -> None:
+        while not self._stop.wait(self._config.probe_interval_seconds):
+            self.probe_once(probe)
+
+
+@dataclass
+class _GoodResult:
+    rows: list[RowMapping]
+    fetched_at: float
+
+
+class LastGoodResults:
+    """Bounded LRU of the most recent successful result per ``(sql, params)``."""
+
+    def __init__(
+        self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _GoodResult] = OrderedDict()
+
+    def put(self, key: Hashable, rows: list[RowMapping]) -> None:
+        with self._lock:
+            self._entries[key] = _GoodResult([dict(row) for row in rows], self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: Hashable) -> Optional[ReadResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            rows = [dict(row) for row in entry.rows]
+            age = self._clock() - entry.fetched_at
+        return ReadResult(rows=rows, stale=True, age_seconds=age)
+
+
+class CircuitBreakerQueryRunner(QueryRunner):
+    """Guard a runner with a shared breaker and serve last-known-good reads.
+
+    ``fetch_result`` returns the fresh rows, or, when the warehouse fails or the
+    breaker is open, the last good rows for the same query marked ``stale``
+    with their age. Every read, ``fetch_all`` and ``fetch_models`` included,
+    also notes a stale answer on the request context, which the middleware
+    reports in the ``X-Data-Stale`` and ``X-Data-Age-Seconds`` headers.
+    Writes and streaming reads are guarded but have no fallback. A timed-out
+    call keeps running on a breaker thread, so the wrapped runner's provider
+    must let it keep and later release its connection; pooled providers and
+    ``PinnedConnectionProvider`` both do.
+    """
+
+    def __init__(
+        self,
+        runner: QueryRunner,
+        breaker: CircuitBreaker,
+        last_good: LastGoodResults | None = None,
+    ) -> None:
+        self._runner = runner
+        self._breaker = breaker
+        self._last_good = last_good or LastGoodResults()
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    def fetch_result(self, sql: str, params: QueryParams | None = None) -> ReadResult:
+        try:
+            key: Optional[Hashable] = (sql, freeze_params(params))
+        except TypeError:
+            key = None
+        try:
+            rows = self._breaker.call(self._runner.fetch_all, sql, params)
+        except Exception as exc:
+            if not is_warehouse_failure(exc):
+                raise
+            fallback = self._last_good.get(key) if key is not None else None
+            if fallback is None:
+                raise
+            self._breaker.note_stale_served()
+            note_stale_read(fallback.age_seconds)
+            return fallback
+        if key is not None:
+            self._last_good.put(key, rows)
+        return ReadResult(rows=rows)
+
+    def fetch_all(self, sql: str, params: QueryParams | None = None) -> list[RowMapping]:
+        return self.fetch_result(sql, params).rows
+
+    def fetch_one(self, sql: str, params: QueryParams | None = None) -> RowMapping | None:
+        rows = self.fetch_all(sql, params)
+        return rows[0] if rows else None
+
+    def execute(self, sql: str, params: QueryParams | None = None) -> None:
+        self._breaker.call(self._runner.execute, sql, params)
+
+    def execute_many(self, sql: str, params_seq: Sequence[QueryParams]) -> None:
+        self._breaker.call(self._runner.execute_many, sql, params_seq)
+
+    def iter_batches(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[RowMapping]]:
+        self._breaker.allow_passthrough()
+        return self._runner.iter_batches(sql, params, batch_size)
+
+    def iter_rows(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[RowMapping]:
+        self._breaker.allow_passthrough()
+        return self._runner.iter_rows(sql, params, batch_size)
+
+    def fetch_columns(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ColumnData:
+        return self._breaker.call(self._runner.fetch_columns, sql, params, batch_size)
+
+    def fetch_arrow(self, sql: str, params: QueryParams | None = None) -> Any:
+        return self._breaker.call(self._runner.fetch_arrow, sql, params)
+
+    def fetch_models(
+        self, sql: str, model: type[ModelT], params: QueryParams | None = None
+    ) -> list[ModelT]:
+        return decode_mappings(self.fetch_all(sql, params), model)
+
+    def probe(self) -> None:
+        self._runner.fetch_all(PROBE_SQL)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Protocol, Sequence
 
+from app.auth.tokens import OAuthTokenProvider
+
 
 class DbApiCursor(Protocol):
     description: Sequence[Sequence[Any]] | None
@@ -12,9 +14,15 @@ class DbApiCursor(Protocol):
     def execute(self, operation: str, parameters: object | None = None) -> Any:
         ...
 
+    def executemany(self, operation: str, seq_of_parameters: Sequence[object]) -> Any:
+        ...
+
     def fetchall(self) -> Sequence[Sequence[Any]]:
         ...
 
+    def fetchmany(self, size: int) -> Sequence[Sequence[Any]]:
+        ...
+
     def fetchone(self) -> Sequence[Any] | None:
         ...
 
@@ -59,9 +67,15 @@ class WarehouseConfig:
     access_token: str | None = None
     catalog: str | None = None
     schema: str | None = None
+    client_id: str | None = None
+    client_secret: str | None = None
+
+    def uses_oauth(self) -> bool:
+        return bool(self.client_id and self.client_secret)
 
     def is_configured(self) -> bool:
-        return bool(self.server_hostname and self.http_path and self.access_token)
+        credentials = self.access_token or self.uses_oauth()
+        return bool(self.server_hostname and self.http_path and credentials)
 
 
 def _load_databricks_sql() -> Any:
@@ -76,13 +90,26 @@ def _load_databricks_sql() -> Any:
 
 
 class DatabricksSqlConnector(ConnectionProvider):
-    """Placeholder connector for Databricks SQL with pooling hooks."""
+    """Connector for Databricks SQL with optional connection pooling.
+
+    With service principal credentials, every connection shares one token
+    provider, so token refreshes never require reopening connections.
+    """
 
     def __init__(
-        self, config: WarehouseConfig, pool: ConnectionPool | None = None
+        self,
+        config: WarehouseConfig,
+        pool: ConnectionPool | None = None,
+        token_provider: OAuthTokenProvider | None = None,
     ) -> None:
         self._config = config
         self._pool = pool
+        if token_provider is None and config.uses_oauth() and config.server_hostname:
+            assert config.client_id is not None and config.client_secret is not None
+            token_provider = OAuthTokenProvider.for_service_principal(
+                config.server_hostname, config.client_id, config.client_secret
+            )
+        self._token_provider = token_provider
 
     def open_pool(self) -> None:
         if self._pool is not None:
@@ -92,6 +119,14 @@ class DatabricksSqlConnector(ConnectionProvider):
         if self._pool is not None:
             self._pool.close()
 
+    @property
+    def pool(self) -> ConnectionPool | None:
+        return self._pool
+
+    @property
+    def token_provider(self) -> OAuthTokenProvider | None:
+        return self._token_provider
+
     def connect(self) -> DbApiConnection:
         if self._pool is not None:
             return self._pool.acquire()
@@ -107,20 +142,22 @@ class DatabricksSqlConnector(ConnectionProvider):
         if not self._config.is_configured():
             raise RuntimeError(
                 "Databricks SQL connection is not configured. "
-                "Set server hostname, http path, and access token."
+                "Set server hostname, http path, and an access token or client credentials."
             )
 
         config = self._config
         assert config.server_hostname is not None
         assert config.http_path is not None
-        assert config.access_token is not None
 
         sql = _load_databricks_sql()
         kwargs: dict[str, Any] = {
             "server_hostname": config.server_hostname,
             "http_path": config.http_path,
-            "access_token": config.access_token,
         }
+        if self._token_provider is not None:
+            kwargs["credentials_provider"] = self._token_provider.credentials_provider
+        else:
+            kwargs["access_token"] = config.access_token
         if config.catalog:
             kwargs["catalog"] = config.catalog
         if config.schema:
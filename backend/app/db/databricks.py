@@ -1,40 +1,484 @@
-"""Databricks-backed repository stubs (read-only)."""
+"""Databricks-backed repository (read-only)."""
 
 from __future__ import annotations
 
-from typing import Optional, Sequence
+import re
+from datetime import datetime
+from typing import Any, Optional, Sequence
 
+from app.db.buckets import OBSERVED_NUMBER, BucketAccumulator, bucket_seconds_for, finish
+from app.db.decoders import decode_mappings, format_timestamp, parse_timestamp
 from app.db.interfaces import PlatformRepository, StatusRepository, WorkItemRepository
-from app.db.models import Platform, StatusCheck, StatusMessage, StatusResult, WorkItem
+from app.db.models import (
+    Platform,
+    SlaReport,
+    StatusBucket,
+    StatusCheck,
+    StatusMessage,
+    StatusResult,
+    WorkItem,
+)
+from app.db.queries import (
+    BucketSeries,
+    InvalidCursorError,
+    Page,
+    PlatformQuery,
+    SlaQuery,
+    StatusBucketQuery,
+    StatusCheckQuery,
+    StatusMessageQuery,
+    StatusResultQuery,
+    WorkItemQuery,
+    decode_cursor,
+    encode_cursor,
+)
+from app.db.query import ModelT, QueryRunner
+from app.db.sla import (
+    DAY_US,
+    SlaDayCache,
+    StatePoints,
+    sla_checks,
+    sla_reports,
+    stale_after_us,
+)
+from app.db.timeseries import StringTable, format_epoch_us, to_epoch_us
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_RESULT_COLUMNS = (
+    "id, check_id, platform_id, state, measured_at, created_at, "
+    "observed_value, message, ingestion_run_id"
+)
+_RESULT_ORDER = "measured_at DESC, created_at DESC, id DESC"
+_RESULT_KEY = ("measured_at", "created_at", "id")
+_CREATED_ORDER = ("created_at", "id")
+_TOTAL_COLUMN = "total_count"
+
+
+def _check_identifier(value: str) -> str:
+    if not _IDENTIFIER.match(value):
+        raise ValueError(f"Invalid catalog or schema name: {value!r}")
+    return value
 
 
 class DatabricksRepository(PlatformRepository, StatusRepository, WorkItemRepository):
+    """Read status data from Unity Catalog tables through a ``QueryRunner``.
+
+    Filters, ordering and pagination are pushed into SQL so only the requested
+    page crosses the wire. Writes are not supported yet; work items have no
+    table in the warehouse schema.
+    """
+
+    def __init__(
+        self,
+        runner: QueryRunner,
+        catalog: Optional[str] = None,
+        schema: Optional[str] = None,
+    ) -> None:
+        self._runner = runner
+        parts = [_check_identifier(part) for part in (catalog, schema) if part]
+        if catalog and not schema:
+            raise ValueError("schema is required when catalog is set")
+        self._prefix = "".join(f"{part}." for part in parts)
+        self._sla_days = SlaDayCache()
+
+    def _table(self, name: str) -> str:
+        return f"{self._prefix}{name}"
+
     def list_platforms(self) -> Sequence[Platform]:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        return self._runner.fetch_models(
+            f"SELECT * FROM {self._table('platforms')} "
+            "WHERE NOT is_deleted ORDER BY created_at DESC, id DESC",
+            Platform,
+        )
 
     def get_platform(self, platform_id: str) -> Optional[Platform]:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        rows = self._runner.fetch_models(
+            f"SELECT * FROM {self._table('platforms')} "
+            "WHERE id = :platform_id AND NOT is_deleted LIMIT 1",
+            Platform,
+            {"platform_id": platform_id},
+        )
+        return rows[0] if rows else None
+
+    def query_platforms(self, query: PlatformQuery) -> Page[Platform]:
+        return self._query_page(
+            Platform, self._table("platforms"), "*", ["NOT is_deleted"], {}, _CREATED_ORDER, query
+        )
 
     def create_platform(self, platform: Platform) -> Platform:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        raise NotImplementedError("Databricks adapter is read-only")
 
     def list_status_checks(self, platform_id: Optional[str] = None) -> Sequence[StatusCheck]:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        # Soft-deleted checks are returned; the model carries ``is_deleted``.
+        sql = f"SELECT * FROM {self._table('status_checks')}"
+        params: dict[str, Any] = {}
+        if platform_id:
+            sql += " WHERE platform_id = :platform_id"
+            params["platform_id"] = platform_id
+        sql += " ORDER BY created_at DESC, id DESC"
+        return self._runner.fetch_models(sql, StatusCheck, params or None)
 
     def get_status_check(self, check_id: str) -> Optional[StatusCheck]:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        rows = self._runner.fetch_models(
+            f"SELECT * FROM {self._table('status_checks')} WHERE id = :check_id LIMIT 1",
+            StatusCheck,
+            {"check_id": check_id},
+        )
+        return rows[0] if rows else None
+
+    def query_status_checks(self, query: StatusCheckQuery) -> Page[StatusCheck]:
+        clauses: list[str] = []
+        params: dict[str, Any] = {}
+        if query.platform_id:
+            clauses.append("platform_id = :platform_id")
+            params["platform_id"] = query.platform_id
+        return self._query_page(
+            StatusCheck, self._table("status_checks"), "*", clauses, params, _CREATED_ORDER, query
+        )
 
     def create_status_check(self, status_check: StatusCheck) -> StatusCheck:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        raise NotImplementedError("Databricks adapter is read-only")
 
     def update_status_check(self, status_check: StatusCheck) -> StatusCheck:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        raise NotImplementedError("Databricks adapter is read-only")
 
     def list_status_results(self) -> Sequence[StatusResult]:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        """Full history; prefer ``query_status_results`` for anything user-facing."""
+        return self._runner.fetch_models(
+            f"SELECT {_RESULT_COLUMNS} FROM {self._table('status_results')} "
+            f"ORDER BY {_RESULT_ORDER}",
+            StatusResult,
+        )
+
+    def query_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        """One page of results filtered, ordered and paginated in the warehouse."""
+        clauses, params = _result_filters(query)
+        return self._query_page(
+            StatusResult,
+            self._table("status_results"),
+            _RESULT_COLUMNS,
+            clauses,
+            params,
+            _RESULT_KEY,
+            query,
+        )
+
+    def query_latest_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        """The newest result per check, ranked with ``ROW_NUMBER`` in the warehouse.
+
+        Filters apply before ranking, so a time window or platform yields each
+        check's newest result within it. Ties break on ``(created_at, id)``.
+        """
+        clauses, params = _result_filters(query)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        ranked = (
+            f"(SELECT {_RESULT_COLUMNS}, ROW_NUMBER() OVER "
+            f"(PARTITION BY check_id ORDER BY {_RESULT_ORDER}) AS check_rank "
+            f"FROM {self._table('status_results')}{where}) AS ranked"
+        )
+        return self._query_page(
+            StatusResult, ranked, _RESULT_COLUMNS, ["check_rank = 1"], params, _RESULT_KEY, query
+        )
+
+    def query_status_result_extent(
+        self, query: StatusResultQuery
+    ) -> Optional[tuple[datetime, datetime]]:
+        """First and last ``measured_at`` of the filtered results, read in one aggregate."""
+        return self._result_extent(query)
+
+    def _result_extent(
+        self, query: StatusResultQuery | StatusBucketQuery
+    ) -> Optional[tuple[datetime, datetime]]:
+        clauses, params = _result_filters(query)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        extent = self._runner.fetch_one(
+            f"SELECT MIN(measured_at) AS first_at, MAX(measured_at) AS last_at "
+            f"FROM {self._table('status_results')}{where}",
+            params or None,
+        )
+        if not extent or extent["first_at"] is None:
+            return None
+        return _to_datetime(extent["first_at"]), _to_datetime(extent["last_at"])
+
+    def query_status_buckets(self, query: StatusBucketQuery) -> BucketSeries[StatusBucket]:
+        """Per-bucket aggregates, grouped by ``(bucket, state)`` in the warehouse.
+
+        Only one row per bucket and state crosses the wire; they are folded
+        into buckets here. Without an explicit width or a bounded window, the
+        data's extent is read first to size the buckets.
+        """
+        clauses, params = _result_filters(query)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        table = self._table("status_results")
+        width = query.bucket_seconds
+        if width is None:
+            first, last = query.start_at, query.end_at
+            if first is None or last is None:
+                extent = self._result_extent(query)
+                if extent is None:
+                    return BucketSeries(bucket_seconds_for(0, 0, query.points))
+                first = first or extent[0]
+                last = last or extent[1]
+            width = bucket_seconds_for(to_epoch_us(first), to_epoch_us(last), query.points)
+        width_us = width * 1_000_000
+
+        # unix_micros / regexp_extract are Databricks built-ins; the embedded
+        # warehouse registers equivalents.
+        points = (
+            "SELECT measured_at, state, CAST(NULLIF(regexp_extract(observed_value, "
+            f":number_pattern, 0), '') AS DOUBLE) AS observed FROM {table}{where}"
+        )
+        rows = self._runner.fetch_all(
+            "SELECT CAST(unix_micros(measured_at) / :bucket_us AS BIGINT) AS bucket, state, "
+            "COUNT(*) AS n, MIN(measured_at) AS first_at, MAX(measured_at) AS last_at, "
+            "COUNT(observed) AS observed_n, MIN(observed) AS observed_min, "
+            "MAX(observed) AS observed_max, SUM(observed) AS observed_sum "
+            f"FROM ({points}) AS points GROUP BY 1, 2",
+            {**params, "bucket_us": width_us, "number_pattern": OBSERVED_NUMBER},
+        )
+        accumulators: dict[int, BucketAccumulator] = {}
+        for row in rows:
+            bucket = accumulators.setdefault(int(row["bucket"]), BucketAccumulator())
+            bucket.add_states(
+                {row["state"]: int(row["n"])},
+                to_epoch_us(_to_datetime(row["first_at"])),
+                to_epoch_us(_to_datetime(row["last_at"])),
+            )
+            if row["observed_n"]:
+                bucket.add_observed(
+                    int(row["observed_n"]),
+                    float(row["observed_min"]),
+                    float(row["observed_max"]),
+                    float(row["observed_sum"]),
+                )
+        return BucketSeries(width, finish(accumulators, width_us, format_epoch_us))
+
+    def query_sla(self, query: SlaQuery) -> Sequence[SlaReport]:
+        """SLA reports computed from per-check state streams read from the warehouse.
+
+        A grouped count of results per check and day fingerprints the cached
+        days. Raw ``(measured_at, state)`` rows are fetched only when some part
+        of the window is not cached, in one query for every check in scope.
+        """
+        checks = sla_checks(self.list_status_checks(query.platform_id), query.check_id)
+        if not checks:
+            return []
+        start_us, end_us = to_epoch_us(query.start_at), to_epoch_us(query.end_at)
+        clauses = ["measured_at >= :from_at", "measured_at < :end_at"]
+        # Results up to the longest staleness limit before the window carry in;
+        # starting on a day boundary keeps every per-day count below complete.
+        from_us = (start_us - max(map(stale_after_us, checks))) // DAY_US * DAY_US
+        params: dict[str, Any] = {
+            "from_at": format_epoch_us(from_us),
+            "end_at": format_epoch_us(end_us),
+        }
+        if query.check_id:
+            clauses.append("check_id = :check_id")
+            params["check_id"] = query.check_id
+        elif query.platform_id:
+            clauses.append("platform_id = :platform_id")
+            params["platform_id"] = query.platform_id
+        source = f"{self._table('status_results')} WHERE {' AND '.join(clauses)}"
+
+        day_counts: dict[tuple[str, int], int] = {}
+        for row in self._runner.fetch_all(
+            "SELECT check_id, CAST(unix_micros(measured_at) / :day_us AS BIGINT) AS day, "
+            f"COUNT(*) AS n FROM {source} GROUP BY 1, 2",
+            {**params, "day_us": DAY_US},
+        ):
+            day_counts[(row["check_id"], int(row["day"]))] = int(row["n"])
+
+        def fingerprint(check_id: str, start_us: int, end_us: int) -> int:
+            # Whole days covering the range: a superset, which only grows too.
+            days = range(start_us // DAY_US, -(-end_us // DAY_US))
+            return sum(day_counts.get((check_id, day), 0) for day in days)
+
+        points = _StatePointsLoader(
+            self._runner,
+            f"SELECT check_id, measured_at, state FROM {source} "
+            "ORDER BY check_id, measured_at, created_at, id",
+            params,
+        )
+        return sla_reports(
+            checks, start_us, end_us, points, fingerprint, self._sla_days, format_epoch_us
+        )
 
     def list_status_messages(self) -> Sequence[StatusMessage]:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        return self._runner.fetch_models(
+            f"SELECT * FROM {self._table('status_messages')} "
+            "WHERE NOT is_deleted ORDER BY created_at DESC, id DESC",
+            StatusMessage,
+        )
 
     def list_work_items(self, state: Optional[str] = None) -> Sequence[WorkItem]:
-        raise NotImplementedError("Databricks adapter not implemented yet")
+        raise NotImplementedError("Work items are not stored in the warehouse")
+
+    def query_work_items(self, query: WorkItemQuery) -> Page[WorkItem]:
+        raise NotImplementedError("Work items are not stored in the warehouse")
+
+    def query_status_messages(self, query: StatusMessageQuery) -> Page[StatusMessage]:
+        clauses = ["NOT is_deleted"]
+        params: dict[str, Any] = {}
+        if query.platform_id:
+            clauses.append("platform_id = :platform_id")
+            params["platform_id"] = query.platform_id
+        if query.state:
+            clauses.append("state = :state")
+            params["state"] = query.state
+        return self._query_page(
+            StatusMessage,
+            self._table("status_messages"),
+            "*",
+            clauses,
+            params,
+            _CREATED_ORDER,
+            query,
+        )
+
+    def _query_page(
+        self,
+        model: type[ModelT],
+        source: str,
+        columns: str,
+        clauses: list[str],
+        params: dict[str, Any],
+        order_columns: tuple[str, ...],
+        query: PlatformQuery | StatusCheckQuery | StatusMessageQuery | StatusResultQuery,
+    ) -> Page[ModelT]:
+        """Run a keyset/offset page query.
+
+        With ``include_total`` the filtered rows are counted by a window
+        function in the same statement, so a page and its total cost a single
+        round trip. One extra row is requested to tell whether a next page
+        exists.
+        """
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        direction = "DESC" if query.descending else "ASC"
+        order_by = ", ".join(f"{column} {direction}" for column in order_columns)
+
+        filter_params = dict(params)
+        cursor_sql = ""
+        if query.cursor:
+            values = _cursor_values(query.cursor, order_columns)
+            cursor_sql = _keyset_predicate(order_columns, "<" if query.descending else ">")
+            params.update({f"cursor_{index}": value for index, value in enumerate(values)})
+
+        if query.include_total:
+            inner = f"SELECT {columns}, COUNT(*) OVER () AS {_TOTAL_COLUMN} FROM {source}{where}"
+            sql = f"SELECT * FROM ({inner}) AS filtered"
+            if cursor_sql:
+                sql += f" WHERE {cursor_sql}"
+        else:
+            conditions = clauses + [cursor_sql] if cursor_sql else clauses
+            sql = f"SELECT {columns} FROM {source}"
+            if conditions:
+                sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" ORDER BY {order_by}"
+
+        offset = query.offset
+        if query.limit is not None:
+            sql += " LIMIT :limit OFFSET :offset"
+            params.update({"limit": query.limit + 1, "offset": offset})
+            offset = 0
+        rows = self._runner.fetch_all(sql, params or None)[offset:]
+
+        has_more = query.limit is not None and len(rows) > query.limit
+        if has_more:
+            rows = rows[: query.limit]
+        # Decoders ignore the extra ``total_count`` column.
+        items = decode_mappings(rows, model)
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(
+                tuple(str(getattr(items[-1], column)) for column in order_columns)
+            )
+        if not query.include_total:
+            return Page(items, None, next_cursor)
+        if rows:
+            return Page(items, int(rows[0][_TOTAL_COLUMN]), next_cursor)
+        if not query.offset and not query.cursor:
+            return Page(items, 0, None)
+        # Past the last page: the window count has no row to ride on.
+        count = self._runner.fetch_one(
+            f"SELECT COUNT(*) AS n FROM {source}{where}", filter_params or None
+        )
+        return Page(items, int(count["n"]) if count else 0, None)
+
+
+class _StatePointsLoader:
+    """Fetches every check's ``(measured_at, state)`` rows on first use."""
+
+    def __init__(self, runner: QueryRunner, sql: str, params: dict[str, Any]) -> None:
+        self._runner = runner
+        self._sql = sql
+        self._params = params
+        self._states = StringTable()
+        self._points: Optional[dict[str, tuple[list[int], list[int]]]] = None
+
+    def __call__(self, check_id: str, start_us: int, end_us: int) -> StatePoints:
+        if self._points is None:
+            self._points = {}
+            for row in self._runner.fetch_all(self._sql, self._params):
+                measured, states = self._points.setdefault(row["check_id"], ([], []))
+                measured.append(to_epoch_us(_to_datetime(row["measured_at"])))
+                states.append(self._states.code(row["state"]))
+        measured, states = self._points.get(check_id, ([], []))
+        return measured, states, self._states.values()
+
+
+def _to_datetime(value: Any) -> datetime:
+    """Warehouse timestamps arrive as ``datetime``; the embedded stand-in returns text."""
+    return value if isinstance(value, datetime) else parse_timestamp(value)
+
+
+def _result_filters(
+    query: StatusResultQuery | StatusBucketQuery,
+) -> tuple[list[str], dict[str, Any]]:
+    clauses: list[str] = []
+    params: dict[str, Any] = {}
+    if query.platform_id:
+        clauses.append("platform_id = :platform_id")
+        params["platform_id"] = query.platform_id
+    if query.check_id:
+        clauses.append("check_id = :check_id")
+        params["check_id"] = query.check_id
+    if query.start_at:
+        clauses.append("measured_at >= :start_at")
+        params["start_at"] = format_timestamp(query.start_at)
+    if query.end_at:
+        clauses.append("measured_at <= :end_at")
+        params["end_at"] = format_timestamp(query.end_at)
+    return clauses, params
+
+
+def _cursor_values(cursor: str, order_columns: tuple[str, ...]) -> list[str]:
+    """Decode a cursor into bind values; timestamp columns are normalized."""
+    parts = decode_cursor(cursor, len(order_columns))
+    values: list[str] = []
+    for column, part in zip(order_columns, parts):
+        if column.endswith("_at"):
+            try:
+                part = format_timestamp(parse_timestamp(part))
+            except ValueError as exc:
+                raise InvalidCursorError("Malformed cursor") from exc
+        values.append(part)
+    return values
+
+
+def _keyset_predicate(columns: tuple[str, ...], op: str) -> str:
+    """``(a, b, c) < (:cursor_0, ...)`` for engines without row-value comparisons.
+
+    The expansion alone is an OR the planner cannot seek on, so it is led by
+    the redundant range ``a <= :cursor_0``: SQL engines turn that into an index
+    range (Delta into file skipping) and start reading at the cursor.
+    """
+    return f"{columns[0]} {op}= :cursor_0 AND {_keyset_expansion(columns, op)}"
+
+
+def _keyset_expansion(columns: tuple[str, ...], op: str, index: int = 0) -> str:
+    column, marker = columns[index], f":cursor_{index}"
+    if index == len(columns) - 1:
+        return f"{column} {op} {marker}"
+    rest = _keyset_expansion(columns, op, index + 1)
+    return f"({column} {op} {marker} OR ({column} = {marker} AND {rest}))"
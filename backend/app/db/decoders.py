@@ -0,0 +1,207 @@
+"""Compiled row decoders from cursor rows straight into model dataclasses."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+import typing
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Mapping, Sequence, TypeVar, cast
+
+from app.db.models import (
+    Platform,
+    StatusCheck,
+    StatusIngestionRun,
+    StatusMessage,
+    StatusResult,
+    WorkItem,
+)
+from app.db.query import QueryError, RowMapping
+
+T = TypeVar("T")
+
+RowDecoder = Callable[[Sequence[Any]], T]
+
+# Model field -> warehouse column where the names differ.
+FIELD_ALIASES: dict[type, dict[str, str]] = {
+    Platform: {"owner": "owner_group"},
+}
+
+# Low-cardinality string fields, interned on decode so every row shares one
+# object per distinct value (``platform-001``, ``green``) instead of a copy each.
+INTERNED_FIELDS: dict[type, frozenset[str]] = {
+    Platform: frozenset({"owner", "state", "created_by", "updated_by"}),
+    StatusCheck: frozenset(
+        {"platform_id", "check_type", "owner_group", "state", "created_by", "updated_by"}
+    ),
+    StatusResult: frozenset({"check_id", "platform_id", "state", "ingestion_run_id"}),
+    StatusIngestionRun: frozenset({"platform_id", "source", "state"}),
+    StatusMessage: frozenset({"platform_id", "severity", "state"}),
+    WorkItem: frozenset({"platform_id", "state", "priority", "requester"}),
+}
+
+_TRUE_STRINGS = frozenset({"true", "t", "1", "yes", "y"})
+_FALSE_STRINGS = frozenset({"false", "f", "0", "no", "n"})
+
+
+def format_timestamp(value: datetime) -> str:
+    """Render a datetime in the ISO ``...Z`` form used by the API models.
+
+    Naive datetimes are treated as UTC (the warehouse session timezone).
+    """
+    # isoformat() omits the fraction when microsecond == 0, like the fixtures.
+    text = value.isoformat()
+    if value.tzinfo is None:
+        return text + "Z"
+    if text.endswith("+00:00"):
+        return text[:-6] + "Z"
+    return value.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp (``Z`` or offset); naive values are UTC."""
+    text = f"{value[:-1]}+00:00" if value.endswith("Z") else value
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, datetime):
+        return format_timestamp(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise QueryError(f"Cannot decode {value!r} as a boolean")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise QueryError(f"Cannot decode {value!r} as an integer")
+    try:
+        return int(value)
+    except (TypeError, ValueError) as exc:
+        raise QueryError(f"Cannot decode {value!r} as an integer") from exc
+
+
+_COERCERS: dict[type, Callable[[Any], Any]] = {str: _to_str, bool: _to_bool, int: _to_int}
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    args = typing.get_args(annotation)
+    if type(None) in args:
+        remaining = [arg for arg in args if arg is not type(None)]
+        return (remaining[0] if len(remaining) == 1 else Any), True
+    return annotation, False
+
+
+def _null_error(model_name: str, field_name: str) -> Callable[[], Any]:
+    def raise_null() -> Any:
+        raise QueryError(f"Column for {model_name}.{field_name} is NULL but the field is required")
+
+    return raise_null
+
+
+def compile_decoder(columns: tuple[str, ...], model: type[T]) -> RowDecoder[T]:
+    """Build (once per column layout and model) a function ``row tuple -> model``.
+
+    The generated function indexes the row positionally and coerces values in
+    the same expression: timestamps become ISO ``Z`` strings, booleans and
+    integers are normalized, and ``INTERNED_FIELDS`` are interned. Extra
+    columns are ignored; a missing column for a field without a default, or a
+    NULL in a non-optional field, raises ``QueryError`` so schema drift fails
+    loudly instead of producing bad rows.
+    """
+    # lru_cache wants Hashable arguments, and mypy does not count classes as such.
+    return _compile_decoder(columns, cast(Hashable, model))
+
+
+@lru_cache(maxsize=256)
+def _compile_decoder(columns: tuple[str, ...], model: type[Any]) -> RowDecoder[Any]:
+    if not dataclasses.is_dataclass(model):
+        raise TypeError(f"{model!r} is not a dataclass")
+    hints = typing.get_type_hints(model)
+    aliases = FIELD_ALIASES.get(model, {})
+    interned = INTERNED_FIELDS.get(model, frozenset())
+    positions = {name.lower(): index for index, name in enumerate(columns)}
+    namespace: dict[str, Any] = {"_model": model, "_intern": sys.intern}
+    arguments: list[str] = []
+    missing: list[str] = []
+
+    for field in dataclasses.fields(model):
+        column = aliases.get(field.name, field.name).lower()
+        index = positions.get(column)
+        has_default = (
+            field.default is not dataclasses.MISSING
+            or field.default_factory is not dataclasses.MISSING
+        )
+        if index is None:
+            if not has_default:
+                missing.append(field.name)
+            continue
+
+        annotation, optional = _unwrap_optional(hints[field.name])
+        value = f"row[{index}]"
+        coercer = _COERCERS.get(annotation)
+        if coercer is None:
+            expression = value
+        else:
+            namespace[f"_c{index}"] = coercer
+            # Skip the call when the driver already returned the right type.
+            exact = f"{value}.__class__ is _t{index}"
+            namespace[f"_t{index}"] = annotation
+            expression = f"({value} if {exact} else _c{index}({value}))"
+        if annotation is str and field.name in interned:
+            expression = f"_intern({expression})"
+        if not optional:
+            namespace[f"_n{index}"] = _null_error(model.__name__, field.name)
+            expression = f"(_n{index}() if {value} is None else {expression})"
+        elif coercer is not None:
+            expression = f"(None if {value} is None else {expression})"
+        arguments.append(f"{field.name}={expression}")
+
+    if missing:
+        raise QueryError(
+            f"Query result is missing columns for {model.__name__}: {', '.join(missing)}"
+        )
+
+    source = "def decode(row):\n    return _model(" + ", ".join(arguments) + ")\n"
+    exec(compile(source, f"<decoder {model.__name__}>", "exec"), namespace)
+    return namespace["decode"]
+
+
+def decode_rows(columns: Sequence[str], rows: Sequence[Sequence[Any]], model: type[T]) -> list[T]:
+    decoder = compile_decoder(tuple(columns), model)
+    return [decoder(row) for row in rows]
+
+
+def decode_mappings(rows: Sequence[RowMapping | Mapping[str, Any]], model: type[T]) -> list[T]:
+    """Decode dict rows (mock, cached, or fallback results) with the same decoders."""
+    decoded: list[T] = []
+    decoder: RowDecoder[T] | None = None
+    layout: tuple[str, ...] | None = None
+    for row in rows:
+        keys = tuple(row.keys())
+        if keys != layout:
+            layout = keys
+            decoder = compile_decoder(keys, model)
+        assert decoder is not None
+        decoded.append(decoder(tuple(row.values())))
+    return decoded
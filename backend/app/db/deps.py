@@ -2,10 +2,97 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Iterator
+
+from app.core.config import Settings, get_settings
+from app.db.circuit import (
+    BreakerConfig,
+    CircuitBreaker,
+    CircuitBreakerQueryRunner,
+    LastGoodResults,
+)
+from app.db.connection import ConnectionProvider, DatabricksSqlConnector, WarehouseConfig
 from app.db.fixtures import LocalFixtureRepository
+from app.db.instrumentation import QueryInstrumentation
+from app.db.pool import PoolConfig, create_pooled_connector
+from app.db.query import QueryRunner, SqlQueryRunner
+from app.db.unit_of_work import unit_of_work
 
 _LOCAL_REPOSITORY = LocalFixtureRepository()
 
 
 def get_repository() -> LocalFixtureRepository:
     return _LOCAL_REPOSITORY
+
+
+def warehouse_config(settings: Settings) -> WarehouseConfig:
+    return WarehouseConfig(
+        server_hostname=settings.databricks_server_hostname,
+        http_path=settings.databricks_warehouse_http_path,
+        access_token=settings.databricks_token,
+        catalog=settings.databricks_catalog,
+        schema=settings.databricks_schema,
+        client_id=settings.databricks_client_id,
+        client_secret=settings.databricks_client_secret,
+    )
+
+
+def pool_config(settings: Settings) -> PoolConfig:
+    return PoolConfig(
+        min_size=settings.warehouse_pool_min_size,
+        max_size=settings.warehouse_pool_max_size,
+        acquire_timeout_seconds=settings.warehouse_pool_acquire_timeout_seconds,
+    )
+
+
+@lru_cache
+def get_connection_provider() -> DatabricksSqlConnector:
+    settings = get_settings()
+    return create_pooled_connector(warehouse_config(settings), pool_config(settings))
+
+
+@lru_cache
+def get_query_instrumentation() -> QueryInstrumentation:
+    settings = get_settings()
+    return QueryInstrumentation(settings.slow_query_threshold_ms / 1000)
+
+
+@lru_cache
+def get_circuit_breaker() -> CircuitBreaker:
+    settings = get_settings()
+    return CircuitBreaker(
+        BreakerConfig(
+            failure_threshold=settings.warehouse_breaker_failure_threshold,
+            slow_call_seconds=settings.warehouse_breaker_slow_call_seconds,
+            call_timeout_seconds=settings.warehouse_query_timeout_seconds or None,
+            open_seconds=settings.warehouse_breaker_open_seconds,
+        )
+    )
+
+
+@lru_cache
+def get_last_good_results() -> LastGoodResults:
+    return LastGoodResults()
+
+
+def _guarded(runner: QueryRunner) -> CircuitBreakerQueryRunner:
+    """Wrap a runner in the shared breaker and last-known-good results."""
+    return CircuitBreakerQueryRunner(runner, get_circuit_breaker(), get_last_good_results())
+
+
+@lru_cache
+def get_query_runner() -> CircuitBreakerQueryRunner:
+    """Shared read runner: pooled connections, instrumentation, and the breaker."""
+    return _guarded(SqlQueryRunner(get_connection_provider(), get_query_instrumentation()))
+
+
+def get_request_query_runner() -> Iterator[QueryRunner]:
+    """Per-request runner whose queries all share one pooled connection.
+
+    Guarded like ``get_query_runner``, so request queries get the same
+    timeouts and last-known-good fallback.
+    """
+    provider: ConnectionProvider = get_connection_provider()
+    with unit_of_work(provider, get_query_instrumentation()) as runner:
+        yield _guarded(runner)
@@ -0,0 +1,264 @@
+"""Embedded SQLite stand-in for the SQL warehouse (local dev, tests, benchmarks)."""
+
+from __future__ import annotations
+
+import dataclasses
+import re
+import sqlite3
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from app.db.connection import ConnectionProvider, DbApiConnection
+from app.db.decoders import FIELD_ALIASES
+from app.db.mock_data import (
+    DEFAULT_PLATFORMS,
+    DEFAULT_STATUS_CHECKS,
+    DEFAULT_STATUS_MESSAGES,
+    DEFAULT_STATUS_RESULTS,
+)
+from app.db.models import (
+    Platform,
+    StatusCheck,
+    StatusIngestionRun,
+    StatusMessage,
+    StatusResult,
+)
+from app.db.timeseries import parse_epoch_us
+
+SCHEMA_DIR = Path(__file__).resolve().parent / "schemas"
+PORTAL_TABLES = (
+    "platforms",
+    "status_checks",
+    "status_ingestion_runs",
+    "status_results",
+    "status_messages",
+    "role_bindings",
+)
+MODEL_TABLES: dict[type, str] = {
+    Platform: "platforms",
+    StatusCheck: "status_checks",
+    StatusIngestionRun: "status_ingestion_runs",
+    StatusResult: "status_results",
+    StatusMessage: "status_messages",
+}
+
+# Indexes matching the repositories' keyset orderings, so cursor pages seek
+# straight to their first row instead of scanning from the newest one.
+PAGE_INDEXES: dict[str, tuple[tuple[str, ...], ...]] = {
+    "platforms": (("created_at", "id"),),
+    "status_checks": (("created_at", "id"), ("platform_id", "created_at", "id")),
+    "status_messages": (("created_at", "id"),),
+    "status_results": (
+        ("measured_at", "created_at", "id"),
+        ("check_id", "measured_at", "created_at", "id"),
+        ("platform_id", "measured_at", "created_at", "id"),
+    ),
+}
+
+# Values for NOT NULL warehouse columns the app models do not carry.
+_COLUMN_FILLERS: dict[str, Any] = {
+    "domain": "unassigned",
+    "created_by": "system",
+    "updated_by": "system",
+}
+
+_TYPE_MAP = (
+    (re.compile(r"\bARRAY<[^>]+>", re.IGNORECASE), "TEXT"),
+    (re.compile(r"\bSTRING\b", re.IGNORECASE), "TEXT"),
+    (re.compile(r"\bTIMESTAMP\b", re.IGNORECASE), "TEXT"),
+    (re.compile(r"\b(?:INT|BIGINT)\b", re.IGNORECASE), "INTEGER"),
+    (re.compile(r"\bBOOLEAN\b", re.IGNORECASE), "INTEGER"),
+    (re.compile(r"\bDEFAULT\s+FALSE\b", re.IGNORECASE), "DEFAULT 0"),
+    (re.compile(r"\bDEFAULT\s+TRUE\b", re.IGNORECASE), "DEFAULT 1"),
+)
+_QUALIFIER = re.compile(r"<catalog>\.<schema>\.")
+_USING = re.compile(r"\)\s*USING\s+DELTA\s*;?", re.IGNORECASE)
+_LINE_COMMENT = re.compile(r"--[^\n]*")
+
+
+def translate_ddl(ddl: str) -> str:
+    """Translate a Delta ``CREATE TABLE`` from ``schemas/`` into SQLite DDL.
+
+    Timestamps are stored as the ISO ``Z`` text the API uses, which sorts
+    chronologically, so range filters and ``ORDER BY`` behave as on Delta.
+    """
+    sql = _LINE_COMMENT.sub("", ddl)
+    sql = _QUALIFIER.sub("", sql)
+    sql = _USING.sub(")", sql)
+    for pattern, replacement in _TYPE_MAP:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+def _unix_micros(value: Optional[str]) -> Optional[int]:
+    return None if value is None else parse_epoch_us(value)
+
+
+def _regexp_extract(value: Optional[str], pattern: str, group: int) -> Optional[str]:
+    if value is None:
+        return None
+    match = re.search(pattern, value)
+    return match.group(group) if match else ""
+
+
+# Databricks SQL built-ins the repositories use that SQLite lacks.
+_SQL_FUNCTIONS = (
+    ("unix_micros", 1, _unix_micros),
+    ("regexp_extract", 3, _regexp_extract),
+)
+
+
+def _model_row(item: Any, defaults: dict[str, Any]) -> dict[str, Any]:
+    row = dataclasses.asdict(item)
+    for field_name, column in FIELD_ALIASES.get(type(item), {}).items():
+        row[column] = row.pop(field_name)
+    for column, value in defaults.items():
+        row.setdefault(column, value)
+    if "updated_at" not in row and "created_at" in row:
+        row["updated_at"] = row["created_at"]
+    return row
+
+
+def _sqlite_params(parameters: object | None) -> Sequence[Any] | Mapping[str, Any]:
+    if parameters is None:
+        return ()
+    if isinstance(parameters, (Mapping, list, tuple)):
+        return parameters
+    raise TypeError(f"SQL parameters must be a mapping or sequence, not {type(parameters)!r}")
+
+
+class _EmbeddedCursor:
+    """DB-API cursor adapter: sqlite3 rejects ``None`` parameters, Databricks does not."""
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self._cursor = cursor
+        self.description: Sequence[Sequence[Any]] | None = None
+
+    def execute(self, operation: str, parameters: object | None = None) -> Any:
+        self._cursor.execute(operation, _sqlite_params(parameters))
+        self.description = self._cursor.description
+        return self
+
+    def executemany(self, operation: str, seq_of_parameters: Sequence[object]) -> Any:
+        self._cursor.executemany(operation, [_sqlite_params(item) for item in seq_of_parameters])
+        self.description = self._cursor.description
+        return self
+
+    def fetchall(self) -> list[Any]:
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size: int) -> list[Any]:
+        return self._cursor.fetchmany(size)
+
+    def fetchone(self) -> Any:
+        return self._cursor.fetchone()
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class EmbeddedConnection:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def cursor(self) -> _EmbeddedCursor:
+        return _EmbeddedCursor(self._connection.cursor())
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class EmbeddedWarehouse(ConnectionProvider):
+    """DB-API connection provider over an embedded SQLite database.
+
+    The default database is a named, shared-cache in-memory database, so every
+    connection handed out (directly or through ``ThreadSafeConnectionPool``)
+    sees the same tables; an anchor connection keeps it alive until ``close()``.
+    Statements use the same ``:name`` parameter markers as Databricks SQL.
+    """
+
+    def __init__(self, path: Optional[str | Path] = None) -> None:
+        if path is None:
+            self._target = f"file:portal-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._uri = True
+        else:
+            self._target = str(path)
+            self._uri = False
+        self._lock = threading.Lock()
+        self._anchor: Optional[sqlite3.Connection] = self._sqlite_connect()
+
+    def open_connection(self) -> EmbeddedConnection:
+        """Open a new connection; usable as a ``ThreadSafeConnectionPool`` factory."""
+        return EmbeddedConnection(self._sqlite_connect())
+
+    def connect(self) -> DbApiConnection:
+        return self.open_connection()
+
+    def release(self, connection: DbApiConnection) -> None:
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            anchor, self._anchor = self._anchor, None
+        if anchor is not None:
+            anchor.close()
+
+    def create_schema(self, tables: Sequence[str] = PORTAL_TABLES) -> None:
+        with self._admin() as connection:
+            for table in tables:
+                ddl = (SCHEMA_DIR / f"{table}.sql").read_text(encoding="utf-8")
+                connection.execute(translate_ddl(ddl))
+                for columns in PAGE_INDEXES.get(table, ()):
+                    connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table}_{'_'.join(columns)} "
+                        f"ON {table} ({', '.join(columns)})"
+                    )
+
+    def table_columns(self, table: str) -> list[str]:
+        with self._admin() as connection:
+            return [row[1] for row in connection.execute(f"PRAGMA table_info({table})")]
+
+    def load_models(self, items: Iterable[Any], table: Optional[str] = None) -> int:
+        """Insert model instances, filling warehouse-only NOT NULL columns."""
+        items = list(items)
+        if not items:
+            return 0
+        target = table or MODEL_TABLES[type(items[0])]
+        columns = self.table_columns(target)
+        if not columns:
+            raise ValueError(f"Table {target!r} does not exist; call create_schema() first")
+        defaults = {column: value for column, value in _COLUMN_FILLERS.items() if column in columns}
+        rows = [_model_row(item, defaults) for item in items]
+        # Leave columns the model does not carry to their SQL defaults.
+        columns = [column for column in columns if column in rows[0]]
+        placeholders = ", ".join(f":{column}" for column in columns)
+        sql = f"INSERT INTO {target} ({', '.join(columns)}) VALUES ({placeholders})"
+        with self._admin() as connection:
+            connection.execute("BEGIN")
+            connection.executemany(sql, rows)
+            connection.execute("COMMIT")
+        return len(rows)
+
+    def load_fixtures(self) -> None:
+        """Create the schema and load the default local fixtures."""
+        self.create_schema()
+        self.load_models(DEFAULT_PLATFORMS)
+        self.load_models(DEFAULT_STATUS_CHECKS)
+        self.load_models(DEFAULT_STATUS_RESULTS)
+        self.load_models(DEFAULT_STATUS_MESSAGES)
+
+    def _sqlite_connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._target, uri=self._uri, check_same_thread=False, isolation_level=None
+        )
+        for name, arity, function in _SQL_FUNCTIONS:
+            connection.create_function(name, arity, function, deterministic=True)
+        return connection
+
+    def _admin(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._anchor is None:
+                raise RuntimeError("Embedded warehouse is closed")
+            return self._anchor
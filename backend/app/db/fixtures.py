@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional, Sequence
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Collection, Generic, Iterable, Optional, Sequence, TypeVar
 
+from app.db.decoders import parse_timestamp
 from app.db.interfaces import PlatformRepository, StatusRepository, WorkItemRepository
 from app.db.mock_data import (
     DEFAULT_PLATFORMS,
@@ -12,10 +17,377 @@ from app.db.mock_data import (
     DEFAULT_STATUS_RESULTS,
     DEFAULT_WORK_ITEMS,
 )
-from app.db.models import Platform, StatusCheck, StatusMessage, StatusResult, WorkItem
+from app.db.models import (
+    Platform,
+    SlaReport,
+    StatusBucket,
+    StatusCheck,
+    StatusMessage,
+    StatusResult,
+    WorkItem,
+)
+from app.db.queries import (
+    BucketSeries,
+    InvalidCursorError,
+    Page,
+    PlatformQuery,
+    SlaQuery,
+    StatusBucketQuery,
+    StatusCheckQuery,
+    StatusMessageQuery,
+    StatusResultQuery,
+    WorkItemQuery,
+    decode_cursor,
+    encode_cursor,
+)
+from app.db.sla import SlaDayCache, sla_checks, sla_reports
+from app.db.timeseries import TimeSeriesStore, format_epoch_us, from_epoch_us, to_epoch_us
+
+T = TypeVar("T")
+SortKey = tuple[Any, ...]
+# Queries paging by creation time; every one of them carries a cursor.
+CreatedQuery = PlatformQuery | StatusCheckQuery | StatusMessageQuery | WorkItemQuery
+
+
+def _created_key(created_at: str, item_id: str) -> SortKey:
+    return (parse_timestamp(created_at), item_id)
+
+
+def _item_id(item: Any) -> str:
+    return item.id
+
+
+def _item_key(item: Any) -> SortKey:
+    return _created_key(item.created_at, item.id)
+
+
+def _created_cursor(item: Any) -> tuple[str, ...]:
+    return (item.created_at, item.id)
+
+
+def _cursor_key(cursor: str, size: int, key: Callable[..., SortKey]) -> SortKey:
+    parts = decode_cursor(cursor, size)
+    try:
+        return key(*parts)
+    except ValueError as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+
+def _leading(key: SortKey) -> Any:
+    return key[0]
+
+
+def _entry_key(entry: tuple[SortKey, Any]) -> SortKey:
+    return entry[0]
+
+
+# Up to this many changes are bisected in place of re-sorting the index.
+_BISECT_CHANGES = 32
+
+
+class _SortedIndex(Generic[T]):
+    """Items kept in ascending sort-key order, with bisect-based range lookups."""
+
+    def __init__(self) -> None:
+        self.keys: list[SortKey] = []
+        self.items: list[T] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def merged(
+        self, entries: Sequence[tuple[SortKey, T]], removed: Collection[SortKey] = ()
+    ) -> _SortedIndex[T]:
+        """A new index with ``entries`` added and ``removed`` keys dropped.
+
+        ``self`` is untouched. A few changes are bisected into copies of the
+        two lists; larger batches are merged with one sort.
+        """
+        if len(entries) + len(removed) <= _BISECT_CHANGES:
+            index: _SortedIndex[T] = _SortedIndex()
+            index.keys = list(self.keys)
+            index.items = list(self.items)
+            for key in removed:
+                position = bisect_left(index.keys, key)
+                if position < len(index.keys) and index.keys[position] == key:
+                    del index.keys[position]
+                    del index.items[position]
+            for key, item in entries:
+                # Right of equal keys, as the stable sort below would place it.
+                position = bisect_right(index.keys, key)
+                index.keys.insert(position, key)
+                index.items.insert(position, item)
+            return index
+        combined = list(zip(self.keys, self.items))
+        if removed:
+            combined = [entry for entry in combined if entry[0] not in removed]
+        combined.extend(entries)
+        # Timsort merges the existing run with the new one in near-linear time;
+        # it is stable, so existing items stay ahead of new ones on equal keys.
+        combined.sort(key=_entry_key)
+        index = _SortedIndex()
+        index.keys = [entry[0] for entry in combined]
+        index.items = [entry[1] for entry in combined]
+        return index
+
+    def span(self, start: Any = None, end: Any = None) -> tuple[int, int]:
+        """Positions ``[lo, hi)`` whose leading key lies within ``[start, end]``."""
+        lo = 0 if start is None else bisect_left(self.keys, start, key=_leading)
+        hi = len(self.keys) if end is None else bisect_right(self.keys, end, key=_leading)
+        return lo, max(lo, hi)
+
+    def page(
+        self,
+        lo: int,
+        hi: int,
+        cursor: Optional[SortKey],
+        descending: bool,
+        limit: Optional[int],
+        offset: int,
+        include_total: bool,
+        cursor_parts: Callable[[T], tuple[str, ...]],
+    ) -> Page[T]:
+        """Slice ``[lo, hi)`` in either direction; ``total`` ignores the cursor."""
+        total = hi - lo if include_total else None
+        if cursor is not None:
+            if descending:
+                hi = bisect_left(self.keys, cursor, lo, hi)
+            else:
+                lo = bisect_right(self.keys, cursor, lo, hi)
+        if descending:
+            stop = hi - offset
+            start = lo if limit is None else max(lo, stop - limit)
+            items = self.items[start:stop][::-1] if stop > lo else []
+            has_more = start > lo
+        else:
+            start = lo + offset
+            stop = hi if limit is None else min(hi, start + limit)
+            items = self.items[start:stop] if start < hi else []
+            has_more = stop < hi
+        next_cursor = encode_cursor(cursor_parts(items[-1])) if items and has_more else None
+        return Page(items, total, next_cursor)
+
+
+def _changes(current: dict[str, T], items: Iterable[T]) -> list[tuple[Optional[T], T]]:
+    """``(previous, new)`` pairs by id; an id repeated in ``items`` keeps its last value."""
+    latest = {_item_id(item): item for item in items}
+    return [(current.get(item_id), item) for item_id, item in latest.items()]
+
+
+def _reordered(index: _SortedIndex[T], changes: list[tuple[Optional[T], T]]) -> _SortedIndex[T]:
+    removed = {_item_key(previous) for previous, _ in changes if previous is not None}
+    return index.merged([(_item_key(item), item) for _, item in changes], removed)
+
+
+def _regrouped(
+    groups: dict[str, _SortedIndex[T]],
+    changes: list[tuple[Optional[T], T]],
+    group: Callable[[T], str],
+) -> dict[str, _SortedIndex[T]]:
+    """Per-group ordered indexes with ``changes`` applied; untouched groups are shared."""
+    removed: dict[str, set[SortKey]] = {}
+    added: dict[str, list[tuple[SortKey, T]]] = {}
+    for previous, item in changes:
+        if previous is not None:
+            removed.setdefault(group(previous), set()).add(_item_key(previous))
+        added.setdefault(group(item), []).append((_item_key(item), item))
+    regrouped = dict(groups)
+    for name in removed.keys() | added.keys():
+        current = groups.get(name) or _SortedIndex()
+        regrouped[name] = current.merged(added.get(name, []), removed.get(name, ()))
+    return regrouped
+
+
+def _created_page(index: _SortedIndex[T], query: CreatedQuery) -> Page[T]:
+    """One ``(created_at, id)`` page; a cursor bisects straight to its position."""
+    cursor_key = _cursor_key(query.cursor, 2, _created_key) if query.cursor else None
+    return index.page(
+        0,
+        len(index),
+        cursor_key,
+        query.descending,
+        query.limit,
+        query.offset,
+        query.include_total,
+        _created_cursor,
+    )
+
+
+def _platform_of(status_check: StatusCheck) -> str:
+    return status_check.platform_id
+
+
+def _state_of(work_item: WorkItem) -> str:
+    return work_item.state
+
+
+@dataclass(frozen=True)
+class FixtureSnapshot:
+    """An immutable, internally consistent view of every collection.
+
+    Nothing reachable from a published snapshot is mutated; writers build a
+    new snapshot that shares the containers they did not touch. Besides the
+    id maps, each collection keeps ``(created_at, id)``-ordered indexes (whole
+    and per platform or state) so list pages and cursors bisect instead of
+    sorting.
+    """
+
+    platforms: dict[str, Platform] = field(default_factory=dict)
+    platform_order: _SortedIndex[Platform] = field(default_factory=_SortedIndex)
+    status_checks: dict[str, StatusCheck] = field(default_factory=dict)
+    check_order: _SortedIndex[StatusCheck] = field(default_factory=_SortedIndex)
+    checks_by_platform: dict[str, _SortedIndex[StatusCheck]] = field(default_factory=dict)
+    results: TimeSeriesStore = field(default_factory=TimeSeriesStore)
+    messages: _SortedIndex[StatusMessage] = field(default_factory=_SortedIndex)
+    work_items: dict[str, WorkItem] = field(default_factory=dict)
+    work_item_order: _SortedIndex[WorkItem] = field(default_factory=_SortedIndex)
+    work_items_by_state: dict[str, _SortedIndex[WorkItem]] = field(default_factory=dict)
+    # Shared by every snapshot of a repository; entries validate themselves.
+    sla_days: SlaDayCache = field(default_factory=SlaDayCache, compare=False)
+
+    def list_platforms(self) -> Sequence[Platform]:
+        return list(self.platforms.values())
+
+    def get_platform(self, platform_id: str) -> Optional[Platform]:
+        return self.platforms.get(platform_id)
+
+    def query_platforms(self, query: PlatformQuery) -> Page[Platform]:
+        return _created_page(self.platform_order, query)
+
+    def list_status_checks(self, platform_id: Optional[str] = None) -> Sequence[StatusCheck]:
+        if not platform_id:
+            return list(self.status_checks.values())
+        index = self.checks_by_platform.get(platform_id)
+        return list(index.items) if index is not None else []
+
+    def get_status_check(self, check_id: str) -> Optional[StatusCheck]:
+        return self.status_checks.get(check_id)
+
+    def query_status_checks(self, query: StatusCheckQuery) -> Page[StatusCheck]:
+        if not query.platform_id:
+            return _created_page(self.check_order, query)
+        return _created_page(
+            self.checks_by_platform.get(query.platform_id) or _SortedIndex(), query
+        )
+
+    def list_status_results(self) -> Sequence[StatusResult]:
+        """All results, oldest first."""
+        return self.results.results()
+
+    def list_status_messages(self) -> Sequence[StatusMessage]:
+        return list(self.messages.items)
+
+    def query_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        return self.results.query(query)
+
+    def query_latest_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        return self.results.latest(query)
+
+    def query_status_buckets(self, query: StatusBucketQuery) -> BucketSeries[StatusBucket]:
+        return self.results.buckets(query)
+
+    def query_status_result_extent(
+        self, query: StatusResultQuery
+    ) -> Optional[tuple[datetime, datetime]]:
+        extent = self.results.extent(query)
+        return None if extent is None else (from_epoch_us(extent[0]), from_epoch_us(extent[1]))
+
+    def query_sla(self, query: SlaQuery) -> Sequence[SlaReport]:
+        results = self.results
+        return sla_reports(
+            sla_checks(self.list_status_checks(query.platform_id), query.check_id),
+            to_epoch_us(query.start_at),
+            to_epoch_us(query.end_at),
+            lambda check_id, start_us, end_us: results.state_points(check_id),
+            results.count,
+            self.sla_days,
+            format_epoch_us,
+        )
+
+    def query_status_messages(self, query: StatusMessageQuery) -> Page[StatusMessage]:
+        index = self.messages
+        if query.platform_id or query.state:
+            index = _SortedIndex()
+            for key, message in zip(self.messages.keys, self.messages.items):
+                if query.platform_id and message.platform_id != query.platform_id:
+                    continue
+                if query.state and message.state != query.state:
+                    continue
+                index.keys.append(key)
+                index.items.append(message)
+        return _created_page(index, query)
+
+    def list_work_items(self, state: Optional[str] = None) -> Sequence[WorkItem]:
+        if not state:
+            return list(self.work_items.values())
+        index = self.work_items_by_state.get(state)
+        return list(index.items) if index is not None else []
+
+    def query_work_items(self, query: WorkItemQuery) -> Page[WorkItem]:
+        if not query.state:
+            return _created_page(self.work_item_order, query)
+        index = self.work_items_by_state.get(query.state) or _SortedIndex()
+        return _created_page(index, query)
+
+    def with_platform(self, platform: Platform) -> FixtureSnapshot:
+        return self.with_platforms([platform])
+
+    def with_platforms(self, platforms: Iterable[Platform]) -> FixtureSnapshot:
+        changes = _changes(self.platforms, platforms)
+        by_id = dict(self.platforms)
+        by_id.update((platform.id, platform) for _, platform in changes)
+        return replace(
+            self, platforms=by_id, platform_order=_reordered(self.platform_order, changes)
+        )
+
+    def with_status_check(self, status_check: StatusCheck) -> FixtureSnapshot:
+        return self.with_status_checks([status_check])
+
+    def with_status_checks(self, status_checks: Iterable[StatusCheck]) -> FixtureSnapshot:
+        changes = _changes(self.status_checks, status_checks)
+        by_id = dict(self.status_checks)
+        by_id.update((status_check.id, status_check) for _, status_check in changes)
+        return replace(
+            self,
+            status_checks=by_id,
+            check_order=_reordered(self.check_order, changes),
+            checks_by_platform=_regrouped(self.checks_by_platform, changes, _platform_of),
+        )
+
+    def with_status_results(self, results: Iterable[StatusResult]) -> FixtureSnapshot:
+        return replace(self, results=self.results.with_results(results))
+
+    def with_status_messages(self, messages: Iterable[StatusMessage]) -> FixtureSnapshot:
+        entries = [(_item_key(message), message) for message in messages]
+        return replace(self, messages=self.messages.merged(entries))
+
+    def with_work_items(self, work_items: Iterable[WorkItem]) -> FixtureSnapshot:
+        changes = _changes(self.work_items, work_items)
+        by_id = dict(self.work_items)
+        by_id.update((work_item.id, work_item) for _, work_item in changes)
+        return replace(
+            self,
+            work_items=by_id,
+            work_item_order=_reordered(self.work_item_order, changes),
+            work_items_by_state=_regrouped(self.work_items_by_state, changes, _state_of),
+        )
 
 
 class LocalFixtureRepository(PlatformRepository, StatusRepository, WorkItemRepository):
+    """In-memory repository backed by hash and sorted indexes.
+
+    Platforms, checks and work items are keyed by id (dicts keep insertion
+    order for list calls), with ``(created_at, id)``-ordered indexes overall
+    and by platform or state for paged queries.
+    Results live in a columnar ``TimeSeriesStore`` (one sorted series per
+    check), so time-range pages bisect epoch integers.
+
+    All state lives in an immutable ``FixtureSnapshot``. Writers build the next
+    snapshot under a lock and publish it with a single attribute store; readers
+    just load the current one, so GET paths never take a lock. Use
+    ``snapshot()`` for several reads that must see the same state.
+    """
+
     def __init__(
         self,
         platforms: Iterable[Platform] | None = None,
@@ -24,54 +396,90 @@ class LocalFixtureRepository(PlatformRepository, StatusRepository, WorkItemRepos
         status_messages: Iterable[StatusMessage] | None = None,
         work_items: Iterable[WorkItem] | None = None,
     ) -> None:
-        self._platforms = list(platforms or DEFAULT_PLATFORMS)
-        self._status_checks = list(status_checks or DEFAULT_STATUS_CHECKS)
-        self._status_results = list(status_results or DEFAULT_STATUS_RESULTS)
-        self._status_messages = list(status_messages or DEFAULT_STATUS_MESSAGES)
-        self._work_items = list(work_items or DEFAULT_WORK_ITEMS)
+        snapshot = FixtureSnapshot()
+        snapshot = snapshot.with_platforms(platforms or DEFAULT_PLATFORMS)
+        snapshot = snapshot.with_status_checks(status_checks or DEFAULT_STATUS_CHECKS)
+        snapshot = snapshot.with_status_results(status_results or DEFAULT_STATUS_RESULTS)
+        snapshot = snapshot.with_status_messages(status_messages or DEFAULT_STATUS_MESSAGES)
+        snapshot = snapshot.with_work_items(work_items or DEFAULT_WORK_ITEMS)
+        self._snapshot = snapshot
+        self._write_lock = threading.Lock()
+
+    def snapshot(self) -> FixtureSnapshot:
+        return self._snapshot
 
     def list_platforms(self) -> Sequence[Platform]:
-        return list(self._platforms)
+        return self._snapshot.list_platforms()
 
     def get_platform(self, platform_id: str) -> Optional[Platform]:
-        for platform in self._platforms:
-            if platform.id == platform_id:
-                return platform
-        return None
+        return self._snapshot.get_platform(platform_id)
+
+    def query_platforms(self, query: PlatformQuery) -> Page[Platform]:
+        return self._snapshot.query_platforms(query)
 
     def create_platform(self, platform: Platform) -> Platform:
-        self._platforms.append(platform)
+        with self._write_lock:
+            self._snapshot = self._snapshot.with_platform(platform)
         return platform
 
     def list_status_checks(self, platform_id: Optional[str] = None) -> Sequence[StatusCheck]:
-        if not platform_id:
-            return list(self._status_checks)
-        return [item for item in self._status_checks if item.platform_id == platform_id]
+        return self._snapshot.list_status_checks(platform_id)
 
     def get_status_check(self, check_id: str) -> Optional[StatusCheck]:
-        for check in self._status_checks:
-            if check.id == check_id:
-                return check
-        return None
+        return self._snapshot.get_status_check(check_id)
+
+    def query_status_checks(self, query: StatusCheckQuery) -> Page[StatusCheck]:
+        return self._snapshot.query_status_checks(query)
 
     def create_status_check(self, status_check: StatusCheck) -> StatusCheck:
-        self._status_checks.append(status_check)
+        with self._write_lock:
+            self._snapshot = self._snapshot.with_status_check(status_check)
         return status_check
 
     def update_status_check(self, status_check: StatusCheck) -> StatusCheck:
-        for idx, item in enumerate(self._status_checks):
-            if item.id == status_check.id:
-                self._status_checks[idx] = status_check
-                return status_check
-        raise KeyError(f"Status check {status_check.id} not found")
+        with self._write_lock:
+            current = self._snapshot
+            if status_check.id not in current.status_checks:
+                raise KeyError(f"Status check {status_check.id} not found")
+            self._snapshot = current.with_status_check(status_check)
+        return status_check
+
+    def add_status_results(self, results: Iterable[StatusResult]) -> int:
+        """Index new results as one snapshot swap; returns how many were added."""
+        results = list(results)
+        with self._write_lock:
+            self._snapshot = self._snapshot.with_status_results(results)
+        return len(results)
 
     def list_status_results(self) -> Sequence[StatusResult]:
-        return list(self._status_results)
+        """All results, oldest first."""
+        return self._snapshot.list_status_results()
 
     def list_status_messages(self) -> Sequence[StatusMessage]:
-        return list(self._status_messages)
+        return self._snapshot.list_status_messages()
+
+    def query_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        return self._snapshot.query_status_results(query)
+
+    def query_latest_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        return self._snapshot.query_latest_status_results(query)
+
+    def query_status_buckets(self, query: StatusBucketQuery) -> BucketSeries[StatusBucket]:
+        return self._snapshot.query_status_buckets(query)
+
+    def query_status_result_extent(
+        self, query: StatusResultQuery
+    ) -> Optional[tuple[datetime, datetime]]:
+        return self._snapshot.query_status_result_extent(query)
+
+    def query_sla(self, query: SlaQuery) -> Sequence[SlaReport]:
+        return self._snapshot.query_sla(query)
+
+    def query_status_messages(self, query: StatusMessageQuery) -> Page[StatusMessage]:
+        return self._snapshot.query_status_messages(query)
 
     def list_work_items(self, state: Optional[str] = None) -> Sequence[WorkItem]:
-        if not state:
-            return list(self._work_items)
-        return [item for item in self._work_items if item.state == state]
+        return self._snapshot.list_work_items(state)
+
+    def query_work_items(self, query: WorkItemQuery) -> Page[WorkItem]:
+        return self._snapshot.query_work_items(query)
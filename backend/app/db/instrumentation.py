@@ -0,0 +1,206 @@
+"""Per-query timing, slow-query logging, and per-endpoint warehouse aggregates."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Optional, Protocol, Sequence
+
+from app.core.logging import APP_LOGGER_NAME
+from app.core.request_context import current_endpoint, current_request_id
+
+SLOW_QUERY_LOGGER_NAME = f"{APP_LOGGER_NAME}.slow_query"
+OTHER_ENDPOINT = "other"
+_SQL_PREVIEW_CHARS = 500
+
+
+@dataclass(frozen=True)
+class QueryMetrics:
+    operation: str
+    sql: str
+    request_id: Optional[str]
+    endpoint: str
+    acquire_seconds: float
+    execute_seconds: float
+    fetch_seconds: float
+    rows: int
+    approx_bytes: int
+    error: Optional[str] = None
+
+    @property
+    def total_seconds(self) -> float:
+        return self.acquire_seconds + self.execute_seconds + self.fetch_seconds
+
+
+class QueryObserver(Protocol):
+    def on_query(self, metrics: QueryMetrics) -> None: ...
+
+
+def approximate_bytes(rows: Sequence[Sequence[Any]]) -> int:
+    """Rough payload size of DB-API rows: string/bytes lengths, 8 bytes otherwise."""
+    total = 0
+    for row in rows:
+        for value in row:
+            if isinstance(value, (str, bytes, bytearray)):
+                total += len(value)
+            elif value is not None:
+                total += 8
+    return total
+
+
+class QueryTimer:
+    """Split one query's wall time into acquire, execute, and fetch phases."""
+
+    __slots__ = ("operation", "sql", "rows", "approx_bytes", "_start", "_acquired", "_executed")
+
+    def __init__(self, operation: str, sql: str) -> None:
+        self.operation = operation
+        self.sql = sql
+        self.rows = 0
+        self.approx_bytes = 0
+        self._start = perf_counter()
+        self._acquired: Optional[float] = None
+        self._executed: Optional[float] = None
+
+    def acquired(self) -> None:
+        self._acquired = perf_counter()
+
+    def executed(self) -> None:
+        self._executed = perf_counter()
+
+    def add_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        self.rows += len(rows)
+        self.approx_bytes += approximate_bytes(rows)
+
+    def finish(self, error: Optional[BaseException] = None) -> QueryMetrics:
+        end = perf_counter()
+        acquired = self._acquired if self._acquired is not None else end
+        executed = self._executed if self._executed is not None else max(acquired, end)
+        return QueryMetrics(
+            operation=self.operation,
+            sql=self.sql,
+            request_id=current_request_id(),
+            endpoint=current_endpoint(),
+            acquire_seconds=acquired - self._start,
+            execute_seconds=executed - acquired,
+            fetch_seconds=end - executed,
+            rows=self.rows,
+            approx_bytes=self.approx_bytes,
+            error=None if error is None else type(error).__name__,
+        )
+
+
+@dataclass(frozen=True)
+class EndpointQueryStats:
+    endpoint: str
+    queries: int
+    errors: int
+    slow_queries: int
+    rows: int
+    approx_bytes: int
+    acquire_seconds: float
+    execute_seconds: float
+    fetch_seconds: float
+    max_seconds: float
+
+    @property
+    def total_seconds(self) -> float:
+        return self.acquire_seconds + self.execute_seconds + self.fetch_seconds
+
+
+@dataclass
+class _EndpointTotals:
+    queries: int = 0
+    errors: int = 0
+    slow_queries: int = 0
+    rows: int = 0
+    approx_bytes: int = 0
+    acquire_seconds: float = 0.0
+    execute_seconds: float = 0.0
+    fetch_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class QueryInstrumentation(QueryObserver):
+    """Aggregate query metrics per endpoint and log queries over the threshold.
+
+    Endpoints are keyed on the route template, and the number of distinct keys
+    is capped so unexpected paths cannot grow the table without bound.
+    """
+
+    def __init__(self, slow_query_threshold_seconds: float = 1.0, max_endpoints: int = 256) -> None:
+        self._threshold = slow_query_threshold_seconds
+        self._max_endpoints = max_endpoints
+        self._lock = threading.Lock()
+        self._totals: dict[str, _EndpointTotals] = {}
+        self._logger = logging.getLogger(SLOW_QUERY_LOGGER_NAME)
+
+    @property
+    def slow_query_threshold_seconds(self) -> float:
+        return self._threshold
+
+    def on_query(self, metrics: QueryMetrics) -> None:
+        total = metrics.total_seconds
+        slow = self._threshold > 0 and total >= self._threshold
+        with self._lock:
+            key = metrics.endpoint
+            if key not in self._totals and len(self._totals) >= self._max_endpoints:
+                key = OTHER_ENDPOINT
+            totals = self._totals.get(key)
+            if totals is None:
+                totals = self._totals[key] = _EndpointTotals()
+            totals.queries += 1
+            totals.errors += metrics.error is not None
+            totals.slow_queries += slow
+            totals.rows += metrics.rows
+            totals.approx_bytes += metrics.approx_bytes
+            totals.acquire_seconds += metrics.acquire_seconds
+            totals.execute_seconds += metrics.execute_seconds
+            totals.fetch_seconds += metrics.fetch_seconds
+            totals.max_seconds = max(totals.max_seconds, total)
+        if slow:
+            self._log_slow(metrics)
+
+    def snapshot(self) -> list[EndpointQueryStats]:
+        """Per-endpoint totals, most expensive endpoint first."""
+        with self._lock:
+            stats = [
+                EndpointQueryStats(
+                    endpoint=endpoint,
+                    queries=totals.queries,
+                    errors=totals.errors,
+                    slow_queries=totals.slow_queries,
+                    rows=totals.rows,
+                    approx_bytes=totals.approx_bytes,
+                    acquire_seconds=totals.acquire_seconds,
+                    execute_seconds=totals.execute_seconds,
+                    fetch_seconds=totals.fetch_seconds,
+                    max_seconds=totals.max_seconds,
+                )
+                for endpoint, totals in self._totals.items()
+            ]
+        return sorted(stats, key=lambda item: item.total_seconds, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+    def _log_slow(self, metrics: QueryMetrics) -> None:
+        self._logger.warning(
+            "slow query",
+            extra={
+                "operation": metrics.operation,
+                "sql": metrics.sql[:_SQL_PREVIEW_CHARS],
+                "request_id": metrics.request_id,
+                "endpoint": metrics.endpoint,
+                "total_ms": round(metrics.total_seconds * 1000, 2),
+                "acquire_ms": round(metrics.acquire_seconds * 1000, 2),
+                "execute_ms": round(metrics.execute_seconds * 1000, 2),
+                "fetch_ms": round(metrics.fetch_seconds * 1000, 2),
+                "rows": metrics.rows,
+                "approx_bytes": metrics.approx_bytes,
+                "error": metrics.error,
+            },
+        )
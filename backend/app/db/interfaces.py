@@ -2,9 +2,29 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional, Protocol, Sequence
 
-from app.db.models import Platform, StatusCheck, StatusMessage, StatusResult, WorkItem
+from app.db.models import (
+    Platform,
+    SlaReport,
+    StatusBucket,
+    StatusCheck,
+    StatusMessage,
+    StatusResult,
+    WorkItem,
+)
+from app.db.queries import (
+    BucketSeries,
+    Page,
+    PlatformQuery,
+    SlaQuery,
+    StatusBucketQuery,
+    StatusCheckQuery,
+    StatusMessageQuery,
+    StatusResultQuery,
+    WorkItemQuery,
+)
 
 
 class PlatformRepository(Protocol):
@@ -17,6 +37,9 @@ class PlatformRepository(Protocol):
     def create_platform(self, platform: Platform) -> Platform:
         raise NotImplementedError
 
+    def query_platforms(self, query: PlatformQuery) -> Page[Platform]:
+        raise NotImplementedError
+
 
 class StatusRepository(Protocol):
     def list_status_checks(self, platform_id: Optional[str] = None) -> Sequence[StatusCheck]:
@@ -37,7 +60,34 @@ class StatusRepository(Protocol):
     def list_status_messages(self) -> Sequence[StatusMessage]:
         raise NotImplementedError
 
+    def query_status_checks(self, query: StatusCheckQuery) -> Page[StatusCheck]:
+        raise NotImplementedError
+
+    def query_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        raise NotImplementedError
+
+    def query_latest_status_results(self, query: StatusResultQuery) -> Page[StatusResult]:
+        raise NotImplementedError
+
+    def query_status_buckets(self, query: StatusBucketQuery) -> BucketSeries[StatusBucket]:
+        raise NotImplementedError
+
+    def query_status_result_extent(
+        self, query: StatusResultQuery
+    ) -> Optional[tuple[datetime, datetime]]:
+        """First and last ``measured_at`` among the filtered results; paging is ignored."""
+        raise NotImplementedError
+
+    def query_sla(self, query: SlaQuery) -> Sequence[SlaReport]:
+        raise NotImplementedError
+
+    def query_status_messages(self, query: StatusMessageQuery) -> Page[StatusMessage]:
+        raise NotImplementedError
+
 
 class WorkItemRepository(Protocol):
     def list_work_items(self, state: Optional[str] = None) -> Sequence[WorkItem]:
         raise NotImplementedError
+
+    def query_work_items(self, query: WorkItemQuery) -> Page[WorkItem]:
+        raise NotImplementedError
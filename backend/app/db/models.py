@@ -1,12 +1,16 @@
-"""Data models for repository fixtures."""
+"""Data models for repository fixtures.
+
+Models use ``__slots__``: millions of results are held at production scale,
+and a per-instance ``__dict__`` roughly doubles their footprint.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Platform:
     id: str
     name: str
@@ -18,7 +22,7 @@ class Platform:
     updated_by: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusCheck:
     id: str
     platform_id: str
@@ -40,7 +44,7 @@ class StatusCheck:
     deleted_by: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusResult:
     id: str
     check_id: str
@@ -53,7 +57,19 @@ class StatusResult:
     ingestion_run_id: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class StatusIngestionRun:
+    id: str
+    platform_id: Optional[str]
+    source: str
+    state: str
+    started_at: str
+    created_at: str
+    ended_at: Optional[str] = None
+    error_summary: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
 class StatusMessage:
     id: str
     platform_id: Optional[str]
@@ -66,7 +82,44 @@ class StatusMessage:
     end_at: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class StatusBucket:
+    """Aggregates of the status results measured in ``[start_at, end_at)``.
+
+    ``observed_*`` cover results whose ``observed_value`` holds a number.
+    """
+
+    start_at: str
+    end_at: str
+    count: int
+    worst_state: str
+    state_counts: dict[str, int]
+    first_measured_at: str
+    last_measured_at: str
+    observed_count: int = 0
+    observed_min: Optional[float] = None
+    observed_max: Optional[float] = None
+    observed_avg: Optional[float] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SlaReport:
+    """SLA figures for one check over ``[start_at, end_at)``, or, with
+    ``check_id=None``, a platform's ``checks`` combined."""
+
+    platform_id: str
+    check_id: Optional[str]
+    checks: int
+    start_at: str
+    end_at: str
+    uptime: float
+    state_seconds: dict[str, float]
+    breaches: int
+    open_breaches: int
+    mttr_seconds: Optional[float]
+
+
+@dataclass(frozen=True, slots=True)
 class WorkItem:
     id: str
     platform_id: Optional[str]
@@ -75,3 +128,13 @@ class WorkItem:
     priority: str
     created_at: str
     requester: str
+
+
+def to_dict(instance: Any) -> dict[str, Any]:
+    """``dataclasses.asdict`` for the flat models above, without its per-value deepcopy.
+
+    Fields are immutable scalars (the per-state dicts of ``StatusBucket`` and
+    ``SlaReport`` are built fresh and never mutated), so values are shared, not
+    copied; key order and values match ``asdict`` exactly.
+    """
+    return {field.name: getattr(instance, field.name) for field in fields(instance)}
@@ -0,0 +1,339 @@
+"""Thread-safe, bounded connection pool for SQL warehouse connections."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.db.connection import (
+    ConnectionPool,
+    DatabricksSqlConnector,
+    DbApiConnection,
+    WarehouseConfig,
+)
+
+ConnectionFactory = Callable[[], DbApiConnection]
+ConnectionValidator = Callable[[DbApiConnection], bool]
+
+
+class PoolTimeoutError(RuntimeError):
+    """Raised when no connection becomes available before the acquire timeout."""
+
+
+class PoolClosedError(RuntimeError):
+    """Raised when acquiring from a pool that has been closed."""
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    min_size: int = 1
+    max_size: int = 4
+    acquire_timeout_seconds: float = 10.0
+    idle_timeout_seconds: float = 300.0
+    max_lifetime_seconds: float = 1800.0
+    # Each connection's lifetime is shortened by up to this fraction so
+    # connections opened together are recycled gradually, not all at once.
+    lifetime_jitter: float = 0.1
+    validate_on_checkout: bool = True
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError("min_size must be >= 0")
+        if self.max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if self.min_size > self.max_size:
+            raise ValueError("min_size must be <= max_size")
+        if not 0.0 <= self.lifetime_jitter < 1.0:
+            raise ValueError("lifetime_jitter must be in [0, 1)")
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    in_use: int
+    idle: int
+    waiting: int
+    created: int
+    destroyed: int
+    acquired: int
+    timeouts: int
+    validation_failures: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.acquired if self.acquired else 0.0
+
+
+@dataclass
+class _PooledEntry:
+    connection: DbApiConnection
+    created_at: float
+    last_used_at: float
+    max_lifetime: float
+
+
+def ping_connection(connection: DbApiConnection) -> bool:
+    """Return True when a trivial round trip on the connection succeeds."""
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+    except Exception:
+        return False
+    return True
+
+
+class ThreadSafeConnectionPool(ConnectionPool):
+    """Bounded pool with blocking acquire, idle eviction, and lifetime recycling.
+
+    Connections are opened lazily up to ``max_size``; ``open()`` pre-fills
+    ``min_size``. Slow work (connecting, validating, closing) always runs
+    outside the pool lock so one stalled warehouse session never blocks
+    other callers from releasing connections.
+    """
+
+    def __init__(
+        self,
+        factory: ConnectionFactory,
+        config: PoolConfig | None = None,
+        validator: ConnectionValidator = ping_connection,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._factory = factory
+        self._config = config or PoolConfig()
+        self._validator = validator
+        self._clock = clock
+        self._rng = rng
+        self._condition = threading.Condition(threading.Lock())
+        self._idle: deque[_PooledEntry] = deque()
+        self._in_use: dict[int, _PooledEntry] = {}
+        # Slots held by callers that are connecting or validating outside the lock.
+        self._reserved = 0
+        self._closed = False
+        self._waiting = 0
+        self._created = 0
+        self._destroyed = 0
+        self._acquired = 0
+        self._timeouts = 0
+        self._validation_failures = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def config(self) -> PoolConfig:
+        return self._config
+
+    def open(self) -> None:
+        with self._condition:
+            self._closed = False
+        while True:
+            with self._condition:
+                if self._size_locked() >= self._config.min_size:
+                    return
+                self._reserved += 1
+            try:
+                entry = self._create_entry()
+            finally:
+                with self._condition:
+                    self._reserved -= 1
+            with self._condition:
+                self._idle.append(entry)
+                self._condition.notify()
+
+    def close(self) -> None:
+        """Close idle connections; in-use connections are closed on release."""
+        with self._condition:
+            self._closed = True
+            entries = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+        for entry in entries:
+            self._destroy(entry)
+
+    def acquire(self) -> DbApiConnection:
+        start = self._clock()
+        entry = self._reserve(start + self._config.acquire_timeout_seconds)
+        try:
+            if entry is None:
+                entry = self._create_entry()
+            elif self._config.validate_on_checkout and not self._validator(entry.connection):
+                with self._condition:
+                    self._validation_failures += 1
+                self._destroy(entry)
+                entry = self._create_entry()
+        except BaseException:
+            with self._condition:
+                self._reserved -= 1
+                self._condition.notify()
+            raise
+
+        now = self._clock()
+        entry.last_used_at = now
+        with self._condition:
+            self._reserved -= 1
+            closed = self._closed
+            if not closed:
+                self._in_use[id(entry.connection)] = entry
+                self._record_wait(now - start)
+            else:
+                self._condition.notify()
+        if closed:
+            self._destroy(entry)
+            raise PoolClosedError("Connection pool is closed")
+        return entry.connection
+
+    def release(self, connection: DbApiConnection) -> None:
+        now = self._clock()
+        retire: list[_PooledEntry] = []
+        released = False
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+            if entry is not None:
+                entry.last_used_at = now
+                if self._closed or self._expired(entry, now):
+                    retire.append(entry)
+                else:
+                    self._idle.append(entry)
+                retire.extend(self._evict_idle_locked(now))
+                self._condition.notify()
+            else:
+                # A repeat release of a pooled connection is a no-op: the
+                # connection is already idle and may be handed out again.
+                released = any(idle.connection is connection for idle in self._idle)
+        if entry is None:
+            if not released:
+                # Not ours; closing is the only safe option.
+                connection.close()
+            return
+        for stale in retire:
+            self._destroy(stale)
+
+    def evict_idle(self) -> int:
+        """Close idle connections past their idle timeout or max lifetime."""
+        with self._condition:
+            retire = self._evict_idle_locked(self._clock())
+        for entry in retire:
+            self._destroy(entry)
+        return len(retire)
+
+    def stats(self) -> PoolStats:
+        with self._condition:
+            return PoolStats(
+                size=self._size_locked(),
+                in_use=len(self._in_use),
+                idle=len(self._idle),
+                waiting=self._waiting,
+                created=self._created,
+                destroyed=self._destroyed,
+                acquired=self._acquired,
+                timeouts=self._timeouts,
+                validation_failures=self._validation_failures,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+            )
+
+    def _reserve(self, deadline: float) -> Optional[_PooledEntry]:
+        """Reserve a slot, blocking until one frees up or the deadline passes.
+
+        Returns an idle entry to reuse, or None when the caller should open a
+        new connection in the reserved slot.
+        """
+        retire: list[_PooledEntry] = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise PoolClosedError("Connection pool is closed")
+                    now = self._clock()
+                    while self._idle:
+                        entry = self._idle.pop()
+                        if self._expired(entry, now):
+                            retire.append(entry)
+                            continue
+                        self._reserved += 1
+                        return entry
+                    if self._size_locked() < self._config.max_size:
+                        self._reserved += 1
+                        return None
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            "Timed out waiting for a warehouse connection after "
+                            f"{self._config.acquire_timeout_seconds:g}s"
+                        )
+                    self._waiting += 1
+                    try:
+                        self._condition.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+        finally:
+            for entry in retire:
+                self._destroy(entry)
+
+    def _create_entry(self) -> _PooledEntry:
+        connection = self._factory()
+        now = self._clock()
+        with self._condition:
+            self._created += 1
+        jitter = self._config.lifetime_jitter * self._rng()
+        return _PooledEntry(
+            connection=connection,
+            created_at=now,
+            last_used_at=now,
+            max_lifetime=self._config.max_lifetime_seconds * (1.0 - jitter),
+        )
+
+    def _destroy(self, entry: _PooledEntry) -> None:
+        try:
+            entry.connection.close()
+        except Exception:
+            pass
+        with self._condition:
+            self._destroyed += 1
+
+    def _expired(self, entry: _PooledEntry, now: float) -> bool:
+        return now - entry.created_at >= entry.max_lifetime
+
+    def _evict_idle_locked(self, now: float) -> list[_PooledEntry]:
+        retire: list[_PooledEntry] = []
+        keep: deque[_PooledEntry] = deque()
+        size = self._size_locked()
+        for entry in self._idle:
+            surplus = size - len(retire) > self._config.min_size
+            idle_for = now - entry.last_used_at
+            if self._expired(entry, now) or (
+                surplus and idle_for >= self._config.idle_timeout_seconds
+            ):
+                retire.append(entry)
+            else:
+                keep.append(entry)
+        self._idle = keep
+        return retire
+
+    def _size_locked(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._reserved
+
+    def _record_wait(self, waited: float) -> None:
+        self._acquired += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+
+
+def create_pooled_connector(
+    config: WarehouseConfig, pool_config: PoolConfig | None = None
+) -> DatabricksSqlConnector:
+    """Build a connector whose connections come from a bounded pool."""
+    direct = DatabricksSqlConnector(config)
+    pool = ThreadSafeConnectionPool(direct.connect, pool_config)
+    return DatabricksSqlConnector(config, pool=pool, token_provider=direct.token_provider)
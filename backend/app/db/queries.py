@@ -0,0 +1,149 @@
+"""Query and page objects shared by the repository implementations."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_BUCKET_POINTS = 120
+
+
+class InvalidCursorError(ValueError):
+    """A pagination cursor that was not produced by ``encode_cursor``."""
+
+
+@dataclass(frozen=True)
+class StatusResultQuery:
+    """Filters and paging for status results.
+
+    Results are ordered by ``(measured_at, created_at, id)``, newest first
+    unless ``descending`` is False. ``limit=None`` returns every match.
+    ``cursor`` continues after the last item of a previous page.
+    """
+
+    platform_id: Optional[str] = None
+    check_id: Optional[str] = None
+    start_at: Optional[datetime] = None
+    end_at: Optional[datetime] = None
+    descending: bool = True
+    limit: Optional[int] = 25
+    offset: int = 0
+    cursor: Optional[str] = None
+    include_total: bool = True
+
+
+@dataclass(frozen=True)
+class StatusBucketQuery:
+    """Time-bucketed aggregates of status results for a check or platform.
+
+    Buckets are ``bucket_seconds`` wide and aligned to the epoch. With
+    ``bucket_seconds=None`` the width is picked so the window (or, without
+    bounds, the data) spans about ``points`` buckets. Empty buckets are omitted.
+    """
+
+    platform_id: Optional[str] = None
+    check_id: Optional[str] = None
+    start_at: Optional[datetime] = None
+    end_at: Optional[datetime] = None
+    bucket_seconds: Optional[int] = None
+    points: int = DEFAULT_BUCKET_POINTS
+
+
+@dataclass(frozen=True)
+class SlaQuery:
+    """Window and scope for SLA reports; ``end_at`` is exclusive."""
+
+    start_at: datetime
+    end_at: datetime
+    platform_id: Optional[str] = None
+    check_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StatusMessageQuery:
+    """Filters and paging for status messages, ordered by ``(created_at, id)``."""
+
+    platform_id: Optional[str] = None
+    state: Optional[str] = None
+    descending: bool = True
+    limit: Optional[int] = 25
+    offset: int = 0
+    cursor: Optional[str] = None
+    include_total: bool = True
+
+
+@dataclass(frozen=True)
+class PlatformQuery:
+    """Paging for platforms, ordered by ``(created_at, id)``."""
+
+    descending: bool = True
+    limit: Optional[int] = 25
+    offset: int = 0
+    cursor: Optional[str] = None
+    include_total: bool = True
+
+
+@dataclass(frozen=True)
+class StatusCheckQuery:
+    """Filters and paging for status checks, ordered by ``(created_at, id)``."""
+
+    platform_id: Optional[str] = None
+    descending: bool = True
+    limit: Optional[int] = 25
+    offset: int = 0
+    cursor: Optional[str] = None
+    include_total: bool = True
+
+
+@dataclass(frozen=True)
+class WorkItemQuery:
+    """Filters and paging for work items, ordered by ``(created_at, id)``."""
+
+    state: Optional[str] = None
+    descending: bool = True
+    limit: Optional[int] = 25
+    offset: int = 0
+    cursor: Optional[str] = None
+    include_total: bool = True
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BucketSeries(Generic[T]):
+    """Buckets oldest first, with the width actually used."""
+
+    bucket_seconds: int
+    items: list[T] = field(default_factory=list)
+
+
+def encode_cursor(key: tuple[str, ...]) -> str:
+    """Encode a sort key as an opaque, URL-safe cursor."""
+    payload = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple[str, ...]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if (
+        not isinstance(key, list)
+        or len(key) != size
+        or not all(isinstance(part, str) for part in key)
+    ):
+        raise InvalidCursorError("Malformed cursor")
+    return tuple(key)
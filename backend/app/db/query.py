@@ -2,25 +2,42 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Mapping, Protocol, Sequence
+from typing import Any, Iterator, Mapping, Protocol, Sequence, TypeVar
 
 from app.db.connection import ConnectionProvider, DbApiCursor
+from app.db.instrumentation import QueryObserver, QueryTimer
 
 QueryParams = Mapping[str, Any] | Sequence[Any] | None
 RowMapping = dict[str, Any]
+ColumnData = dict[str, list[Any]]
+
+DEFAULT_BATCH_SIZE = 1000
+
+ModelT = TypeVar("ModelT")
 
 
 class QueryError(RuntimeError):
     """Raised when query results cannot be mapped safely."""
 
 
+class QueryTimeoutError(QueryError):
+    """Raised when a query does not finish within its time budget."""
+
+
 @dataclass(frozen=True)
 class QueryCall:
     sql: str
     params: QueryParams | None
 
 
+@dataclass(frozen=True)
+class QueryBatchCall:
+    sql: str
+    params_seq: tuple[QueryParams, ...]
+
+
 class QueryRunner(Protocol):
     def fetch_all(self, sql: str, params: QueryParams | None = None) -> list[RowMapping]:
         ...
@@ -31,6 +48,64 @@ class QueryRunner(Protocol):
     def execute(self, sql: str, params: QueryParams | None = None) -> None:
         ...
 
+    def execute_many(self, sql: str, params_seq: Sequence[QueryParams]) -> None:
+        ...
+
+    def iter_batches(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[RowMapping]]:
+        ...
+
+    def iter_rows(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[RowMapping]:
+        ...
+
+    def fetch_columns(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ColumnData:
+        ...
+
+    def fetch_arrow(self, sql: str, params: QueryParams | None = None) -> Any:
+        ...
+
+    def fetch_models(
+        self, sql: str, model: type[ModelT], params: QueryParams | None = None
+    ) -> list[ModelT]:
+        ...
+
+
+def _load_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except Exception as exc:  # pragma: no cover - exercised by import failure
+        raise RuntimeError(
+            "pyarrow is not installed. Add pyarrow to backend dependencies "
+            "to use Arrow query results."
+        ) from exc
+    return pyarrow
+
+
+def _decoders() -> Any:
+    # Deferred: app.db.decoders imports QueryError from this module.
+    from app.db import decoders
+
+    return decoders
+
+
+def _validate_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
 
 def _column_names(description: Sequence[Sequence[Any]] | None) -> list[str]:
     if not description:
@@ -41,7 +116,10 @@ def _column_names(description: Sequence[Sequence[Any]] | None) -> list[str]:
 def rows_to_dicts(
     rows: Sequence[Sequence[Any]], description: Sequence[Sequence[Any]] | None
 ) -> list[RowMapping]:
-    columns = _column_names(description)
+    return _map_rows(_column_names(description), rows)
+
+
+def _map_rows(columns: list[str], rows: Sequence[Sequence[Any]]) -> list[RowMapping]:
     if not columns:
         if rows:
             raise QueryError("Query returned rows without column metadata.")
@@ -50,38 +128,244 @@ def rows_to_dicts(
 
 
 class SqlQueryRunner(QueryRunner):
-    """Execute SQL queries using a connection provider."""
+    """Execute SQL queries using a connection provider.
+
+    With an ``observer``, every query reports acquire/execute/fetch timings,
+    row count, and approximate bytes, tagged with the current request.
+    """
 
-    def __init__(self, connection_provider: ConnectionProvider) -> None:
+    def __init__(
+        self,
+        connection_provider: ConnectionProvider,
+        observer: QueryObserver | None = None,
+    ) -> None:
         self._connection_provider = connection_provider
+        self._observer = observer
 
     def fetch_all(self, sql: str, params: QueryParams | None = None) -> list[RowMapping]:
-        connection = self._connection_provider.connect()
-        cursor: DbApiCursor | None = None
-        try:
-            cursor = connection.cursor()
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-            return rows_to_dicts(rows, cursor.description)
-        finally:
-            if cursor is not None:
-                cursor.close()
-            self._connection_provider.release(connection)
+        with self._observe("fetch_all", sql) as timer:
+            connection = self._connection_provider.connect()
+            timer.acquired()
+            cursor: DbApiCursor | None = None
+            try:
+                cursor = connection.cursor()
+                cursor.execute(sql, params)
+                timer.executed()
+                rows = cursor.fetchall()
+                timer.add_rows(rows)
+                return rows_to_dicts(rows, cursor.description)
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                self._connection_provider.release(connection)
+
+    def fetch_models(
+        self, sql: str, model: type[ModelT], params: QueryParams | None = None
+    ) -> list[ModelT]:
+        """Fetch rows straight into ``model`` instances with a compiled decoder."""
+        with self._observe("fetch_models", sql) as timer:
+            connection = self._connection_provider.connect()
+            timer.acquired()
+            cursor: DbApiCursor | None = None
+            try:
+                cursor = connection.cursor()
+                cursor.execute(sql, params)
+                timer.executed()
+                rows = cursor.fetchall()
+                timer.add_rows(rows)
+                columns = _column_names(cursor.description)
+                if not columns and rows:
+                    raise QueryError("Query returned rows without column metadata.")
+                return _decoders().decode_rows(columns, rows, model)
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                self._connection_provider.release(connection)
 
     def fetch_one(self, sql: str, params: QueryParams | None = None) -> RowMapping | None:
         rows = self.fetch_all(sql, params)
         return rows[0] if rows else None
 
     def execute(self, sql: str, params: QueryParams | None = None) -> None:
-        connection = self._connection_provider.connect()
-        cursor: DbApiCursor | None = None
+        with self._observe("execute", sql) as timer:
+            connection = self._connection_provider.connect()
+            timer.acquired()
+            cursor: DbApiCursor | None = None
+            try:
+                cursor = connection.cursor()
+                cursor.execute(sql, params)
+                timer.executed()
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                self._connection_provider.release(connection)
+
+    def execute_many(self, sql: str, params_seq: Sequence[QueryParams]) -> None:
+        """Execute one statement for each parameter set on a single connection."""
+        if not params_seq:
+            return
+        with self._observe("execute_many", sql) as timer:
+            connection = self._connection_provider.connect()
+            timer.acquired()
+            cursor: DbApiCursor | None = None
+            try:
+                cursor = connection.cursor()
+                cursor.executemany(sql, list(params_seq))
+                timer.executed()
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                self._connection_provider.release(connection)
+
+    def iter_batches(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[RowMapping]]:
+        """Stream rows in ``fetchmany`` batches.
+
+        The connection is acquired on the first ``next()`` and released when the
+        iterator is exhausted, closed, or garbage collected. Callers that may stop
+        early should wrap the iterator in ``contextlib.closing`` so the release
+        does not wait for garbage collection.
+        """
+        _validate_batch_size(batch_size)
+        return self._stream_batches(sql, params, batch_size)
+
+    def iter_rows(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[RowMapping]:
+        return _flatten(self.iter_batches(sql, params, batch_size))
+
+    def fetch_columns(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ColumnData:
+        """Fetch a result as one list per column, without a dict per row."""
+        _validate_batch_size(batch_size)
+        with self._observe("fetch_columns", sql) as timer:
+            connection = self._connection_provider.connect()
+            timer.acquired()
+            cursor: DbApiCursor | None = None
+            try:
+                cursor = connection.cursor()
+                cursor.execute(sql, params)
+                timer.executed()
+                columns = _column_names(cursor.description)
+                data: ColumnData = {name: [] for name in columns}
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return data
+                    timer.add_rows(rows)
+                    _append_columns(columns, data, rows)
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                self._connection_provider.release(connection)
+
+    def fetch_arrow(self, sql: str, params: QueryParams | None = None) -> Any:
+        """Fetch a result as a ``pyarrow.Table``.
+
+        Uses the Databricks connector's native ``fetchall_arrow`` when the cursor
+        offers it, so warehouse Arrow batches are never decoded into Python rows.
+        """
+        pyarrow = _load_pyarrow()
+        with self._observe("fetch_arrow", sql) as timer:
+            connection = self._connection_provider.connect()
+            timer.acquired()
+            cursor: DbApiCursor | None = None
+            try:
+                cursor = connection.cursor()
+                cursor.execute(sql, params)
+                timer.executed()
+                fetchall_arrow = getattr(cursor, "fetchall_arrow", None)
+                if fetchall_arrow is not None:
+                    table = fetchall_arrow()
+                else:
+                    columns = _column_names(cursor.description)
+                    data: ColumnData = {name: [] for name in columns}
+                    _append_columns(columns, data, cursor.fetchall())
+                    table = pyarrow.table(data)
+                timer.rows = table.num_rows
+                timer.approx_bytes = table.nbytes
+                return table
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                self._connection_provider.release(connection)
+
+    def _stream_batches(
+        self, sql: str, params: QueryParams | None, batch_size: int
+    ) -> Iterator[list[RowMapping]]:
+        with self._observe("iter_batches", sql) as timer:
+            connection = self._connection_provider.connect()
+            timer.acquired()
+            cursor: DbApiCursor | None = None
+            try:
+                cursor = connection.cursor()
+                cursor.execute(sql, params)
+                timer.executed()
+                columns = _column_names(cursor.description)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    timer.add_rows(rows)
+                    yield _map_rows(columns, rows)
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                self._connection_provider.release(connection)
+
+    @contextmanager
+    def _observe(self, operation: str, sql: str) -> Iterator[QueryTimer]:
+        timer = QueryTimer(operation, sql)
+        if self._observer is None:
+            yield timer
+            return
+        error: BaseException | None = None
         try:
-            cursor = connection.cursor()
-            cursor.execute(sql, params)
+            yield timer
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
         finally:
-            if cursor is not None:
-                cursor.close()
-            self._connection_provider.release(connection)
+            self._observer.on_query(timer.finish(error))
+
+
+def _append_columns(
+    columns: list[str], data: ColumnData, rows: Sequence[Sequence[Any]]
+) -> None:
+    if not columns:
+        if rows:
+            raise QueryError("Query returned rows without column metadata.")
+        return
+    for name, values in zip(columns, zip(*rows)):
+        data[name].extend(values)
+
+
+def _flatten(batches: Iterator[list[RowMapping]]) -> Iterator[RowMapping]:
+    try:
+        for batch in batches:
+            yield from batch
+    finally:
+        close_iterator(batches)
+
+
+def close_iterator(iterator: Iterator[Any]) -> None:
+    """Close a generator-backed iterator so its connection is released now."""
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
 
 
 class MockQueryRunner(QueryRunner):
@@ -92,6 +376,7 @@ class MockQueryRunner(QueryRunner):
             sql: [dict(row) for row in rows] for sql, rows in (results or {}).items()
         }
         self.calls: list[QueryCall] = []
+        self.batch_calls: list[QueryBatchCall] = []
 
     def fetch_all(self, sql: str, params: QueryParams | None = None) -> list[RowMapping]:
         self.calls.append(QueryCall(sql=sql, params=params))
@@ -103,3 +388,44 @@ class MockQueryRunner(QueryRunner):
 
     def execute(self, sql: str, params: QueryParams | None = None) -> None:
         self.calls.append(QueryCall(sql=sql, params=params))
+
+    def execute_many(self, sql: str, params_seq: Sequence[QueryParams]) -> None:
+        self.batch_calls.append(QueryBatchCall(sql=sql, params_seq=tuple(params_seq)))
+
+    def iter_batches(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[RowMapping]]:
+        _validate_batch_size(batch_size)
+        rows = self.fetch_all(sql, params)
+        return (rows[idx : idx + batch_size] for idx in range(0, len(rows), batch_size))
+
+    def iter_rows(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[RowMapping]:
+        return _flatten(self.iter_batches(sql, params, batch_size))
+
+    def fetch_columns(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ColumnData:
+        _validate_batch_size(batch_size)
+        rows = self.fetch_all(sql, params)
+        columns = list(dict.fromkeys(name for row in rows for name in row))
+        return {name: [row.get(name) for row in rows] for name in columns}
+
+    def fetch_arrow(self, sql: str, params: QueryParams | None = None) -> Any:
+        pyarrow = _load_pyarrow()
+        return pyarrow.table(self.fetch_columns(sql, params))
+
+    def fetch_models(
+        self, sql: str, model: type[ModelT], params: QueryParams | None = None
+    ) -> list[ModelT]:
+        return _decoders().decode_mappings(self.fetch_all(sql, params), model)
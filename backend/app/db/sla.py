@@ -0,0 +1,344 @@
+"""SLA compliance computed from status-result time series.
+
+A result's state holds from its ``measured_at`` until the check's next result,
+but for at most the check's ``crit_after_minutes``: past that the check is
+stale and the time counts as ``unknown``, as does time before its first
+result. Every instant of a window is in exactly one state, so
+
+- uptime is the share of the window spent ``green``;
+- a breach is a maximal run of ``red`` or ``unknown`` time;
+- MTTR is the mean length of the breaches that recovered inside the window.
+
+Breaches already open when the window starts are measured from its start.
+
+Completed days are cached per check. A day depends only on the results
+measured in ``[day - stale, day end)`` and results are append-only, so a
+count of those results fingerprints it: a cached day is reused while the
+count is unchanged, and a late result invalidates exactly the days it touches.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable, Hashable, Iterable, Optional, Sequence
+
+from app.db.models import SlaReport, StatusCheck
+from app.db.timeseries import to_epoch_us
+from app.db.vectorized import load_numpy
+
+DAY_US = 86_400 * 1_000_000
+UNKNOWN = "unknown"
+UP_STATE = "green"
+BREACH_STATES = frozenset({"red", UNKNOWN})
+
+# Below this many results the loop beats building NumPy arrays.
+VECTORIZE_MIN_ROWS = 4096
+
+# Sorted measured_at (epoch us), state codes, and code -> state name.
+StatePoints = tuple[Sequence[int], Sequence[int], Sequence[Optional[str]]]
+
+
+@dataclass(slots=True)
+class SlaTally:
+    """Time per state and breach episodes over one contiguous range, in epoch us."""
+
+    state_us: dict[str, int] = field(default_factory=dict)
+    breaches: list[tuple[int, int]] = field(default_factory=list)
+
+    def add(self, state: str, start_us: int, end_us: int) -> None:
+        if end_us <= start_us:
+            return
+        self.state_us[state] = self.state_us.get(state, 0) + end_us - start_us
+        if state in BREACH_STATES:
+            self.add_breach(start_us, end_us)
+
+    def extend(self, other: SlaTally) -> None:
+        """Append the tally of the range that immediately follows this one."""
+        for state, duration in other.state_us.items():
+            self.state_us[state] = self.state_us.get(state, 0) + duration
+        for start_us, end_us in other.breaches:
+            self.add_breach(start_us, end_us)
+
+    def add_breach(self, start_us: int, end_us: int) -> None:
+        # A breach running across a range boundary is one episode.
+        if self.breaches and self.breaches[-1][1] == start_us:
+            self.breaches[-1] = (self.breaches[-1][0], end_us)
+        else:
+            self.breaches.append((start_us, end_us))
+
+
+def summarize(points: StatePoints, start_us: int, end_us: int, stale_us: int) -> SlaTally:
+    """Tally ``[start_us, end_us)`` in one pass over results sorted by measured_at.
+
+    Results outside the window are skipped by bisection, except the last one
+    before it, whose state carries in.
+    """
+    measured, states, names = points
+    lo = max(0, bisect_right(measured, start_us) - 1)
+    hi = bisect_left(measured, end_us, lo)
+    tally = SlaTally()
+    if lo == hi:
+        tally.add(UNKNOWN, start_us, end_us)
+        return tally
+    if measured[lo] > start_us:
+        tally.add(UNKNOWN, start_us, measured[lo])
+    np = load_numpy() if hi - lo >= VECTORIZE_MIN_ROWS else None
+    if np is not None:
+        _summarize_arrays(np, tally, points, lo, hi, start_us, end_us, stale_us)
+        return tally
+    for position in range(lo, hi):
+        at = measured[position]
+        until = measured[position + 1] if position + 1 < hi else end_us
+        begin = max(at, start_us)
+        held = min(until, at + stale_us)
+        tally.add(names[states[position]] or UNKNOWN, begin, held)
+        tally.add(UNKNOWN, max(begin, held), until)
+    return tally
+
+
+def _summarize_arrays(
+    np: Any,
+    tally: SlaTally,
+    points: StatePoints,
+    lo: int,
+    hi: int,
+    start_us: int,
+    end_us: int,
+    stale_us: int,
+) -> None:
+    """``summarize`` for long runs: every result becomes a held and a stale
+    segment, and state time and breach runs are reduced over those arrays."""
+    measured, states, names = points
+    unknown = len(names)
+    at = np.array(measured[lo:hi], dtype=np.int64)
+    codes = np.array(states[lo:hi], dtype=np.int64)
+    until = np.append(at[1:], end_us)
+    begin = np.maximum(at, start_us)
+    held = np.clip(at + stale_us, begin, until)
+
+    # Segments interleave [begin, held) in the result's state, then [held, until) unknown.
+    seg_start = np.column_stack((begin, held)).ravel()
+    seg_end = np.column_stack((held, until)).ravel()
+    seg_code = np.column_stack((codes, np.full_like(codes, unknown))).ravel()
+    keep = seg_end > seg_start
+    seg_start, seg_end, seg_code = seg_start[keep], seg_end[keep], seg_code[keep]
+    lengths = seg_end - seg_start
+
+    labels = [*(name or UNKNOWN for name in names), UNKNOWN]
+    for code in np.unique(seg_code).tolist():
+        state, duration = labels[code], int(lengths[seg_code == code].sum())
+        tally.state_us[state] = tally.state_us.get(state, 0) + duration
+
+    breach_codes = [code for code, state in enumerate(labels) if state in BREACH_STATES]
+    breach = np.isin(seg_code, breach_codes)
+    # Kept segments are contiguous, so a breach episode is a run of breach segments.
+    previous = np.concatenate(([False], breach[:-1]))
+    following = np.concatenate((breach[1:], [False]))
+    starts = seg_start[breach & ~previous].tolist()
+    ends = seg_end[breach & ~following].tolist()
+    for episode in zip(starts, ends):
+        tally.add_breach(*episode)
+
+
+class SlaDayCache:
+    """Bounded LRU of completed-day tallies keyed by ``(check, day, stale)``.
+
+    ``max_days`` grows to checks x days of the largest report reserved, so a
+    fleet-wide report never evicts its own days before it is asked again.
+    """
+
+    def __init__(self, max_days: int = 200_000) -> None:
+        self._entries: OrderedDict[Hashable, tuple[int, SlaTally]] = OrderedDict()
+        self.max_days = max_days
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, fingerprint: int) -> Optional[SlaTally]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, fingerprint: int, tally: SlaTally) -> None:
+        with self._lock:
+            self._entries[key] = (fingerprint, tally)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_days:
+                self._entries.popitem(last=False)
+
+    def reserve(self, days: int) -> None:
+        """Make room for ``days`` entries; the bound never shrinks."""
+        with self._lock:
+            self.max_days = max(self.max_days, days)
+
+
+def completed_before(end_us: int) -> int:
+    """Days ending by this instant are complete: the window end, or now if earlier."""
+    return min(end_us, to_epoch_us(datetime.now(timezone.utc)))
+
+
+def check_tally(
+    check_id: str,
+    start_us: int,
+    end_us: int,
+    stale_us: int,
+    points: Callable[[int, int], StatePoints],
+    fingerprint: Callable[[int, int], int],
+    cache: Optional[SlaDayCache] = None,
+) -> SlaTally:
+    """Tally ``[start_us, end_us)`` for one check, reusing cached completed days.
+
+    ``points(a, b)`` returns the check's sorted results covering at least
+    ``[a, b)``; it is called at most once, and only if some part of the window
+    is not cached. ``fingerprint(a, b)`` must grow whenever a result measured
+    in ``[a, b)`` is added.
+    """
+    complete_until = completed_before(end_us)
+    first_day = -(-start_us // DAY_US) * DAY_US
+    pieces: list[tuple[int, int, Optional[tuple[Hashable, int]]]] = []
+    cursor = start_us
+    day = first_day
+    while cache is not None and day + DAY_US <= complete_until:
+        if cursor < day:
+            pieces.append((cursor, day, None))
+        key = (check_id, day, stale_us)
+        pieces.append((day, day + DAY_US, (key, fingerprint(day - stale_us, day + DAY_US))))
+        cursor = day = day + DAY_US
+    if cursor < end_us:
+        pieces.append((cursor, end_us, None))
+
+    loaded: Optional[StatePoints] = None
+    tally = SlaTally()
+    for piece_start, piece_end, cached in pieces:
+        if cached is not None and cache is not None:
+            day_tally = cache.get(*cached)
+            if day_tally is not None:
+                tally.extend(day_tally)
+                continue
+        if loaded is None:
+            loaded = points(start_us - stale_us, end_us)
+        piece = summarize(loaded, piece_start, piece_end, stale_us)
+        if cached is not None and cache is not None:
+            cache.put(cached[0], cached[1], piece)
+        tally.extend(piece)
+    return tally
+
+
+def sla_checks(checks: Iterable[StatusCheck], check_id: Optional[str]) -> list[StatusCheck]:
+    """Live checks in scope, in id order."""
+    return sorted(
+        (
+            check
+            for check in checks
+            if not check.is_deleted and (not check_id or check.id == check_id)
+        ),
+        key=lambda check: check.id,
+    )
+
+
+def stale_after_us(check: StatusCheck) -> int:
+    return check.crit_after_minutes * 60 * 1_000_000
+
+
+def check_report(
+    check: StatusCheck,
+    tally: SlaTally,
+    start_us: int,
+    end_us: int,
+    format_us: Callable[[int], str],
+) -> SlaReport:
+    recovered = [end - start for start, end in tally.breaches if end < end_us]
+    return SlaReport(
+        platform_id=check.platform_id,
+        check_id=check.id,
+        checks=1,
+        start_at=format_us(start_us),
+        end_at=format_us(end_us),
+        uptime=tally.state_us.get(UP_STATE, 0) / (end_us - start_us),
+        state_seconds={
+            state: duration / 1_000_000 for state, duration in sorted(tally.state_us.items())
+        },
+        breaches=len(tally.breaches),
+        open_breaches=len(tally.breaches) - len(recovered),
+        mttr_seconds=sum(recovered) / len(recovered) / 1_000_000 if recovered else None,
+    )
+
+
+def sla_reports(
+    checks: Sequence[StatusCheck],
+    start_us: int,
+    end_us: int,
+    points: Callable[[str, int, int], StatePoints],
+    fingerprint: Callable[[str, int, int], int],
+    cache: Optional[SlaDayCache],
+    format_us: Callable[[int], str],
+) -> list[SlaReport]:
+    """One report per check; ``points`` and ``fingerprint`` take the check id first."""
+    if cache is not None:
+        cache.reserve(len(checks) * -(-(end_us - start_us) // DAY_US))
+    reports = []
+    for check in checks:
+        tally = check_tally(
+            check.id,
+            start_us,
+            end_us,
+            stale_after_us(check),
+            partial(points, check.id),
+            partial(fingerprint, check.id),
+            cache,
+        )
+        reports.append(check_report(check, tally, start_us, end_us, format_us))
+    return reports
+
+
+def platform_rollups(reports: Sequence[SlaReport]) -> list[SlaReport]:
+    """One report per platform over its checks' reports: uptime is the mean over
+    checks, state time is summed check-time, and MTTR covers every recovery."""
+    grouped: dict[str, list[SlaReport]] = {}
+    for report in reports:
+        grouped.setdefault(report.platform_id, []).append(report)
+    rollups = []
+    for platform_id in sorted(grouped):
+        members = grouped[platform_id]
+        seconds: dict[str, float] = {}
+        for report in members:
+            for state, duration in report.state_seconds.items():
+                seconds[state] = seconds.get(state, 0.0) + duration
+        recoveries = [
+            (report.breaches - report.open_breaches, report.mttr_seconds)
+            for report in members
+            if report.mttr_seconds is not None
+        ]
+        recovered = sum(count for count, _ in recoveries)
+        rollups.append(
+            SlaReport(
+                platform_id=platform_id,
+                check_id=None,
+                checks=len(members),
+                start_at=members[0].start_at,
+                end_at=members[0].end_at,
+                uptime=sum(report.uptime for report in members) / len(members),
+                state_seconds=dict(sorted(seconds.items())),
+                breaches=sum(report.breaches for report in members),
+                open_breaches=sum(report.open_breaches for report in members),
+                mttr_seconds=(
+                    sum(count * mttr for count, mttr in recoveries) / recovered
+                    if recovered
+                    else None
+                ),
+            )
+        )
+    return rollups
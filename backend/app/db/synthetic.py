@@ -0,0 +1,401 @@
+"""Deterministic synthetic status data at configurable scale.
+
+``mock_data`` is sized for demos; this module produces the same models at
+production-like volumes for load testing, the embedded warehouse and the
+benchmarks. Output depends only on ``SyntheticScale`` (including ``seed``):
+every collection draws from its own seeded generator, so the same scale gives
+the same rows regardless of which collections are generated or in what order.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import Iterator, Optional
+
+from app.db.decoders import format_timestamp
+from app.db.embedded import EmbeddedWarehouse
+from app.db.fixtures import LocalFixtureRepository
+from app.db.models import (
+    Platform,
+    StatusCheck,
+    StatusIngestionRun,
+    StatusMessage,
+    StatusResult,
+    WorkItem,
+)
+
+SYNTHETIC_ACTOR = "synthetic"
+
+_PLATFORM_NAMES = (
+    "Databricks",
+    "Power BI",
+    "Service Portal",
+    "Fabric Gateway",
+    "Data Lake Storage",
+    "Event Hub",
+    "Airflow",
+    "Kafka",
+    "Snowflake Bridge",
+    "Feature Store",
+)
+_OWNERS = ("Platform Ops", "BI Enablement", "Data Engineering", "Data Platform", "SRE")
+_PLATFORM_STATES = (("operational", 0.7), ("monitoring", 0.25), ("degraded", 0.05))
+_CHECK_TYPES = ("freshness", "availability", "latency", "volume")
+_CHECK_NAMES = {
+    "freshness": ("Table Refresh", "Catalog Sync", "Dataset Sync", "Pipeline Freshness"),
+    "availability": ("Heartbeat", "API Availability", "Gateway Reachability", "Cluster Pool"),
+    "latency": ("Query Latency", "API p95 Latency", "Queue Delay"),
+    "volume": ("Row Count Drift", "Ingest Volume", "File Arrivals"),
+}
+_SLA_MINUTES = (10, 15, 20, 30, 60)
+
+# Result states, indexed by the Markov chain below.
+STATES = ("green", "yellow", "red", "unknown")
+_GREEN, _YELLOW, _RED, _UNKNOWN = range(4)
+# Per-tick transition probabilities between green/yellow/red for a stable
+# check; flaky checks scale the off-diagonal terms up. Rows sum to 1.
+_TRANSITIONS = (
+    (0.995, 0.004, 0.001),
+    (0.30, 0.65, 0.05),
+    (0.20, 0.05, 0.75),
+)
+_FLAKY_SHARE = 0.15
+_FLAKY_FACTOR = 6.0
+_UNKNOWN_RATE = 0.002
+_MISSED_RATE = 0.003
+_FAILED_RUN_RATE = 0.005
+
+_MESSAGES = {
+    "green": ("Within SLA", "Healthy", "No action needed"),
+    "yellow": ("Approaching threshold", "Backlog growing", "Degraded performance"),
+    "red": ("Threshold breached", "Unreachable", "Investigating failure"),
+    "unknown": ("No signal from source", "Collector timed out"),
+}
+_MESSAGE_SEVERITIES = (("info", 0.5), ("warning", 0.35), ("critical", 0.15))
+_MESSAGE_STATES = (("published", 0.6), ("resolved", 0.3), ("draft", 0.1))
+_WORK_ITEM_STATES = (("open", 0.4), ("triage", 0.2), ("in_progress", 0.25), ("done", 0.15))
+_PRIORITIES = (("low", 0.3), ("medium", 0.5), ("high", 0.2))
+
+
+@dataclass(frozen=True)
+class SyntheticScale:
+    """How much data to generate. Results = checks x ``results_per_check``."""
+
+    platforms: int = 50
+    checks_per_platform: int = 8
+    results_per_check: int = 96
+    interval_minutes: int = 15
+    status_messages: int = 20
+    work_items: int = 50
+    start_at: datetime = datetime(2024, 7, 1, tzinfo=timezone.utc)
+    seed: int = 0
+
+    @classmethod
+    def production(cls, seed: int = 0) -> SyntheticScale:
+        """500 platforms, 20k checks, ~40M results (one week at 5-minute ticks)."""
+        return cls(
+            platforms=500,
+            checks_per_platform=40,
+            results_per_check=7 * 24 * 12,
+            interval_minutes=5,
+            status_messages=2_000,
+            work_items=5_000,
+            seed=seed,
+        )
+
+    @property
+    def status_checks(self) -> int:
+        return self.platforms * self.checks_per_platform
+
+    @property
+    def expected_results(self) -> int:
+        """Upper bound; failed runs and missed measurements leave gaps."""
+        return self.status_checks * self.results_per_check
+
+
+def _weighted(rng: random.Random, choices: tuple[tuple[str, float], ...]) -> str:
+    point = rng.random()
+    for value, weight in choices:
+        point -= weight
+        if point < 0:
+            return value
+    return choices[-1][0]
+
+
+def _width(count: int) -> int:
+    return max(3, len(str(count)))
+
+
+class SyntheticData:
+    """Generate every portal collection for one ``SyntheticScale``.
+
+    Small collections are returned as tuples; results are streamed by
+    ``iter_status_results`` in time order so tens of millions of rows never
+    have to be held at once.
+    """
+
+    def __init__(self, scale: SyntheticScale | None = None) -> None:
+        self.scale = scale or SyntheticScale()
+
+    def _rng(self, name: str) -> random.Random:
+        return random.Random(f"{self.scale.seed}:{name}")
+
+    def _tick(self, tick: int) -> datetime:
+        return self.scale.start_at + timedelta(minutes=tick * self.scale.interval_minutes)
+
+    def platform_id(self, index: int) -> str:
+        return f"platform-{index + 1:0{_width(self.scale.platforms)}d}"
+
+    def check_id(self, index: int) -> str:
+        return f"status-{index + 1:0{_width(self.scale.status_checks)}d}"
+
+    def run_id(self, tick: int) -> str:
+        return f"run-{tick + 1:0{_width(self.scale.results_per_check)}d}"
+
+    @cached_property
+    def _created_at(self) -> str:
+        return format_timestamp(self.scale.start_at - timedelta(days=30))
+
+    def platforms(self) -> tuple[Platform, ...]:
+        rng = self._rng("platforms")
+        stamp = self._created_at
+        platforms = []
+        for index in range(self.scale.platforms):
+            base = _PLATFORM_NAMES[index % len(_PLATFORM_NAMES)]
+            cycle = index // len(_PLATFORM_NAMES)
+            platforms.append(
+                Platform(
+                    id=self.platform_id(index),
+                    name=base if cycle == 0 else f"{base} {cycle + 1}",
+                    owner=rng.choice(_OWNERS),
+                    state=_weighted(rng, _PLATFORM_STATES),
+                    created_at=stamp,
+                    created_by=SYNTHETIC_ACTOR,
+                    updated_at=stamp,
+                    updated_by=SYNTHETIC_ACTOR,
+                )
+            )
+        return tuple(platforms)
+
+    def status_checks(self) -> tuple[StatusCheck, ...]:
+        rng = self._rng("status_checks")
+        stamp = self._created_at
+        checks = []
+        for index in range(self.scale.status_checks):
+            platform_index = index // self.scale.checks_per_platform
+            check_type = rng.choice(_CHECK_TYPES)
+            sla = rng.choice(_SLA_MINUTES)
+            checks.append(
+                StatusCheck(
+                    id=self.check_id(index),
+                    platform_id=self.platform_id(platform_index),
+                    name=rng.choice(_CHECK_NAMES[check_type]),
+                    check_type=check_type,
+                    owner_group=rng.choice(_OWNERS),
+                    description=f"Synthetic {check_type} check.",
+                    sla_minutes=sla,
+                    warn_after_minutes=int(sla * 1.5),
+                    crit_after_minutes=sla * 3,
+                    state="enabled",
+                    version=1,
+                    created_at=stamp,
+                    created_by=SYNTHETIC_ACTOR,
+                    updated_at=stamp,
+                    updated_by=SYNTHETIC_ACTOR,
+                )
+            )
+        return tuple(checks)
+
+    @cached_property
+    def _failed_ticks(self) -> frozenset[int]:
+        rng = self._rng("ingestion_runs")
+        return frozenset(
+            tick for tick in range(self.scale.results_per_check) if rng.random() < _FAILED_RUN_RATE
+        )
+
+    def ingestion_runs(self) -> tuple[StatusIngestionRun, ...]:
+        """One global run per tick; failed runs land no results."""
+        runs = []
+        for tick in range(self.scale.results_per_check):
+            started = self._tick(tick)
+            failed = tick in self._failed_ticks
+            runs.append(
+                StatusIngestionRun(
+                    id=self.run_id(tick),
+                    platform_id=None,
+                    source=SYNTHETIC_ACTOR,
+                    state="FAIL" if failed else "SUCCESS",
+                    started_at=format_timestamp(started),
+                    created_at=format_timestamp(started),
+                    ended_at=format_timestamp(started + timedelta(seconds=90)),
+                    error_summary="Source API timed out" if failed else None,
+                )
+            )
+        return tuple(runs)
+
+    def iter_status_results(self) -> Iterator[StatusResult]:
+        """Results in ``measured_at`` order; each check follows a green/yellow/red Markov chain.
+
+        Most checks are stable; a share are flaky. A small fraction of
+        measurements report ``unknown`` or are missing entirely, and every
+        check in a failed run's tick is missing, so staleness shows up too.
+        """
+        rng = self._rng("status_results")
+        checks = self.status_checks()
+        tables = []
+        for _ in checks:
+            factor = _FLAKY_FACTOR if rng.random() < _FLAKY_SHARE else 1.0
+            tables.append(_cumulative_transitions(factor))
+        offsets = [rng.randrange(0, 60 * self.scale.interval_minutes // 2) for _ in checks]
+        # Emit checks in offset order so the stream is sorted by measured_at.
+        order = sorted(range(len(checks)), key=offsets.__getitem__)
+        states = [_GREEN] * len(checks)
+        sequence = 0
+        width = _width(self.scale.expected_results)
+
+        for tick in range(self.scale.results_per_check):
+            failed = tick in self._failed_ticks
+            base = self._tick(tick)
+            run_id = self.run_id(tick)
+            for index in order:
+                check = checks[index]
+                # Advance every chain each tick so gaps do not reshuffle later states.
+                state = _next_state(tables[index][states[index]], rng.random())
+                states[index] = state
+                draw = rng.random()
+                if failed or draw < _MISSED_RATE:
+                    continue
+                if draw < _MISSED_RATE + _UNKNOWN_RATE:
+                    state = _UNKNOWN
+                measured = base + timedelta(seconds=offsets[index])
+                sequence += 1
+                name = STATES[state]
+                yield StatusResult(
+                    id=f"result-{sequence:0{width}d}",
+                    check_id=check.id,
+                    platform_id=check.platform_id,
+                    state=name,
+                    measured_at=format_timestamp(measured),
+                    created_at=format_timestamp(measured + timedelta(seconds=30 + draw * 60)),
+                    observed_value=_observed_value(check.check_type, state, rng),
+                    message=_MESSAGES[name][sequence % len(_MESSAGES[name])],
+                    ingestion_run_id=run_id,
+                )
+
+    def status_results(self) -> list[StatusResult]:
+        return list(self.iter_status_results())
+
+    def status_messages(self) -> tuple[StatusMessage, ...]:
+        rng = self._rng("status_messages")
+        span_minutes = self.scale.results_per_check * self.scale.interval_minutes
+        messages = []
+        for index in range(self.scale.status_messages):
+            start = self.scale.start_at + timedelta(minutes=rng.randrange(max(span_minutes, 1)))
+            state = _weighted(rng, _MESSAGE_STATES)
+            platform_index = rng.randrange(self.scale.platforms) if self.scale.platforms else None
+            if rng.random() < 0.1:
+                platform_index = None
+            severity = _weighted(rng, _MESSAGE_SEVERITIES)
+            end = start + timedelta(minutes=rng.randrange(15, 240)) if state == "resolved" else None
+            messages.append(
+                StatusMessage(
+                    id=f"message-{index + 1:0{_width(self.scale.status_messages)}d}",
+                    platform_id=(
+                        None if platform_index is None else self.platform_id(platform_index)
+                    ),
+                    severity=severity,
+                    title=f"{severity.title()} notice {index + 1}",
+                    body_md="Synthetic status message for load testing.",
+                    state=state,
+                    created_at=format_timestamp(start + timedelta(minutes=5)),
+                    start_at=format_timestamp(start),
+                    end_at=format_timestamp(end) if end else None,
+                )
+            )
+        return tuple(messages)
+
+    def work_items(self) -> tuple[WorkItem, ...]:
+        rng = self._rng("work_items")
+        items = []
+        for index in range(self.scale.work_items):
+            platform_index: Optional[int] = (
+                rng.randrange(self.scale.platforms) if self.scale.platforms else None
+            )
+            created = self.scale.start_at + timedelta(hours=rng.randrange(24 * 30))
+            items.append(
+                WorkItem(
+                    id=f"work-{index + 1:0{_width(self.scale.work_items)}d}",
+                    platform_id=(
+                        None if platform_index is None else self.platform_id(platform_index)
+                    ),
+                    title=f"Synthetic request {index + 1}",
+                    state=_weighted(rng, _WORK_ITEM_STATES),
+                    priority=_weighted(rng, _PRIORITIES),
+                    created_at=format_timestamp(created),
+                    requester=f"user{rng.randrange(1, 500)}@example.com",
+                )
+            )
+        return tuple(items)
+
+    def build_repository(self) -> LocalFixtureRepository:
+        return LocalFixtureRepository(
+            platforms=self.platforms(),
+            status_checks=self.status_checks(),
+            status_results=self.iter_status_results(),
+            status_messages=self.status_messages(),
+            work_items=self.work_items(),
+        )
+
+    def load_warehouse(self, warehouse: EmbeddedWarehouse, batch_size: int = 10_000) -> int:
+        """Create the schema and load everything; returns the number of results."""
+        warehouse.create_schema()
+        warehouse.load_models(self.platforms())
+        warehouse.load_models(self.status_checks())
+        warehouse.load_models(self.ingestion_runs())
+        warehouse.load_models(self.status_messages())
+        loaded = 0
+        batch: list[StatusResult] = []
+        for result in self.iter_status_results():
+            batch.append(result)
+            if len(batch) >= batch_size:
+                loaded += warehouse.load_models(batch)
+                batch = []
+        return loaded + warehouse.load_models(batch)
+
+
+def _cumulative_transitions(factor: float) -> tuple[tuple[float, float, float], ...]:
+    tables: list[tuple[float, float, float]] = []
+    for current, row in enumerate(_TRANSITIONS):
+        scaled = [p * factor if target != current else 0.0 for target, p in enumerate(row)]
+        scaled[current] = max(0.0, 1.0 - sum(scaled))
+        total = sum(scaled)
+        running = 0.0
+        cumulative = []
+        for p in scaled:
+            running += p / total
+            cumulative.append(running)
+        to_green, to_yellow, to_red = cumulative
+        tables.append((to_green, to_yellow, to_red))
+    return tuple(tables)
+
+
+def _next_state(cumulative: tuple[float, float, float], draw: float) -> int:
+    if draw < cumulative[0]:
+        return _GREEN
+    if draw < cumulative[1]:
+        return _YELLOW
+    return _RED
+
+
+def _observed_value(check_type: str, state: int, rng: random.Random) -> str:
+    level = (0.2, 0.8, 1.6, 0.0)[state]
+    if check_type == "freshness":
+        return f"freshness={int(level * 30 + rng.random() * 10)}m"
+    if check_type == "availability":
+        return "heartbeat=down" if state == _RED else "heartbeat=ok"
+    if check_type == "latency":
+        return f"p95={int(level * 500 + rng.random() * 100)}ms"
+    return f"rows={int((1.0 - level / 2) * 100_000)}"
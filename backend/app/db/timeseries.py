@@ -0,0 +1,584 @@
+"""Columnar, per-check time series of status results.
+
+Each check's results are held as parallel arrays sorted by
+``(measured_at, created_at, id)``: int64 epoch-microsecond timestamps, uint8
+state codes and uint32 codes into a shared string table for run ids, observed
+values and messages. Only result ids stay per-row strings. Compared with a list
+of ``StatusResult`` dataclasses this is a fraction of the memory, and range
+lookups bisect plain integers instead of re-parsing ISO strings.
+
+``StatusResult`` objects are rebuilt only for rows a caller actually returns.
+Timestamps that do not survive the round trip through epoch microseconds
+(offsets other than ``Z``, odd precision) are kept verbatim in a side table so
+output is byte-identical to the input.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Sequence
+
+from app.db.buckets import BucketAccumulator, bucket_seconds_for, finish, observed_number
+from app.db.decoders import format_timestamp, parse_timestamp
+from app.db.models import StatusBucket, StatusResult
+from app.db.queries import (
+    BucketSeries,
+    InvalidCursorError,
+    Page,
+    StatusBucketQuery,
+    StatusResultQuery,
+    decode_cursor,
+    encode_cursor,
+)
+from app.db.vectorized import ResultFrame, load_numpy
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Canonical state codes; other states are assigned codes on first sight.
+STATE_NAMES = ("green", "yellow", "red", "unknown")
+
+# Below this many rows to merge, the lazy heap merge beats building masks.
+VECTORIZE_MIN_ROWS = 4096
+
+SeriesKey = tuple[str, str]
+ResultKey = tuple[int, int, str]
+
+
+def _entry_key(entry: tuple[ResultKey, CheckSeries, int]) -> ResultKey:
+    return entry[0]
+
+
+def to_epoch_us(value: datetime) -> int:
+    """Epoch microseconds for a datetime; naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // _MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    """UTC datetime for epoch microseconds."""
+    return EPOCH + timedelta(microseconds=value)
+
+
+# Hot pages are re-read constantly, and checks on a shared schedule repeat the
+# same instants; a small cache formats each once and lets rows share the string.
+@lru_cache(maxsize=4096)
+def format_epoch_us(value: int) -> str:
+    return format_timestamp(EPOCH + timedelta(microseconds=value))
+
+
+def parse_epoch_us(value: str) -> int:
+    return to_epoch_us(parse_timestamp(value))
+
+
+class StringTable:
+    """Append-only intern table mapping strings to small integer codes.
+
+    Code 0 is reserved for ``None``. Tables are shared between store versions;
+    existing codes never change, so readers of an older version stay valid.
+    """
+
+    def __init__(self, initial: Iterable[str] = ()) -> None:
+        self._values: list[Optional[str]] = [None]
+        self._codes: dict[str, int] = {}
+        for value in initial:
+            self.code(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def value(self, code: int) -> Optional[str]:
+        return self._values[code]
+
+    def values(self) -> tuple[Optional[str], ...]:
+        """Every value, indexed by code."""
+        return tuple(self._values)
+
+
+class CheckSeries:
+    """Results for one (check, platform) pair, sorted by measured/created/id."""
+
+    __slots__ = (
+        "check_id",
+        "platform_id",
+        "measured",
+        "created",
+        "states",
+        "ids",
+        "runs",
+        "observed",
+        "messages",
+        "raw_times",
+    )
+
+    def __init__(self, check_id: str, platform_id: str) -> None:
+        self.check_id = check_id
+        self.platform_id = platform_id
+        self.measured = array("q")
+        self.created = array("q")
+        self.states = array("B")
+        self.ids: list[str] = []
+        self.runs = array("I")
+        self.observed = array("I")
+        self.messages = array("I")
+        # result id -> (measured_at, created_at) strings that are not canonical.
+        self.raw_times: dict[str, tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def copy(self) -> CheckSeries:
+        clone = CheckSeries(self.check_id, self.platform_id)
+        clone.measured = array("q", self.measured)
+        clone.created = array("q", self.created)
+        clone.states = array("B", self.states)
+        clone.ids = list(self.ids)
+        clone.runs = array("I", self.runs)
+        clone.observed = array("I", self.observed)
+        clone.messages = array("I", self.messages)
+        clone.raw_times = dict(self.raw_times)
+        return clone
+
+    def key(self, position: int) -> ResultKey:
+        return (self.measured[position], self.created[position], self.ids[position])
+
+    def bisect(self, key: ResultKey, right: bool, lo: int = 0, hi: Optional[int] = None) -> int:
+        """Insertion point for ``key``; ties on measured_at are resolved by a short scan."""
+        hi = len(self.ids) if hi is None else hi
+        start = bisect_left(self.measured, key[0], lo, hi)
+        stop = bisect_right(self.measured, key[0], start, hi)
+        position = start
+        while position < stop:
+            current = self.key(position)
+            if current > key or (not right and current == key):
+                break
+            position += 1
+        return position
+
+    def span(self, start_us: Optional[int] = None, end_us: Optional[int] = None) -> tuple[int, int]:
+        """Positions ``[lo, hi)`` with ``start_us <= measured <= end_us``."""
+        lo = 0 if start_us is None else bisect_left(self.measured, start_us)
+        hi = len(self.ids) if end_us is None else bisect_right(self.measured, end_us)
+        return lo, max(lo, hi)
+
+    def append(
+        self,
+        result: StatusResult,
+        measured_us: int,
+        created_us: int,
+        strings: StringTable,
+        states: StringTable,
+    ) -> None:
+        state = states.code(result.state)
+        if state > 0xFF:
+            raise ValueError(f"Too many distinct result states to encode {result.state!r}")
+        key = (measured_us, created_us, result.id)
+        position = len(self.ids)
+        if position and self.key(position - 1) > key:
+            position = self.bisect(key, right=True)
+        self.measured.insert(position, measured_us)
+        self.created.insert(position, created_us)
+        self.states.insert(position, state)
+        self.ids.insert(position, result.id)
+        self.runs.insert(position, strings.code(result.ingestion_run_id))
+        self.observed.insert(position, strings.code(result.observed_value))
+        self.messages.insert(position, strings.code(result.message))
+        if (
+            format_epoch_us(measured_us) != result.measured_at
+            or format_epoch_us(created_us) != result.created_at
+        ):
+            self.raw_times[result.id] = (result.measured_at, result.created_at)
+
+    def result(
+        self,
+        position: int,
+        strings: StringTable,
+        states: StringTable,
+        times: Optional[tuple[str, str]] = None,
+    ) -> StatusResult:
+        """Rebuild one result; ``times`` are preformatted canonical timestamps, if any."""
+        result_id = self.ids[position]
+        raw = self.raw_times.get(result_id) if self.raw_times else None
+        if raw is not None:
+            measured_at, created_at = raw
+        elif times is not None:
+            measured_at, created_at = times
+        else:
+            measured_at = format_epoch_us(self.measured[position])
+            created_at = format_epoch_us(self.created[position])
+        return StatusResult(
+            id=result_id,
+            check_id=self.check_id,
+            platform_id=self.platform_id,
+            state=states.value(self.states[position]) or "",
+            measured_at=measured_at,
+            created_at=created_at,
+            observed_value=strings.value(self.observed[position]),
+            message=strings.value(self.messages[position]),
+            ingestion_run_id=strings.value(self.runs[position]),
+        )
+
+    def state_counts(self, lo: int, hi: int, states: StringTable) -> dict[str, int]:
+        """Results per state in ``[lo, hi)``, counted over the raw uint8 column."""
+        column = self.states[lo:hi].tobytes()
+        counts: dict[str, int] = {}
+        for code in range(1, len(states)):
+            count = column.count(code)
+            if count:
+                counts[states.value(code) or ""] = count
+        return counts
+
+    def keys(self, lo: int, hi: int, descending: bool, ordinal: int) -> Iterator[tuple]:
+        positions = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+        measured, created, ids = self.measured, self.created, self.ids
+        for position in positions:
+            yield (measured[position], created[position], ids[position]), ordinal, position
+
+
+class TimeSeriesStore:
+    """Status results grouped into ``CheckSeries`` with check and platform indexes.
+
+    ``extend`` mutates in place; ``with_results`` returns a new store that
+    shares every series it did not touch, for copy-on-write snapshots.
+
+    Queries that merge many rows across series (deep offsets, exports) use a
+    NumPy ``ResultFrame`` when NumPy is installed and ``vectorize`` is on. The
+    frame holds only the query's candidate spans, so writes never pay for it.
+    """
+
+    def __init__(self, vectorize: bool = True) -> None:
+        self.vectorize = vectorize
+        self._series: dict[SeriesKey, CheckSeries] = {}
+        self._by_check: dict[str, tuple[SeriesKey, ...]] = {}
+        self._by_platform: dict[str, tuple[SeriesKey, ...]] = {}
+        # check id -> the series holding that check's newest result.
+        self._latest: dict[str, SeriesKey] = {}
+        self._strings = StringTable()
+        self._states = StringTable(STATE_NAMES)
+        # string code -> number parsed from it as an observed value; shared like _strings.
+        self._numbers: dict[int, Optional[float]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def extend(self, results: Iterable[StatusResult]) -> int:
+        return self._add(results, copy_on_write=False)
+
+    def with_results(self, results: Iterable[StatusResult]) -> TimeSeriesStore:
+        clone = TimeSeriesStore(self.vectorize)
+        clone._series = dict(self._series)
+        clone._by_check = dict(self._by_check)
+        clone._by_platform = dict(self._by_platform)
+        clone._latest = dict(self._latest)
+        clone._strings = self._strings
+        clone._states = self._states
+        clone._numbers = self._numbers
+        clone._count = self._count
+        clone._add(results, copy_on_write=True)
+        return clone
+
+    def series(self, check_id: str) -> list[CheckSeries]:
+        return [self._series[key] for key in self._by_check.get(check_id, ())]
+
+    def count(self, check_id: str, start_us: int, end_us: int) -> int:
+        """Results of ``check_id`` measured in ``[start_us, end_us)``, by bisection."""
+        return sum(
+            bisect_left(series.measured, end_us) - bisect_left(series.measured, start_us)
+            for series in self.series(check_id)
+        )
+
+    def state_points(
+        self, check_id: str
+    ) -> tuple[Sequence[int], Sequence[int], tuple[Optional[str], ...]]:
+        """A check's measured_at (epoch us) and state codes in result order, plus
+        the state name of each code. A single series is returned without copying."""
+        series = self.series(check_id)
+        if len(series) == 1:
+            return series[0].measured, series[0].states, self._states.values()
+        # A check reporting under several platforms: rare, so a plain sort.
+        merged = sorted(
+            (item.key(position), item.states[position])
+            for item in series
+            for position in range(len(item))
+        )
+        return (
+            [key[0] for key, _ in merged],
+            [state for _, state in merged],
+            self._states.values(),
+        )
+
+    def results(self) -> list[StatusResult]:
+        """Every result, oldest first."""
+        return self.query(StatusResultQuery(descending=False, limit=None)).items
+
+    def state_counts(
+        self,
+        check_id: str,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+    ) -> dict[str, int]:
+        start_us = None if start_at is None else to_epoch_us(start_at)
+        end_us = None if end_at is None else to_epoch_us(end_at)
+        counts: dict[str, int] = {}
+        for series in self.series(check_id):
+            lo, hi = series.span(start_us, end_us)
+            for state, count in series.state_counts(lo, hi, self._states).items():
+                counts[state] = counts.get(state, 0) + count
+        return counts
+
+    def query(self, query: StatusResultQuery) -> Page[StatusResult]:
+        cursor = self._cursor_key(query.cursor) if query.cursor else None
+        start_us = None if query.start_at is None else to_epoch_us(query.start_at)
+        end_us = None if query.end_at is None else to_epoch_us(query.end_at)
+
+        spans: list[tuple[CheckSeries, int, int]] = []
+        total = 0
+        for series in self._candidates(query.platform_id, query.check_id):
+            lo, hi = series.span(start_us, end_us)
+            total += hi - lo
+            if cursor is not None:
+                if query.descending:
+                    hi = series.bisect(cursor, right=False, lo=lo, hi=hi)
+                else:
+                    lo = series.bisect(cursor, right=True, lo=lo, hi=hi)
+            if lo < hi:
+                spans.append((series, lo, hi))
+
+        stop = None if query.limit is None else query.offset + query.limit + 1
+        available = sum(hi - lo for _, lo, hi in spans)
+        merged_rows = available if stop is None else min(stop, available)
+        times: Optional[list[tuple[str, str]]] = None
+        if len(spans) > 1 and merged_rows >= VECTORIZE_MIN_ROWS and self._vectorized():
+            frame = ResultFrame(spans)
+            rows = frame.select(query.descending, query.offset, query.limit)
+            selected = frame.locate(rows)
+            times = frame.timestamps(rows)
+        elif len(spans) == 1:
+            series, lo, hi = spans[0]
+            positions = range(hi - 1, lo - 1, -1) if query.descending else range(lo, hi)
+            selected = [(series, position) for position in islice(positions, query.offset, stop)]
+        else:
+            merged = heapq.merge(
+                *(
+                    series.keys(lo, hi, query.descending, ordinal)
+                    for ordinal, (series, lo, hi) in enumerate(spans)
+                ),
+                reverse=query.descending,
+            )
+            selected = [
+                (spans[ordinal][0], position)
+                for _, ordinal, position in islice(merged, query.offset, stop)
+            ]
+
+        has_more = query.limit is not None and len(selected) > query.limit
+        if has_more:
+            selected = selected[: query.limit]
+        if times is None:
+            items = [
+                series.result(position, self._strings, self._states)
+                for series, position in selected
+            ]
+        else:
+            items = [
+                series.result(position, self._strings, self._states, row_times)
+                for (series, position), row_times in zip(selected, times)
+            ]
+        next_cursor = None
+        if has_more and items:
+            last = items[-1]
+            next_cursor = encode_cursor((last.measured_at, last.created_at, last.id))
+        return Page(items, total if query.include_total else None, next_cursor)
+
+    def latest(self, query: StatusResultQuery) -> Page[StatusResult]:
+        """The newest result per check, ordered and paged like ``query``.
+
+        Without a time window each check's latest result is its series tail,
+        found through an index kept up to date on append; with a window it is
+        one bisect per series. Either way history is never scanned. With a
+        platform filter, a check's latest is its newest result on that platform.
+        """
+        cursor = self._cursor_key(query.cursor) if query.cursor else None
+        start_us = None if query.start_at is None else to_epoch_us(query.start_at)
+        end_us = None if query.end_at is None else to_epoch_us(query.end_at)
+
+        entries: list[tuple[ResultKey, CheckSeries, int]] = []
+        if start_us is None and end_us is None and not query.platform_id:
+            check_ids = (query.check_id,) if query.check_id else tuple(self._latest)
+            for check_id in check_ids:
+                key = self._latest.get(check_id)
+                if key is not None:
+                    series = self._series[key]
+                    entries.append((series.key(len(series) - 1), series, len(series) - 1))
+        else:
+            newest: dict[str, tuple[ResultKey, CheckSeries, int]] = {}
+            for series in self._candidates(query.platform_id, query.check_id):
+                lo, hi = series.span(start_us, end_us)
+                if lo == hi:
+                    continue
+                entry = (series.key(hi - 1), series, hi - 1)
+                current = newest.get(series.check_id)
+                if current is None or entry[0] > current[0]:
+                    newest[series.check_id] = entry
+            entries = list(newest.values())
+
+        entries.sort(key=_entry_key, reverse=query.descending)
+        total = len(entries)
+        if cursor is not None:
+            if query.descending:
+                entries = [entry for entry in entries if entry[0] < cursor]
+            else:
+                entries = [entry for entry in entries if entry[0] > cursor]
+        stop = None if query.limit is None else query.offset + query.limit
+        selected = entries[query.offset : stop]
+        items = [
+            series.result(position, self._strings, self._states) for _, series, position in selected
+        ]
+        next_cursor = None
+        if stop is not None and len(entries) > stop and items:
+            last = items[-1]
+            next_cursor = encode_cursor((last.measured_at, last.created_at, last.id))
+        return Page(items, total if query.include_total else None, next_cursor)
+
+    def extent(self, query: StatusResultQuery | StatusBucketQuery) -> Optional[tuple[int, int]]:
+        """First and last measured_at (epoch us) of the matching results, if any."""
+        spans = self._spans(query)
+        if not spans:
+            return None
+        first = min(series.measured[lo] for series, lo, _ in spans)
+        last = max(series.measured[hi - 1] for series, _, hi in spans)
+        return first, last
+
+    def buckets(self, query: StatusBucketQuery) -> BucketSeries[StatusBucket]:
+        """Per-bucket aggregates over the matching series.
+
+        Each series is sorted by measured_at, so a bucket is one bisect away
+        from the next; states are counted over the raw uint8 column and each
+        distinct observed value is parsed once per store lineage.
+        """
+        start_us = None if query.start_at is None else to_epoch_us(query.start_at)
+        end_us = None if query.end_at is None else to_epoch_us(query.end_at)
+        spans = self._spans(query)
+
+        width = query.bucket_seconds
+        if width is None:
+            # Unbounded sides fall back to the data's extent.
+            first = min((series.measured[lo] for series, lo, _ in spans), default=0)
+            last = max((series.measured[hi - 1] for series, _, hi in spans), default=0)
+            width = bucket_seconds_for(
+                first if start_us is None else start_us,
+                last if end_us is None else end_us,
+                query.points,
+            )
+        width_us = width * 1_000_000
+
+        accumulators: dict[int, BucketAccumulator] = {}
+        for series, lo, hi in spans:
+            measured = series.measured
+            while lo < hi:
+                index = measured[lo] // width_us
+                stop = bisect_left(measured, (index + 1) * width_us, lo, hi)
+                bucket = accumulators.get(index)
+                if bucket is None:
+                    bucket = accumulators[index] = BucketAccumulator()
+                bucket.add_states(
+                    series.state_counts(lo, stop, self._states), measured[lo], measured[stop - 1]
+                )
+                self._add_observed(bucket, series.observed[lo:stop])
+                lo = stop
+        return BucketSeries(width, finish(accumulators, width_us, format_epoch_us))
+
+    def _spans(
+        self, query: StatusResultQuery | StatusBucketQuery
+    ) -> list[tuple[CheckSeries, int, int]]:
+        """Non-empty ``(series, lo, hi)`` ranges inside the query's window."""
+        start_us = None if query.start_at is None else to_epoch_us(query.start_at)
+        end_us = None if query.end_at is None else to_epoch_us(query.end_at)
+        spans = []
+        for series in self._candidates(query.platform_id, query.check_id):
+            lo, hi = series.span(start_us, end_us)
+            if lo < hi:
+                spans.append((series, lo, hi))
+        return spans
+
+    def _add_observed(self, bucket: BucketAccumulator, codes: Sequence[int]) -> None:
+        numbers = self._numbers
+        count, minimum, maximum, total = 0, None, None, 0.0
+        for code, repeats in Counter(codes).items():
+            if code not in numbers:
+                numbers[code] = observed_number(self._strings.value(code))
+            value = numbers[code]
+            if value is None:
+                continue
+            count += repeats
+            total += value * repeats
+            minimum = value if minimum is None else min(minimum, value)
+            maximum = value if maximum is None else max(maximum, value)
+        if minimum is not None and maximum is not None:
+            bucket.add_observed(count, minimum, maximum, total)
+
+    def _vectorized(self) -> bool:
+        return self.vectorize and load_numpy() is not None
+
+    def _candidates(
+        self, platform_id: Optional[str], check_id: Optional[str]
+    ) -> Sequence[CheckSeries]:
+        if check_id:
+            keys = self._by_check.get(check_id, ())
+            if platform_id:
+                keys = tuple(key for key in keys if key[1] == platform_id)
+        elif platform_id:
+            keys = self._by_platform.get(platform_id, ())
+        else:
+            return list(self._series.values())
+        return [self._series[key] for key in keys]
+
+    @staticmethod
+    def _cursor_key(cursor: str) -> ResultKey:
+        measured_at, created_at, result_id = decode_cursor(cursor, 3)
+        try:
+            return (parse_epoch_us(measured_at), parse_epoch_us(created_at), result_id)
+        except ValueError as exc:
+            raise InvalidCursorError("Malformed cursor") from exc
+
+    def _add(self, results: Iterable[StatusResult], copy_on_write: bool) -> int:
+        copied: set[SeriesKey] = set()
+        added = 0
+        for result in results:
+            key = (result.check_id, result.platform_id)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = CheckSeries(*key)
+                copied.add(key)
+                self._by_check[key[0]] = self._by_check.get(key[0], ()) + (key,)
+                self._by_platform[key[1]] = self._by_platform.get(key[1], ()) + (key,)
+            elif copy_on_write and key not in copied:
+                series = self._series[key] = series.copy()
+                copied.add(key)
+            measured_us = parse_epoch_us(result.measured_at)
+            created_us = parse_epoch_us(result.created_at)
+            series.append(result, measured_us, created_us, self._strings, self._states)
+            latest = self._latest.get(key[0])
+            if latest != key:
+                tail = (measured_us, created_us, result.id)
+                if latest is None or tail > self._series[latest].key(len(self._series[latest]) - 1):
+                    self._latest[key[0]] = key
+            added += 1
+        self._count += added
+        return added
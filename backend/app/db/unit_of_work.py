@@ -0,0 +1,76 @@
+"""Request-scoped connection affinity for multi-query units of work."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from app.db.connection import ConnectionProvider, DbApiConnection
+from app.db.instrumentation import QueryObserver
+from app.db.query import SqlQueryRunner
+
+
+class PinnedConnectionProvider(ConnectionProvider):
+    """Serve every ``connect()`` from one connection until ``close()``.
+
+    The connection is acquired lazily on first use, so a request that never
+    queries the warehouse never checks out a connection. While a call still
+    holds it (a breaker-timed-out query finishing on another thread), further
+    calls get their own connection from the provider, and ``close()`` leaves
+    the pinned one to be returned by that call's ``release()``.
+    """
+
+    def __init__(self, provider: ConnectionProvider) -> None:
+        self._provider = provider
+        self._lock = threading.Lock()
+        self._connection: Optional[DbApiConnection] = None
+        self._borrowed = False
+        self._closed = False
+
+    @property
+    def is_pinned(self) -> bool:
+        return self._connection is not None
+
+    def connect(self) -> DbApiConnection:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Unit of work is already closed")
+            if self._connection is None:
+                self._connection = self._provider.connect()
+            if not self._borrowed:
+                self._borrowed = True
+                return self._connection
+        return self._provider.connect()
+
+    def release(self, connection: DbApiConnection) -> None:
+        with self._lock:
+            if connection is self._connection:
+                # Held for the whole unit of work; returned in close() unless
+                # the unit of work closed while this call still held it.
+                self._borrowed = False
+                if not self._closed:
+                    return
+                self._connection = None
+        self._provider.release(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._borrowed:
+                return
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            self._provider.release(connection)
+
+
+@contextmanager
+def unit_of_work(
+    provider: ConnectionProvider, observer: QueryObserver | None = None
+) -> Iterator[SqlQueryRunner]:
+    """Run a block of queries on one pinned connection (for background jobs)."""
+    pinned = PinnedConnectionProvider(provider)
+    try:
+        yield SqlQueryRunner(pinned, observer)
+    finally:
+        pinned.close()
@@ -0,0 +1,130 @@
+"""Optional NumPy query path for the columnar status-result store.
+
+``ResultFrame`` flattens the candidate spans of one query -- the
+``[lo, hi)`` range of each matching ``CheckSeries``, already cut to the
+query's window and cursor -- into NumPy columns of int64 epoch-microsecond
+timestamps. Ordering partitions out the rows a page can reach and
+``lexsort``s only those. Result ids are strings, so the rare rows that tie on
+``(measured_at, created_at)`` are put in id order in Python.
+
+NumPy is optional. Without it ``load_numpy()`` returns None and the store
+keeps using its pure-Python merge.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+if TYPE_CHECKING:
+    from app.db.timeseries import CheckSeries
+
+
+@lru_cache(maxsize=1)
+def load_numpy() -> Any:
+    """The ``numpy`` module, or None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised by import failure
+        return None
+    return numpy
+
+
+class ResultFrame:
+    """The candidate rows of one query as flat NumPy columns, grouped by span."""
+
+    def __init__(self, spans: Sequence[tuple[CheckSeries, int, int]]) -> None:
+        np = load_numpy()
+        if np is None:
+            raise RuntimeError("numpy is not installed; ResultFrame needs it")
+        self._np = np
+        self.series = [series for series, _, _ in spans]
+        lengths = np.fromiter((hi - lo for _, lo, hi in spans), np.int64, len(spans))
+        self.measured = _concat(np, [(item.measured, lo, hi) for item, lo, hi in spans], np.int64)
+        self.created = _concat(np, [(item.created, lo, hi) for item, lo, hi in spans], np.int64)
+        self.owner = np.repeat(np.arange(len(spans), dtype=np.int32), lengths)
+        # Row -> position in its series: the row's offset in its span plus the span's lo.
+        shifts = np.cumsum(lengths) - lengths - np.fromiter((lo for _, lo, _ in spans), np.int64)
+        self.position = np.arange(len(self.measured), dtype=np.int64) - np.repeat(shifts, lengths)
+
+    def __len__(self) -> int:
+        return len(self.measured)
+
+    def select(self, descending: bool, offset: int, limit: Optional[int]) -> list[int]:
+        """Ordered frame rows for one page.
+
+        Like the pure-Python path, one row past ``limit`` is returned so the
+        caller can tell whether a next page exists.
+        """
+        np = self._np
+        rows = np.arange(len(self.measured), dtype=np.int64)
+        need = None if limit is None else offset + limit + 1
+        if need is not None and len(rows) > need:
+            rows = rows[self._reachable(rows, need, descending)]
+        return self._order(rows, descending)[offset:need]
+
+    def locate(self, rows: Sequence[int]) -> list[tuple[CheckSeries, int]]:
+        """``(series, position)`` for each frame row."""
+        owners = self.owner[rows].tolist()
+        positions = self.position[rows].tolist()
+        return [(self.series[owner], position) for owner, position in zip(owners, positions)]
+
+    def timestamps(self, rows: Sequence[int]) -> list[tuple[str, str]]:
+        """``(measured_at, created_at)`` in the API's ISO ``Z`` form, formatted in bulk."""
+        measured = _format_epoch_us(self._np, self.measured[rows])
+        created = _format_epoch_us(self._np, self.created[rows])
+        return list(zip(measured, created))
+
+    def _id(self, row: int) -> str:
+        return self.series[self.owner[row]].ids[self.position[row]]
+
+    def _reachable(self, rows: Any, need: int, descending: bool) -> Any:
+        """Mask of the rows that can land in the first ``need``: a linear-time cut on
+        measured_at that keeps every row tied with the cut-off."""
+        measured = self.measured[rows]
+        if descending:
+            cutoff = self._np.partition(measured, len(measured) - need)[len(measured) - need]
+            return measured >= cutoff
+        cutoff = self._np.partition(measured, need - 1)[need - 1]
+        return measured <= cutoff
+
+    def _order(self, rows: Any, descending: bool) -> list[int]:
+        np = self._np
+        order = np.lexsort((self.created[rows], self.measured[rows]))
+        if descending:
+            order = order[::-1]
+        ordered = rows[order]
+        measured, created = self.measured[ordered], self.created[ordered]
+        ties = np.flatnonzero((measured[1:] == measured[:-1]) & (created[1:] == created[:-1]))
+        result: list[int] = ordered.tolist()
+        if not len(ties):
+            return result
+        # Each run of equal (measured_at, created_at) is put in id order.
+        start = previous = int(ties[0])
+        for index in [*ties[1:].tolist(), None]:
+            if index is not None and index == previous + 1:
+                previous = index
+                continue
+            run = result[start : previous + 2]
+            run.sort(key=self._id, reverse=descending)
+            result[start : previous + 2] = run
+            if index is not None:
+                start = previous = index
+        return result
+
+
+def _format_epoch_us(np: Any, values: Any) -> list[str]:
+    if not len(values):
+        # np.char.replace sizes its output from the longest input and fails on none.
+        return []
+    # Same text as format_timestamp: the fraction is dropped when it is zero.
+    text = np.datetime_as_string(values.astype("datetime64[us]"), unit="us")
+    return np.char.add(np.char.replace(text, ".000000", ""), "Z").tolist()
+
+
+def _concat(np: Any, columns: Sequence[tuple[Any, int, int]], dtype: Any) -> Any:
+    if not columns:
+        return np.empty(0, dtype=dtype)
+    # frombuffer views are copied by concatenate, so no buffer export outlives
+    # this call and the arrays stay appendable; only each [lo, hi) is copied.
+    return np.concatenate([np.frombuffer(column, dtype=dtype)[lo:hi] for column, lo, hi in columns])
@@ -0,0 +1,170 @@
+"""SQL warehouse warm-up and keepalive for app startup."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Optional, Protocol, Sequence
+
+from app.core.logging import APP_LOGGER_NAME
+from app.db.query import QueryRunner
+
+DEFAULT_WARMUP_TABLES = ("platforms", "status_checks", "status_results", "status_messages")
+KEEPALIVE_SQL = "SELECT 1"
+
+_TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*){0,2}$")
+
+logger = logging.getLogger(f"{APP_LOGGER_NAME}.warmup")
+
+
+class WarmableConnector(Protocol):
+    """What warm-up needs from a connector; ``DatabricksSqlConnector`` fits."""
+
+    @property
+    def pool(self) -> object: ...
+
+    def open_pool(self) -> None: ...
+
+    def close_pool(self) -> None: ...
+
+
+class WarmupState:
+    """Readiness flag that flips once warehouse warm-up has finished."""
+
+    def __init__(self, required: bool = False) -> None:
+        self._done = threading.Event()
+        self.error: Optional[str] = None
+        if not required:
+            self._done.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def mark_pending(self) -> None:
+        self.error = None
+        self._done.clear()
+
+    def mark_ready(self, error: Optional[str] = None) -> None:
+        self.error = error
+        self._done.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+
+def parse_active_hours(value: Optional[str]) -> Optional[tuple[int, int]]:
+    """Parse ``"HH-HH"`` (UTC, end exclusive, may wrap midnight); empty means always."""
+    if not value or not value.strip():
+        return None
+    try:
+        start_text, end_text = value.split("-", 1)
+        start, end = int(start_text), int(end_text)
+    except ValueError as exc:
+        raise ValueError("Active hours must look like '07-19'") from exc
+    if not (0 <= start <= 23 and 0 <= end <= 24):
+        raise ValueError("Active hours must be within 0-24")
+    return start, end
+
+
+def within_active_hours(hours: Optional[tuple[int, int]], now: datetime) -> bool:
+    if hours is None:
+        return True
+    start, end = hours
+    if start == end:
+        return True
+    if start < end:
+        return start <= now.hour < end
+    return now.hour >= start or now.hour < end
+
+
+def warmup_queries(tables: Sequence[str]) -> list[str]:
+    queries = []
+    for table in tables:
+        if not _TABLE_NAME.match(table):
+            raise ValueError(f"Invalid warm-up table name: {table!r}")
+        queries.append(f"SELECT * FROM {table} LIMIT 1")
+    return queries
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class WarehouseWarmer:
+    """Open the pool, touch hot tables, then keep the warehouse awake.
+
+    Runs on a daemon thread so ``/readyz`` can answer (not ready) while the
+    warehouse is still starting.
+    """
+
+    def __init__(
+        self,
+        connector: WarmableConnector,
+        runner: QueryRunner,
+        state: WarmupState,
+        tables: Sequence[str] = DEFAULT_WARMUP_TABLES,
+        keepalive_interval_seconds: float = 0.0,
+        active_hours: Optional[tuple[int, int]] = None,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self._connector = connector
+        self._runner = runner
+        self._state = state
+        self._queries = warmup_queries(tables)
+        self._keepalive_interval = keepalive_interval_seconds
+        self._active_hours = active_hours
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._state.mark_pending()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="warehouse-warmup", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._connector.close_pool()
+
+    def warm_up(self) -> None:
+        """Open the pool to its minimum size and run the warm-up queries."""
+        error: Optional[str] = None
+        try:
+            self._connector.open_pool()
+            for sql in self._queries:
+                if self._stop.is_set():
+                    break
+                self._runner.fetch_all(sql)
+        except Exception as exc:
+            # Serve anyway: reads degrade to stale/unknown instead of the app
+            # staying out of rotation while the warehouse is down.
+            error = f"{type(exc).__name__}: {exc}"
+            logger.warning("warehouse warm-up failed", extra={"error": error})
+        self._state.mark_ready(error)
+
+    def keepalive_once(self) -> bool:
+        """Ping the warehouse if inside the active window; returns True if pinged."""
+        if not within_active_hours(self._active_hours, self._clock()):
+            return False
+        try:
+            self._runner.fetch_all(KEEPALIVE_SQL)
+        except Exception as exc:
+            logger.warning("warehouse keepalive failed", extra={"error": str(exc)})
+        evict_idle = getattr(self._connector.pool, "evict_idle", None)
+        if evict_idle is not None:
+            evict_idle()
+        return True
+
+    def _run(self) -> None:
+        self.warm_up()
+        if self._keepalive_interval <= 0:
+            return
+        while not self._stop.wait(self._keepalive_interval):
+            self.keepalive_once()
@@ -2,27 +2,88 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from .api.v1.catalog import router as catalog_router
 from .api.v1.health import router as health_router
 from .api.v1.me import router as me_router
+from .api.v1.metrics import router as metrics_router
 from .api.v1.platforms import router as platforms_router
 from .api.v1.status_checks import router as status_checks_router
 from .api.v1.status_results import router as status_results_router
 from .auth.middleware import request_context_middleware
-from .core.config import get_settings
+from .core.config import Settings, get_settings
 from .core.error_handlers import register_error_handlers
 from .core.logging import configure_logging, request_logging_middleware
+from .db.deps import (
+    get_connection_provider,
+    get_query_instrumentation,
+    get_query_runner,
+    warehouse_config,
+)
+from .db.query import SqlQueryRunner
+from .db.warmup import WarehouseWarmer, WarmupState, parse_active_hours
+
+
+def _warmup_required(settings: Settings) -> bool:
+    return settings.warehouse_warmup_enabled and warehouse_config(settings).is_configured()
+
+
+def _build_warmer(settings: Settings, state: WarmupState) -> WarehouseWarmer:
+    connector = get_connection_provider()
+    tables = [name.strip() for name in settings.warehouse_warmup_tables.split(",") if name.strip()]
+    return WarehouseWarmer(
+        connector,
+        SqlQueryRunner(connector, get_query_instrumentation()),
+        state,
+        tables=tables,
+        keepalive_interval_seconds=settings.warehouse_keepalive_interval_seconds,
+        active_hours=parse_active_hours(settings.warehouse_keepalive_hours),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    connector = None
+    token_provider = None
+    breaker = None
+    if warehouse_config(settings).is_configured():
+        connector = get_connection_provider()
+        token_provider = connector.token_provider
+        runner = get_query_runner()
+        breaker = runner.breaker
+        breaker.start_probing(runner.probe)
+    if token_provider is not None:
+        token_provider.start()
+    warmer: WarehouseWarmer | None = None
+    if _warmup_required(settings):
+        warmer = _build_warmer(settings, app.state.warmup)
+        warmer.start()
+    try:
+        yield
+    finally:
+        if warmer is not None:
+            warmer.stop()
+        if breaker is not None:
+            breaker.stop()
+        if token_provider is not None:
+            token_provider.stop()
+        if connector is not None:
+            connector.close_pool()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging(settings)
 
-    app = FastAPI(title="Service Portal")
+    app = FastAPI(title="Service Portal", lifespan=lifespan)
+    app.state.warmup = WarmupState(required=_warmup_required(settings))
     app.middleware("http")(request_context_middleware)
     app.middleware("http")(request_logging_middleware)
     register_error_handlers(app)
@@ -33,6 +94,7 @@ def create_app() -> FastAPI:
     app.include_router(status_results_router)
     app.include_router(catalog_router)
     app.include_router(me_router)
+    app.include_router(metrics_router)
     _mount_spa(app)
 
     return app
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -27,6 +29,8 @@ class PlatformRead(PlatformBase):
 
 class PlatformListResponse(BaseModel):
     items: list[PlatformRead]
-    total: int
+    # None on cursor pages; the first page carries the total.
+    total: Optional[int]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
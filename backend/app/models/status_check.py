@@ -49,6 +49,8 @@ class StatusCheckRead(StatusCheckBase):
 
 class StatusCheckListResponse(BaseModel):
     items: list[StatusCheckRead]
-    total: int
+    # None on cursor pages; the first page carries the total.
+    total: Optional[int]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
@@ -10,6 +10,7 @@ from app.core.exceptions import NotFoundError
 from app.db.deps import get_repository
 from app.db.interfaces import PlatformRepository
 from app.db.models import Platform
+from app.db.queries import Page, PlatformQuery
 from app.models.platform import PlatformCreate
 
 
@@ -29,6 +30,9 @@ class PlatformService:
     def list_platforms(self) -> list[Platform]:
         return list(self._repository.list_platforms())
 
+    def query_platforms(self, query: PlatformQuery) -> Page[Platform]:
+        return self._repository.query_platforms(query)
+
     def get_platform(self, platform_id: str) -> Platform:
         platform = self._repository.get_platform(platform_id)
         if platform is None:
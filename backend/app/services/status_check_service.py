@@ -11,6 +11,7 @@ from app.core.exceptions import NotFoundError
 from app.db.deps import get_repository
 from app.db.interfaces import StatusRepository
 from app.db.models import StatusCheck
+from app.db.queries import Page, StatusCheckQuery
 from app.models.status_check import StatusCheckCreate, StatusCheckUpdate
 
 
@@ -30,6 +31,9 @@ class StatusCheckService:
     def list_status_checks(self, platform_id: Optional[str] = None) -> list[StatusCheck]:
         return list(self._repository.list_status_checks(platform_id=platform_id))
 
+    def query_status_checks(self, query: StatusCheckQuery) -> Page[StatusCheck]:
+        return self._repository.query_status_checks(query)
+
     def get_status_check(self, check_id: str) -> StatusCheck:
         check = self._repository.get_status_check(check_id)
         if check is None:
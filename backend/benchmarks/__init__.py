@@ -0,0 +1,5 @@
+"""Micro-benchmarks for backend hot paths.
+
+Run from ``backend/`` with ``python -m benchmarks.<module>``; they are not part
+of the pytest suite.
+"""
@@ -0,0 +1,113 @@
+"""Shared helpers for the backend benchmarks."""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+
+@dataclass(frozen=True)
+class Measurement:
+    label: str
+    seconds: float
+    peak_mib: float
+
+
+def measure(label: str, func: Callable[[], Any], repeat: int = 3) -> Measurement:
+    """Best-of-``repeat`` wall time plus peak traced allocation of one run."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return Measurement(label=label, seconds=best, peak_mib=peak / (1024 * 1024))
+
+
+def retained_mib(build: Callable[[], Any]) -> tuple[Any, float]:
+    """Build a value and return it with the traced allocation it keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    value = build()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, (after - before) / (1024 * 1024)
+
+
+def print_table(title: str, measurements: Sequence[Measurement]) -> None:
+    print(title)
+    baseline = measurements[0].seconds if measurements else 0.0
+    for item in measurements:
+        speedup = baseline / item.seconds if item.seconds else float("inf")
+        print(
+            f"  {item.label:<28} {item.seconds * 1000:10.1f} ms"
+            f" {item.peak_mib:10.1f} MiB  x{speedup:5.2f}"
+        )
+
+
+def parse_sizes(value: str) -> list[int]:
+    return [int(part.replace("_", "")) for part in value.split(",") if part.strip()]
+
+
+class InMemoryCursor:
+    """DB-API cursor over pre-built tuples, so timings exclude network and driver work."""
+
+    def __init__(self, columns: Sequence[str], rows: Sequence[tuple[Any, ...]]) -> None:
+        self.description: Sequence[Sequence[Any]] | None = [
+            (name, None, None, None, None, None, None) for name in columns
+        ]
+        self._rows = rows
+        self._position = 0
+
+    def execute(self, operation: str, parameters: object | None = None) -> None:
+        self._position = 0
+
+    def executemany(self, operation: str, seq_of_parameters: Sequence[object]) -> None:
+        self._position = 0
+
+    def fetchall(self) -> Sequence[tuple[Any, ...]]:
+        rows = self._rows[self._position :]
+        self._position = len(self._rows)
+        return list(rows)
+
+    def fetchmany(self, size: int) -> Sequence[tuple[Any, ...]]:
+        rows = self._rows[self._position : self._position + size]
+        self._position += len(rows)
+        return list(rows)
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def close(self) -> None:
+        return None
+
+
+class InMemoryConnectionProvider:
+    def __init__(self, columns: Sequence[str], rows: Sequence[tuple[Any, ...]]) -> None:
+        self._columns = columns
+        self._rows = rows
+
+    def connect(self) -> "InMemoryConnectionProvider":
+        return self
+
+    def cursor(self) -> InMemoryCursor:
+        return InMemoryCursor(self._columns, self._rows)
+
+    def release(self, connection: object) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
@@ -0,0 +1,78 @@
+"""Compare the dict-per-row fetch path with columnar and Arrow fetches.
+
+Usage: ``python -m benchmarks.bench_columnar_fetch --rows 100000,1000000``
+
+The cursor here yields Python tuples, so ``fetch_arrow`` pays for building the
+Arrow table from lists. Against the Databricks connector it uses the native
+``fetchall_arrow`` and skips Python row objects entirely.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from app.db.query import SqlQueryRunner
+from benchmarks._harness import InMemoryConnectionProvider, measure, parse_sizes, print_table
+
+COLUMNS = ("id", "check_id", "platform_id", "state", "measured_at", "observed_value")
+STATES = ("green", "green", "green", "yellow", "red", "unknown")
+SQL = "SELECT id, check_id, platform_id, state, measured_at, observed_value FROM status_results"
+
+
+def _rows(count: int) -> list[tuple]:
+    start = datetime(2024, 7, 1, tzinfo=timezone.utc)
+    return [
+        (
+            f"result-{idx:08d}",
+            f"status-{idx % 2000:05d}",
+            f"platform-{idx % 50:03d}",
+            STATES[idx % len(STATES)],
+            start + timedelta(minutes=idx),
+            f"freshness={idx % 60}m",
+        )
+        for idx in range(count)
+    ]
+
+
+def run(sizes: list[int]) -> None:
+    try:
+        import pyarrow  # noqa: F401
+
+        has_arrow = True
+    except ImportError:
+        has_arrow = False
+
+    for size in sizes:
+        runner = SqlQueryRunner(InMemoryConnectionProvider(COLUMNS, _rows(size)))
+
+        def dict_path() -> Counter:
+            return Counter(row["state"] for row in runner.fetch_all(SQL))
+
+        def columnar_path() -> Counter:
+            return Counter(runner.fetch_columns(SQL, batch_size=10_000)["state"])
+
+        measurements = [
+            measure("fetch_all + rows_to_dicts", dict_path),
+            measure("fetch_columns", columnar_path),
+        ]
+        if has_arrow:
+
+            def arrow_path() -> object:
+                table = runner.fetch_arrow(SQL)
+                return table.column("state").value_counts()
+
+            measurements.append(measure("fetch_arrow", arrow_path))
+        print_table(f"{size:,} rows (state histogram)", measurements)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", default="100000,1000000", type=parse_sizes)
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Model footprint and decode throughput: plain dataclasses vs slotted, interned models.
+
+Usage: ``python -m benchmarks.bench_models --rows 100000``
+
+Rows are synthetic status results shaped like warehouse cursor rows: every
+value is a fresh object, as a driver returns them, with timestamps as
+``datetime``. The baseline is the pre-slots ``StatusResult`` shape decoded by
+the same compiled decoder, so the difference is ``__slots__`` plus interning
+of ``INTERNED_FIELDS``. Serialization compares the
+``asdict`` the API used to call with ``to_dict``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Optional
+
+from app.db.decoders import compile_decoder, parse_timestamp
+from app.db.models import StatusResult, to_dict
+from app.db.synthetic import SyntheticData, SyntheticScale
+from benchmarks._harness import measure, print_table, retained_mib
+
+
+@dataclass(frozen=True)
+class _PlainStatusResult:
+    id: str
+    check_id: str
+    platform_id: str
+    state: str
+    measured_at: str
+    created_at: str
+    observed_value: Optional[str] = None
+    message: Optional[str] = None
+    ingestion_run_id: Optional[str] = None
+
+
+COLUMNS = tuple(field.name for field in fields(StatusResult))
+
+
+def _fresh(value: Any) -> Any:
+    if isinstance(value, str):
+        return "".join(list(value))
+    return value
+
+
+def _rows(scale: SyntheticScale) -> list[tuple[Any, ...]]:
+    rows = []
+    for result in SyntheticData(scale).iter_status_results():
+        row = []
+        for name in COLUMNS:
+            value = getattr(result, name)
+            if name in ("measured_at", "created_at"):
+                value = parse_timestamp(value)
+            row.append(_fresh(value))
+        rows.append(tuple(row))
+    return rows
+
+
+def run(scale: SyntheticScale, rows: list[tuple[Any, ...]]) -> None:
+    print(f"{len(rows):,} rows across {scale.status_checks:,} checks")
+    plain_decode = compile_decoder(COLUMNS, _PlainStatusResult)
+    slotted_decode = compile_decoder(COLUMNS, StatusResult)
+
+    plain, plain_mib = retained_mib(lambda: [plain_decode(row) for row in rows])
+    slotted, slotted_mib = retained_mib(lambda: [slotted_decode(row) for row in rows])
+    print(f"  plain dataclass          {plain_mib:10.1f} MiB")
+    print(f"  slots + interning        {slotted_mib:10.1f} MiB  ({slotted_mib / plain_mib:.0%})")
+    assert [asdict(item) for item in plain[:100]] == [to_dict(item) for item in slotted[:100]]
+
+    print_table(
+        "decode rows",
+        [
+            measure("plain dataclass", lambda: [plain_decode(row) for row in rows]),
+            measure("slots + interning", lambda: [slotted_decode(row) for row in rows]),
+        ],
+    )
+    print_table(
+        "serialize for the API response",
+        [
+            measure("asdict, plain dataclass", lambda: [asdict(item) for item in plain]),
+            measure("to_dict, slotted", lambda: [to_dict(item) for item in slotted]),
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    scale = SyntheticScale(
+        platforms=25,
+        checks_per_platform=8,
+        results_per_check=max(1, args.rows // 200),
+        seed=args.seed,
+    )
+    run(scale, _rows(scale))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Memory and range-query cost: list of StatusResult vs the columnar TimeSeriesStore.
+
+Usage: ``python -m benchmarks.bench_result_store --checks 200 --results-per-check 500``
+
+Memory is the traced allocation retained by each representation after loading
+the same synthetic results. The query is a one-check, six-hour window page, as
+served by ``/status-results``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+from datetime import timedelta
+
+from app.db.decoders import parse_timestamp
+from app.db.models import StatusResult
+from app.db.queries import StatusResultQuery
+from app.db.synthetic import SyntheticData, SyntheticScale
+from app.db.timeseries import TimeSeriesStore
+from benchmarks._harness import measure, print_table, retained_mib
+
+
+def run(scale: SyntheticScale) -> None:
+    data = SyntheticData(scale)
+    results = data.status_results()
+    print(f"{len(results):,} results across {scale.status_checks:,} checks")
+
+    # Rebuild the objects so the list is charged for them; strings come from the
+    # generator on both sides, so neither representation pays for copying them.
+    rows, list_mib = retained_mib(lambda: [replace(item) for item in results])
+    store, store_mib = retained_mib(lambda: _build_store(results))
+    print(f"  list[StatusResult]   {list_mib:10.1f} MiB")
+    print(f"  TimeSeriesStore      {store_mib:10.1f} MiB  ({store_mib / list_mib:.0%})")
+
+    start = scale.start_at + timedelta(hours=1)
+    end = start + timedelta(hours=6)
+    check_id = data.check_id(0)
+    query = StatusResultQuery(check_id=check_id, start_at=start, end_at=end, limit=50)
+
+    def scan_list() -> list[StatusResult]:
+        matches = [
+            item
+            for item in rows
+            if item.check_id == check_id and start <= parse_timestamp(item.measured_at) <= end
+        ]
+        matches.sort(
+            key=lambda item: (
+                parse_timestamp(item.measured_at),
+                parse_timestamp(item.created_at),
+                item.id,
+            ),
+            reverse=True,
+        )
+        return matches[:50]
+
+    def query_store() -> list[StatusResult]:
+        return store.query(query).items
+
+    assert scan_list() == query_store()
+    print_table(
+        "one check, 6h window, newest 50",
+        [measure("list scan + sort", scan_list), measure("TimeSeriesStore.query", query_store)],
+    )
+
+
+def _build_store(results: list[StatusResult]) -> TimeSeriesStore:
+    store = TimeSeriesStore()
+    store.extend(results)
+    return store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checks", type=int, default=200)
+    parser.add_argument("--results-per-check", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(
+        SyntheticScale(
+            platforms=max(1, args.checks // 10),
+            checks_per_platform=min(10, args.checks),
+            results_per_check=args.results_per_check,
+            interval_minutes=5,
+            seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
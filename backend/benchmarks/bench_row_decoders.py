@@ -0,0 +1,89 @@
+"""Compare dict-then-dataclass row mapping with compiled row decoders.
+
+Usage: ``python -m benchmarks.bench_row_decoders --rows 100000,1000000``
+
+Both paths end with ``StatusResult`` instances from the same cursor tuples,
+including timestamp formatting, so the difference is the per-row overhead of
+the intermediate dict and the generic constructor call.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from app.db.decoders import format_timestamp
+from app.db.models import StatusResult
+from app.db.query import SqlQueryRunner
+from benchmarks._harness import InMemoryConnectionProvider, measure, parse_sizes, print_table
+
+COLUMNS = (
+    "id",
+    "check_id",
+    "platform_id",
+    "state",
+    "measured_at",
+    "observed_value",
+    "message",
+    "ingestion_run_id",
+    "created_at",
+)
+STATES = ("green", "green", "green", "yellow", "red", "unknown")
+SQL = "SELECT * FROM status_results"
+
+
+def _rows(count: int) -> list[tuple]:
+    start = datetime(2024, 7, 1, tzinfo=timezone.utc)
+    return [
+        (
+            f"result-{idx:08d}",
+            f"status-{idx % 2000:05d}",
+            f"platform-{idx % 50:03d}",
+            STATES[idx % len(STATES)],
+            start + timedelta(minutes=idx),
+            f"freshness={idx % 60}m",
+            None,
+            f"run-{idx // 2000:05d}",
+            start + timedelta(minutes=idx, seconds=30),
+        )
+        for idx in range(count)
+    ]
+
+
+def _from_dict(row: dict) -> StatusResult:
+    return StatusResult(
+        **{
+            key: format_timestamp(value) if isinstance(value, datetime) else value
+            for key, value in row.items()
+        }
+    )
+
+
+def run(sizes: list[int]) -> None:
+    for size in sizes:
+        runner = SqlQueryRunner(InMemoryConnectionProvider(COLUMNS, _rows(size)))
+
+        def dict_path() -> list[StatusResult]:
+            return [_from_dict(row) for row in runner.fetch_all(SQL)]
+
+        def decoder_path() -> list[StatusResult]:
+            return runner.fetch_models(SQL, StatusResult)
+
+        print_table(
+            f"{size:,} rows -> StatusResult",
+            [
+                measure("fetch_all + dict -> dataclass", dict_path),
+                measure("fetch_models (compiled decoder)", decoder_path),
+            ],
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", default="100000,1000000", type=parse_sizes)
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
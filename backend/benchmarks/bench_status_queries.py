@@ -0,0 +1,161 @@
+"""Status-result page queries over synthetic data: in-memory indexes vs embedded SQL.
+
+Usage: ``python -m benchmarks.bench_status_queries --platforms 50 --results-per-check 288``
+
+Both repositories are loaded from the same ``SyntheticData`` and answer the same
+queries: the newest page overall, one check's history, a platform over a
+six-hour window, and the latest result per check behind ``/status-results/latest``.
+The last table charts one check's whole history: walking raw 200-row pages as a
+client of ``/status-results`` must, against ``/status-results/timeseries`` buckets.
+The SLA table reports every check over the whole history, first with an empty
+per-day cache and then with every completed day cached.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+from datetime import timedelta
+
+from app.db.databricks import DatabricksRepository
+from app.db.embedded import EmbeddedWarehouse
+from app.db.queries import SlaQuery, StatusBucketQuery, StatusResultQuery
+from app.db.query import SqlQueryRunner
+from app.db.sla import SlaDayCache
+from app.db.synthetic import SyntheticData, SyntheticScale
+from benchmarks._harness import measure, print_table
+
+ITERATIONS = 200
+
+
+def _queries(data: SyntheticData) -> dict[str, StatusResultQuery]:
+    scale = data.scale
+    window_start = scale.start_at + timedelta(hours=1)
+    return {
+        "newest page": StatusResultQuery(limit=50),
+        "one check": StatusResultQuery(check_id=data.check_id(0), limit=50),
+        "platform, 6h window": StatusResultQuery(
+            platform_id=data.platform_id(0),
+            start_at=window_start,
+            end_at=window_start + timedelta(hours=6),
+            limit=50,
+        ),
+    }
+
+
+def run(scale: SyntheticScale) -> None:
+    data = SyntheticData(scale)
+    print(
+        f"{scale.platforms} platforms, {scale.status_checks:,} checks,"
+        f" up to {scale.expected_results:,} results"
+    )
+    local = data.build_repository()
+    warehouse = EmbeddedWarehouse()
+    data.load_warehouse(warehouse)
+    warehouse_repository = DatabricksRepository(SqlQueryRunner(warehouse))
+    try:
+        for label, query in _queries(data).items():
+
+            def local_path(query: StatusResultQuery = query) -> None:
+                for _ in range(ITERATIONS):
+                    local.query_status_results(query)
+
+            def sql_path(query: StatusResultQuery = query) -> None:
+                for _ in range(ITERATIONS):
+                    warehouse_repository.query_status_results(query)
+
+            print_table(
+                f"{label} x{ITERATIONS}",
+                [
+                    measure("embedded SQL", sql_path, repeat=1),
+                    measure("LocalFixtureRepository", local_path, repeat=1),
+                ],
+            )
+
+        latest = StatusResultQuery(limit=50)
+
+        def local_latest() -> None:
+            for _ in range(ITERATIONS):
+                local.query_latest_status_results(latest)
+
+        def sql_latest() -> None:
+            for _ in range(ITERATIONS):
+                warehouse_repository.query_latest_status_results(latest)
+
+        print_table(
+            f"latest per check x{ITERATIONS}",
+            [
+                measure("embedded SQL", sql_latest, repeat=1),
+                measure("LocalFixtureRepository", local_latest, repeat=1),
+            ],
+        )
+
+        chart_check = data.check_id(0)
+
+        def raw_pages(repository) -> None:
+            query = StatusResultQuery(check_id=chart_check, limit=200, include_total=False)
+            while True:
+                page = repository.query_status_results(query)
+                if page.next_cursor is None:
+                    break
+                query = replace(query, cursor=page.next_cursor)
+
+        buckets = StatusBucketQuery(check_id=chart_check)
+        print_table(
+            "chart one check's history",
+            [
+                measure("raw pages, embedded SQL", lambda: raw_pages(warehouse_repository)),
+                measure("raw pages, in memory", lambda: raw_pages(local)),
+                measure(
+                    "buckets, embedded SQL",
+                    lambda: warehouse_repository.query_status_buckets(buckets),
+                ),
+                measure("buckets, in memory", lambda: local.query_status_buckets(buckets)),
+            ],
+        )
+
+        span = timedelta(minutes=scale.results_per_check * scale.interval_minutes)
+        sla = SlaQuery(
+            start_at=scale.start_at, end_at=scale.start_at + timedelta(days=span.days + 1)
+        )
+        snapshot = local.snapshot()
+        snapshot.query_sla(sla)
+        warehouse_repository.query_sla(sla)
+        print_table(
+            f"SLA report, {span.days + 1} days",
+            [
+                measure(
+                    "cold, embedded SQL",
+                    lambda: DatabricksRepository(SqlQueryRunner(warehouse)).query_sla(sla),
+                ),
+                measure(
+                    "cold, in memory",
+                    lambda: replace(snapshot, sla_days=SlaDayCache()).query_sla(sla),
+                ),
+                measure("cached days, embedded SQL", lambda: warehouse_repository.query_sla(sla)),
+                measure("cached days, in memory", lambda: snapshot.query_sla(sla)),
+            ],
+        )
+    finally:
+        warehouse.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--platforms", type=int, default=50)
+    parser.add_argument("--checks-per-platform", type=int, default=8)
+    parser.add_argument("--results-per-check", type=int, default=288)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(
+        SyntheticScale(
+            platforms=args.platforms,
+            checks_per_platform=args.checks_per_platform,
+            results_per_check=args.results_per_check,
+            seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
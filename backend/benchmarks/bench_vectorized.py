@@ -0,0 +1,85 @@
+"""Status-result queries at scale: pure-Python heap merge vs the NumPy ``ResultFrame``.
+
+Usage: ``python -m benchmarks.bench_vectorized --results 1000000``
+
+Both stores share the same synthetic series; one has ``vectorize=False``. Each
+NumPy query builds a frame over its own candidate rows, so that cost is part of
+every timing. Queries merge across every check: a deep page, an export of one
+platform's day, and an export of a six-hour window.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+from functools import partial
+
+from app.db.queries import StatusResultQuery
+from app.db.synthetic import SyntheticData, SyntheticScale
+from app.db.timeseries import TimeSeriesStore
+from app.db.vectorized import load_numpy
+from benchmarks._harness import measure, print_table
+
+CHECKS_PER_PLATFORM = 10
+
+
+def run(scale: SyntheticScale) -> None:
+    if load_numpy() is None:
+        raise SystemExit("numpy is not installed; nothing to compare")
+    data = SyntheticData(scale)
+    vectorized = TimeSeriesStore()
+    vectorized.extend(data.iter_status_results())
+    # Shares every series; only the query path differs.
+    python = vectorized.with_results(())
+    python.vectorize = False
+    print(f"{len(python):,} results across {scale.status_checks:,} checks")
+
+    day_start = scale.start_at + timedelta(days=1)
+    window_start = scale.start_at + timedelta(hours=12)
+    queries = {
+        "deep page (offset 100k)": StatusResultQuery(
+            offset=min(100_000, len(python) // 2), limit=50
+        ),
+        "platform, one day, all rows": StatusResultQuery(
+            platform_id=data.platform_id(0),
+            start_at=day_start,
+            end_at=day_start + timedelta(days=1),
+            limit=None,
+        ),
+        "6h window, all rows": StatusResultQuery(
+            start_at=window_start, end_at=window_start + timedelta(hours=6), limit=None
+        ),
+    }
+    for label, query in queries.items():
+        assert python.query(query) == vectorized.query(query)
+        print_table(
+            label,
+            [
+                measure("heap merge", partial(python.query, query)),
+                measure("NumPy ResultFrame", partial(vectorized.query, query)),
+            ],
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--results", type=int, default=1_000_000)
+    parser.add_argument("--checks", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    checks = max(1, args.checks)
+    run(
+        SyntheticScale(
+            platforms=max(1, checks // CHECKS_PER_PLATFORM),
+            checks_per_platform=min(CHECKS_PER_PLATFORM, checks),
+            results_per_check=max(1, args.results // checks),
+            interval_minutes=5,
+            status_messages=0,
+            work_items=0,
+            seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Tests for the service principal OAuth token provider."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import pytest
+
+from app.auth.tokens import (
+    AccessToken,
+    OAuthTokenProvider,
+    TokenRefreshError,
+    client_credentials_fetcher,
+)
+from app.db import connection as connection_module
+from app.db.connection import DatabricksSqlConnector, WarehouseConfig
+from app.db.pool import PoolConfig, ThreadSafeConnectionPool
+
+
+class _TokenEndpoint:
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+        self.delay_seconds = 0.0
+        self.expires_in = 3600
+        self.fail = False
+        self._lock = threading.Lock()
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                length = int(self.headers.get("Content-Length", "0"))
+                body = self.rfile.read(length).decode("utf-8")
+                with endpoint._lock:
+                    endpoint.requests.append(
+                        {
+                            "path": self.path,
+                            "body": body,
+                            "authorization": self.headers.get("Authorization"),
+                        }
+                    )
+                    number = len(endpoint.requests)
+                time.sleep(endpoint.delay_seconds)
+                if endpoint.fail:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                payload = json.dumps(
+                    {"access_token": f"token-{number}", "expires_in": endpoint.expires_in}
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        return Handler
+
+
+@pytest.fixture
+def token_endpoint() -> Iterator[tuple[_TokenEndpoint, str]]:
+    endpoint = _TokenEndpoint()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), endpoint.handler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/oidc/v1/token"
+    try:
+        yield endpoint, url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_client_credentials_request(token_endpoint) -> None:
+    endpoint, url = token_endpoint
+    fetch = client_credentials_fetcher(url, "client", "secret", clock=lambda: 100.0)
+
+    token = fetch()
+
+    assert token == AccessToken(value="token-1", expires_at=3700.0)
+    request = endpoint.requests[0]
+    assert request["path"] == "/oidc/v1/token"
+    assert "grant_type=client_credentials" in request["body"]
+    assert "scope=all-apis" in request["body"]
+    assert request["authorization"] == "Basic Y2xpZW50OnNlY3JldA=="
+
+
+def test_concurrent_callers_share_one_refresh(token_endpoint) -> None:
+    endpoint, url = token_endpoint
+    endpoint.delay_seconds = 0.1
+    provider = OAuthTokenProvider(client_credentials_fetcher(url, "client", "secret"))
+    results: list[str] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(provider.get_token())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == ["token-1"] * 8
+    assert len(endpoint.requests) == 1
+
+
+def test_token_is_refreshed_ahead_of_expiry(token_endpoint) -> None:
+    endpoint, url = token_endpoint
+    clock = _Clock()
+    provider = OAuthTokenProvider(
+        client_credentials_fetcher(url, "client", "secret", clock=clock),
+        refresh_margin_seconds=300,
+        clock=clock,
+    )
+
+    assert provider.get_token() == "token-1"
+    clock.now += 3000
+    assert provider.get_token() == "token-1"
+    clock.now += 400
+    assert provider.get_token() == "token-2"
+    assert provider.refresh_count == 2
+
+
+def test_failed_refresh_keeps_still_valid_token(token_endpoint) -> None:
+    endpoint, url = token_endpoint
+    clock = _Clock()
+    provider = OAuthTokenProvider(
+        client_credentials_fetcher(url, "client", "secret", clock=clock),
+        refresh_margin_seconds=300,
+        clock=clock,
+    )
+    provider.get_token()
+    endpoint.fail = True
+
+    clock.now += 3400
+    assert provider.get_token() == "token-1"
+
+    clock.now += 300
+    with pytest.raises(TokenRefreshError):
+        provider.get_token()
+
+
+def test_background_refresh_fetches_before_first_use(token_endpoint) -> None:
+    endpoint, url = token_endpoint
+    provider = OAuthTokenProvider(client_credentials_fetcher(url, "client", "secret"))
+
+    provider.start()
+    try:
+        deadline = time.monotonic() + 5
+        while provider.refresh_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        provider.stop()
+
+    assert provider.refresh_count == 1
+    assert provider.header_factory() == {"Authorization": "Bearer token-1"}
+
+
+def test_connector_passes_shared_credentials_provider(monkeypatch) -> None:
+    captured: list[dict[str, Any]] = []
+
+    class _FakeSql:
+        @staticmethod
+        def connect(**kwargs: Any) -> object:
+            captured.append(kwargs)
+            return object()
+
+    monkeypatch.setattr(connection_module, "_load_databricks_sql", lambda: _FakeSql)
+    provider = OAuthTokenProvider(lambda: AccessToken("abc", time.time() + 3600))
+    config = WarehouseConfig(
+        server_hostname="example.cloud.databricks.com",
+        http_path="/sql/1.0/warehouses/1",
+        client_id="client",
+        client_secret="secret",
+    )
+    connector = DatabricksSqlConnector(config, token_provider=provider)
+
+    connector.connect()
+    connector.connect()
+
+    assert "access_token" not in captured[0]
+    factories = [kwargs["credentials_provider"]() for kwargs in captured]
+    assert all(factory() == {"Authorization": "Bearer abc"} for factory in factories)
+
+
+def test_client_credentials_build_token_provider() -> None:
+    config = WarehouseConfig(
+        server_hostname="example.cloud.databricks.com",
+        http_path="/sql/1.0/warehouses/1",
+        client_id="client",
+        client_secret="secret",
+    )
+
+    assert config.is_configured() is True
+    assert DatabricksSqlConnector(config).token_provider is not None
+    assert DatabricksSqlConnector(WarehouseConfig()).token_provider is None
+
+
+def test_pool_lifetimes_are_jittered() -> None:
+    values = iter([0.0, 1.0])
+    pool = ThreadSafeConnectionPool(
+        _Closable,
+        PoolConfig(min_size=0, max_size=2, max_lifetime_seconds=100, lifetime_jitter=0.2),
+        validator=lambda connection: True,
+        clock=lambda: 0.0,
+        rng=lambda: next(values),
+    )
+
+    first = pool.acquire()
+    second = pool.acquire()
+    lifetimes = sorted(entry.max_lifetime for entry in pool._in_use.values())
+
+    assert lifetimes == [80.0, 100.0]
+    pool.release(first)
+    pool.release(second)
+
+
+class _Closable:
+    def cursor(self):  # pragma: no cover - never used
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return None
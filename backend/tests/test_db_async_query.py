@@ -0,0 +1,77 @@
+"""Tests for the async query runner."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.db.async_query import AsyncQueryRunner
+from app.db.query import MockQueryRunner, QueryCall, QueryTimeoutError
+
+
+class _BlockingRunner(MockQueryRunner):
+    def __init__(self) -> None:
+        super().__init__({"select 1": [{"value": 1}]})
+        self.gate = threading.Event()
+        self.threads: list[str] = []
+
+    def fetch_all(self, sql, params=None):
+        self.threads.append(threading.current_thread().name)
+        self.gate.wait(timeout=2)
+        return super().fetch_all(sql, params)
+
+
+def test_async_runner_delegates_and_records_calls() -> None:
+    mock = MockQueryRunner({"select 1": [{"value": 1}]})
+    runner = AsyncQueryRunner(mock, max_workers=2)
+
+    async def scenario() -> None:
+        assert await runner.fetch_all("select 1") == [{"value": 1}]
+        assert await runner.fetch_one("select 1") == {"value": 1}
+        await runner.execute("update platforms set state = :state", {"state": "ok"})
+
+    asyncio.run(scenario())
+    runner.shutdown()
+
+    assert mock.calls == [
+        QueryCall(sql="select 1", params=None),
+        QueryCall(sql="select 1", params=None),
+        QueryCall(sql="update platforms set state = :state", params={"state": "ok"}),
+    ]
+
+
+def test_async_runner_uses_dedicated_executor() -> None:
+    blocking = _BlockingRunner()
+    blocking.gate.set()
+    runner = AsyncQueryRunner(blocking, max_workers=1)
+
+    asyncio.run(runner.fetch_all("select 1"))
+    runner.shutdown()
+
+    assert blocking.threads[0].startswith("warehouse-query")
+
+
+def test_async_runner_times_out_without_blocking_loop() -> None:
+    blocking = _BlockingRunner()
+    runner = AsyncQueryRunner(blocking, max_workers=1)
+
+    async def scenario() -> None:
+        with pytest.raises(QueryTimeoutError):
+            await runner.fetch_all("select 1", timeout=0.05)
+
+    asyncio.run(scenario())
+    blocking.gate.set()
+    runner.shutdown()
+
+
+def test_async_iter_rows_streams_batches() -> None:
+    mock = MockQueryRunner({"select id": [{"id": idx} for idx in range(5)]})
+    runner = AsyncQueryRunner(mock, max_workers=1)
+
+    async def scenario() -> list[int]:
+        return [row["id"] async for row in runner.iter_rows("select id", batch_size=2)]
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+    runner.shutdown()
@@ -0,0 +1,82 @@
+"""Tests for bulk write statement builders."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.db.bulk import (
+    build_insert_statements,
+    build_merge_statements,
+    bulk_insert,
+    bulk_merge,
+)
+from app.db.query import MockQueryRunner
+
+COLUMNS = ("id", "check_id", "state")
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {"id": f"result-{idx}", "check_id": "status-001", "state": "green"} for idx in range(count)
+    ]
+
+
+def test_insert_packs_rows_within_param_budget() -> None:
+    statements = list(build_insert_statements("status_results", COLUMNS, _rows(7), max_params=9))
+
+    assert [statement.row_count for statement in statements] == [3, 3, 1]
+    first = statements[0]
+    assert first.sql == (
+        "INSERT INTO status_results (id, check_id, state) VALUES "
+        "(:p0, :p1, :p2), (:p3, :p4, :p5), (:p6, :p7, :p8)"
+    )
+    assert first.params["p3"] == "result-1"
+    assert statements[2].params == {"p0": "result-6", "p1": "status-001", "p2": "green"}
+
+
+def test_insert_respects_statement_size_budget() -> None:
+    statements = list(
+        build_insert_statements("status_results", COLUMNS, _rows(10), max_statement_bytes=150)
+    )
+
+    assert len(statements) > 1
+    assert sum(statement.row_count for statement in statements) == 10
+    assert all(len(statement.sql) <= 150 for statement in statements)
+
+
+def test_merge_statement_shape() -> None:
+    (statement,) = build_merge_statements(
+        "main.portal.votes",
+        ("id", "user_id", "value"),
+        ("id",),
+        [("vote-1", "alice", 1), ("vote-2", "bob", -1)],
+    )
+
+    assert statement.sql == (
+        "MERGE INTO main.portal.votes AS target USING (SELECT * FROM VALUES "
+        "(:p0, :p1, :p2), (:p3, :p4, :p5) AS source(id, user_id, value)) AS source "
+        "ON target.id = source.id "
+        "WHEN MATCHED THEN UPDATE SET target.user_id = source.user_id, "
+        "target.value = source.value "
+        "WHEN NOT MATCHED THEN INSERT (id, user_id, value) "
+        "VALUES (source.id, source.user_id, source.value)"
+    )
+    assert statement.row_count == 2
+
+
+def test_builders_reject_unsafe_identifiers() -> None:
+    with pytest.raises(ValueError):
+        list(build_insert_statements("status_results; DROP TABLE x", COLUMNS, _rows(1)))
+    with pytest.raises(ValueError):
+        list(build_insert_statements("status_results", ("id", "state)"), _rows(1)))
+
+
+def test_bulk_helpers_execute_through_runner() -> None:
+    runner = MockQueryRunner()
+
+    inserted = bulk_insert(runner, "status_results", COLUMNS, _rows(5), max_params=6)
+    merged = bulk_merge(runner, "status_results", COLUMNS, ("id",), _rows(2))
+
+    assert (inserted, merged) == (5, 2)
+    assert len(runner.calls) == 4
+    assert runner.calls[-1].sql.startswith("MERGE INTO status_results")
@@ -0,0 +1,99 @@
+"""Tests for the caching query runner."""
+
+from __future__ import annotations
+
+from app.db.cache import CachingQueryRunner, referenced_tables
+from app.db.query import MockQueryRunner
+
+PLATFORMS_SQL = "SELECT id, name FROM main.portal.platforms WHERE state = :state"
+RESULTS_SQL = "SELECT r.id FROM status_results r JOIN status_checks c ON c.id = r.check_id"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _runner(**kwargs) -> tuple[CachingQueryRunner, MockQueryRunner]:
+    mock = MockQueryRunner(
+        {
+            PLATFORMS_SQL: [{"id": "platform-001", "name": "Databricks"}],
+            RESULTS_SQL: [{"id": "result-001"}],
+        }
+    )
+    return CachingQueryRunner(mock, **kwargs), mock
+
+
+def test_referenced_tables_strips_qualifiers() -> None:
+    assert referenced_tables(PLATFORMS_SQL) == {"platforms"}
+    assert referenced_tables(RESULTS_SQL) == {"status_results", "status_checks"}
+    assert referenced_tables("MERGE INTO `cat`.`sch`.`votes` USING staged") == {
+        "votes",
+        "staged",
+    }
+
+
+def test_repeated_reads_hit_cache() -> None:
+    runner, mock = _runner()
+
+    first = runner.fetch_all(PLATFORMS_SQL, {"state": "active"})
+    first[0]["name"] = "mutated"
+    second = runner.fetch_all(PLATFORMS_SQL, {"state": "active"})
+    runner.fetch_all(PLATFORMS_SQL, {"state": "retired"})
+
+    assert second == [{"id": "platform-001", "name": "Databricks"}]
+    assert len(mock.calls) == 2
+    stats = runner.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    runner, mock = _runner(
+        default_ttl_seconds=60, table_ttl_seconds={"status_results": 5}, clock=clock
+    )
+    runner.fetch_all(PLATFORMS_SQL)
+    runner.fetch_all(RESULTS_SQL)
+    clock.now = 10
+
+    runner.fetch_all(PLATFORMS_SQL)
+    runner.fetch_all(RESULTS_SQL)
+
+    assert len(mock.calls) == 3
+    assert runner.stats().expirations == 1
+
+
+def test_execute_invalidates_tagged_entries() -> None:
+    runner, mock = _runner()
+    runner.fetch_all(PLATFORMS_SQL)
+    runner.fetch_all(RESULTS_SQL)
+
+    runner.execute("UPDATE platforms SET state = :state", {"state": "retired"})
+    runner.fetch_all(PLATFORMS_SQL)
+    runner.fetch_all(RESULTS_SQL)
+
+    assert [call.sql for call in mock.calls].count(PLATFORMS_SQL) == 2
+    assert [call.sql for call in mock.calls].count(RESULTS_SQL) == 1
+    assert runner.stats().invalidations == 1
+
+
+def test_ingestion_signal_invalidates_results() -> None:
+    runner, _ = _runner()
+    runner.fetch_all(PLATFORMS_SQL)
+    runner.fetch_all(RESULTS_SQL)
+
+    assert runner.on_ingestion_complete("run-042") == 1
+    assert runner.stats().entries == 1
+
+
+def test_lru_eviction_respects_max_entries() -> None:
+    runner, mock = _runner(max_entries=1)
+    runner.fetch_all(PLATFORMS_SQL)
+    runner.fetch_all(RESULTS_SQL)
+    runner.fetch_all(PLATFORMS_SQL)
+
+    assert len(mock.calls) == 3
+    assert runner.stats().evictions == 2
@@ -0,0 +1,242 @@
+"""Tests for the warehouse circuit breaker."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1 import status_results
+from app.db.circuit import (
+    STATE_CLOSED,
+    STATE_OPEN,
+    BreakerConfig,
+    CircuitBreaker,
+    CircuitBreakerQueryRunner,
+    CircuitOpenError,
+    LastGoodResults,
+)
+from app.db.databricks import DatabricksRepository
+from app.db.embedded import EmbeddedWarehouse
+from app.db.query import MockQueryRunner, QueryError, QueryTimeoutError, SqlQueryRunner
+from app.main import create_app
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FlakyRunner(MockQueryRunner):
+    def __init__(self) -> None:
+        super().__init__({"SELECT * FROM platforms": [{"id": "p-1"}]})
+        self.failing = False
+        self.error: Exception = ConnectionError("warehouse unavailable")
+        self.delay_seconds = 0.0
+        self.release = threading.Event()
+
+    def fetch_all(self, sql, params=None):
+        if self.delay_seconds:
+            self.release.wait(self.delay_seconds)
+        if self.failing:
+            raise self.error
+        return super().fetch_all(sql, params)
+
+
+def _guarded(clock: _Clock, **config) -> tuple[CircuitBreakerQueryRunner, _FlakyRunner]:
+    runner = _FlakyRunner()
+    breaker = CircuitBreaker(BreakerConfig(**config), clock=clock)
+    return CircuitBreakerQueryRunner(runner, breaker, LastGoodResults(clock=clock)), runner
+
+
+def _raise(error: Exception) -> None:
+    raise error
+
+
+def test_open_breaker_serves_last_good_result_with_age() -> None:
+    clock = _Clock()
+    guarded, runner = _guarded(clock, failure_threshold=2, call_timeout_seconds=None)
+    assert guarded.fetch_result("SELECT * FROM platforms").stale is False
+
+    runner.failing = True
+    clock.now = 10
+    first = guarded.fetch_result("SELECT * FROM platforms")
+    guarded.fetch_result("SELECT * FROM platforms")
+    calls_when_opened = len(runner.calls)
+    clock.now = 12
+    served = guarded.fetch_result("SELECT * FROM platforms")
+
+    assert first.stale is True
+    assert guarded.breaker.state == STATE_OPEN
+    assert served.rows == [{"id": "p-1"}]
+    assert served.stale is True
+    assert served.age_seconds == 12
+    assert len(runner.calls) == calls_when_opened
+    assert guarded.breaker.stats().stale_served == 3
+
+
+def test_endpoint_marks_responses_served_from_last_good_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = _Clock()
+    warehouse = EmbeddedWarehouse()
+    warehouse.load_fixtures()
+    breaker = CircuitBreaker(
+        BreakerConfig(failure_threshold=1, call_timeout_seconds=None, open_seconds=60), clock=clock
+    )
+    guarded = CircuitBreakerQueryRunner(
+        SqlQueryRunner(warehouse), breaker, LastGoodResults(clock=clock)
+    )
+    monkeypatch.setattr(status_results, "get_repository", lambda: DatabricksRepository(guarded))
+    client = TestClient(create_app())
+    params = {"check_id": "status-001"}
+
+    fresh = client.get("/api/v1/status-results", params=params)
+    assert fresh.status_code == 200
+    assert "X-Data-Stale" not in fresh.headers
+
+    with pytest.raises(ConnectionError):
+        breaker.call(_raise, ConnectionError("warehouse unavailable"))
+    clock.now = 42
+    stale = client.get("/api/v1/status-results", params=params)
+
+    assert breaker.state == STATE_OPEN
+    assert stale.status_code == 200
+    assert stale.json() == fresh.json()
+    assert stale.headers["X-Data-Stale"] == "true"
+    assert stale.headers["X-Data-Age-Seconds"] == "42"
+    warehouse.close()
+
+
+def test_open_breaker_without_fallback_raises() -> None:
+    clock = _Clock()
+    guarded, runner = _guarded(clock, failure_threshold=1, call_timeout_seconds=None)
+    runner.failing = True
+
+    with pytest.raises(ConnectionError):
+        guarded.fetch_all("SELECT * FROM platforms")
+    with pytest.raises(CircuitOpenError):
+        guarded.fetch_all("SELECT * FROM platforms")
+    with pytest.raises(CircuitOpenError):
+        guarded.iter_rows("SELECT * FROM platforms")
+
+
+def test_half_open_trial_closes_breaker_after_cooldown() -> None:
+    clock = _Clock()
+    guarded, runner = _guarded(
+        clock, failure_threshold=1, open_seconds=30, call_timeout_seconds=None
+    )
+    runner.failing = True
+    with pytest.raises(ConnectionError):
+        guarded.fetch_all("SELECT * FROM platforms")
+
+    runner.failing = False
+    clock.now = 29
+    with pytest.raises(CircuitOpenError):
+        guarded.fetch_all("SELECT * FROM platforms")
+    clock.now = 30
+
+    assert guarded.fetch_all("SELECT * FROM platforms") == [{"id": "p-1"}]
+    assert guarded.breaker.state == STATE_CLOSED
+
+
+def test_caller_errors_neither_trip_the_breaker_nor_serve_stale_rows() -> None:
+    clock = _Clock()
+    guarded, runner = _guarded(clock, failure_threshold=1, call_timeout_seconds=None)
+    guarded.fetch_all("SELECT * FROM platforms")
+
+    runner.error = QueryError("syntax error near FORM")
+    runner.failing = True
+    for _ in range(3):
+        with pytest.raises(QueryError):
+            guarded.fetch_result("SELECT * FROM platforms")
+
+    assert guarded.breaker.state == STATE_CLOSED
+    assert guarded.breaker.stats().failures == 0
+    assert guarded.breaker.stats().stale_served == 0
+
+
+def test_caller_error_on_the_half_open_trial_frees_the_trial() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        BreakerConfig(failure_threshold=1, open_seconds=30, call_timeout_seconds=None),
+        clock=clock,
+    )
+
+    def unreachable() -> None:
+        raise ConnectionError("warehouse unavailable")
+
+    def bad_parameters() -> None:
+        raise ValueError("limit must be an integer")
+
+    with pytest.raises(ConnectionError):
+        breaker.call(unreachable)
+    clock.now = 30
+    with pytest.raises(ValueError):
+        breaker.call(bad_parameters)
+
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == STATE_CLOSED
+
+
+def test_slow_calls_trip_the_breaker() -> None:
+    clock = _Clock()
+    runner = MockQueryRunner({"SELECT 1": [{"one": 1}]})
+    breaker = CircuitBreaker(
+        BreakerConfig(failure_threshold=2, slow_call_seconds=1.0, call_timeout_seconds=None),
+        clock=clock,
+    )
+
+    def slow_fetch(sql: str, params=None):
+        clock.now += 2
+        return runner.fetch_all(sql, params)
+
+    breaker.call(slow_fetch, "SELECT 1")
+    breaker.call(slow_fetch, "SELECT 1")
+
+    assert breaker.state == STATE_OPEN
+    assert breaker.stats().slow_calls == 2
+
+
+def test_call_timeout_bounds_latency_and_falls_back() -> None:
+    guarded, runner = _guarded(_Clock(), failure_threshold=5, call_timeout_seconds=0.05)
+    guarded.fetch_all("SELECT * FROM platforms")
+    runner.delay_seconds = 5.0
+
+    start = time.monotonic()
+    result = guarded.fetch_result("SELECT * FROM platforms")
+    elapsed = time.monotonic() - start
+    runner.release.set()
+
+    assert elapsed < 1.0
+    assert result.stale is True
+    assert guarded.breaker.stats().timeouts == 1
+    guarded.breaker.stop()
+
+
+def test_timeout_without_fallback_raises_query_timeout() -> None:
+    guarded, runner = _guarded(_Clock(), call_timeout_seconds=0.05)
+    runner.delay_seconds = 5.0
+
+    with pytest.raises(QueryTimeoutError):
+        guarded.fetch_all("SELECT * FROM platforms")
+    runner.release.set()
+    guarded.breaker.stop()
+
+
+def test_probe_closes_open_breaker() -> None:
+    clock = _Clock()
+    guarded, runner = _guarded(clock, failure_threshold=1, call_timeout_seconds=None)
+    runner.failing = True
+    with pytest.raises(ConnectionError):
+        guarded.fetch_all("SELECT * FROM platforms")
+
+    assert guarded.breaker.probe_once(lambda: runner.fetch_all("SELECT 1")) is False
+    runner.failing = False
+    assert guarded.breaker.probe_once(guarded.probe) is True
+    assert guarded.breaker.state == STATE_CLOSED
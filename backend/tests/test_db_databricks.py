@@ -0,0 +1,309 @@
+"""Tests for the Databricks repository against the embedded warehouse."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from app.db.databricks import DatabricksRepository
+from app.db.decoders import parse_timestamp
+from app.db.embedded import EmbeddedWarehouse
+from app.db.fixtures import LocalFixtureRepository
+from app.db.instrumentation import QueryMetrics
+from app.db.mock_data import (
+    DEFAULT_PLATFORMS,
+    DEFAULT_STATUS_CHECKS,
+    DEFAULT_STATUS_MESSAGES,
+    DEFAULT_STATUS_RESULTS,
+)
+from app.db.queries import (
+    PlatformQuery,
+    SlaQuery,
+    StatusBucketQuery,
+    StatusCheckQuery,
+    StatusMessageQuery,
+    StatusResultQuery,
+)
+from app.db.query import SqlQueryRunner
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.queries: list[QueryMetrics] = []
+
+    def on_query(self, metrics: QueryMetrics) -> None:
+        self.queries.append(metrics)
+
+
+def _newest_first(results):
+    return sorted(
+        results,
+        key=lambda item: (item.measured_at, item.created_at, item.id),
+        reverse=True,
+    )
+
+
+@pytest.fixture
+def warehouse():
+    embedded = EmbeddedWarehouse()
+    embedded.load_fixtures()
+    yield embedded
+    embedded.close()
+
+
+@pytest.fixture
+def recorder() -> _Recorder:
+    return _Recorder()
+
+
+@pytest.fixture
+def repository(warehouse: EmbeddedWarehouse, recorder: _Recorder) -> DatabricksRepository:
+    return DatabricksRepository(SqlQueryRunner(warehouse, observer=recorder))
+
+
+def test_reads_platforms_and_checks(repository: DatabricksRepository) -> None:
+    platform = DEFAULT_PLATFORMS[0]
+
+    assert {item.id for item in repository.list_platforms()} == {
+        item.id for item in DEFAULT_PLATFORMS
+    }
+    assert repository.get_platform(platform.id) == platform
+    assert repository.get_platform("missing") is None
+    checks = repository.list_status_checks(platform.id)
+    assert {item.id for item in checks} == {
+        item.id for item in DEFAULT_STATUS_CHECKS if item.platform_id == platform.id
+    }
+    assert repository.get_status_check(checks[0].id) == checks[0]
+
+
+def test_query_pushes_filters_ordering_and_limit_into_sql(
+    repository: DatabricksRepository, recorder: _Recorder
+) -> None:
+    platform_id = DEFAULT_STATUS_RESULTS[0].platform_id
+    expected = _newest_first(
+        item for item in DEFAULT_STATUS_RESULTS if item.platform_id == platform_id
+    )
+
+    page = repository.query_status_results(StatusResultQuery(platform_id=platform_id, limit=1))
+
+    assert page.items == expected[:1]
+    assert page.total == len(expected)
+    assert page.next_cursor is not None
+    [query] = recorder.queries
+    # The page plus one look-ahead row; the total rides along on a window count.
+    assert query.rows == 2
+    assert "LIMIT :limit" in query.sql and "ORDER BY measured_at DESC" in query.sql
+
+
+def test_query_time_range_and_cursor_pages(repository: DatabricksRepository) -> None:
+    ordered = _newest_first(DEFAULT_STATUS_RESULTS)
+    start, end = ordered[-2].measured_at, ordered[1].measured_at
+    expected = [item for item in ordered if start <= item.measured_at <= end]
+    query = StatusResultQuery(start_at=parse_timestamp(start), end_at=parse_timestamp(end), limit=2)
+
+    first = repository.query_status_results(query)
+    second = repository.query_status_results(replace(query, cursor=first.next_cursor))
+    by_offset = repository.query_status_results(replace(query, offset=2))
+
+    assert first.total == second.total == len(expected)
+    assert first.items + second.items == expected[:4]
+    assert by_offset.items == second.items
+
+
+def test_query_past_last_page_still_reports_total(
+    repository: DatabricksRepository, recorder: _Recorder
+) -> None:
+    page = repository.query_status_results(StatusResultQuery(offset=len(DEFAULT_STATUS_RESULTS)))
+
+    assert page.items == []
+    assert page.total == len(DEFAULT_STATUS_RESULTS)
+    assert len(recorder.queries) == 2
+
+    recorder.queries.clear()
+    page = repository.query_status_results(StatusResultQuery(limit=3, include_total=False))
+    assert page.items == _newest_first(DEFAULT_STATUS_RESULTS)[:3]
+    assert page.total is None
+    assert "COUNT" not in recorder.queries[0].sql
+
+
+def test_query_status_messages_hides_soft_deleted(
+    repository: DatabricksRepository, warehouse: EmbeddedWarehouse
+) -> None:
+    deleted = DEFAULT_STATUS_MESSAGES[0]
+    SqlQueryRunner(warehouse).execute(
+        "UPDATE status_messages SET is_deleted = 1 WHERE id = :id", {"id": deleted.id}
+    )
+
+    page = repository.query_status_messages(StatusMessageQuery(limit=200))
+
+    assert deleted not in page.items
+    assert page.total == len(DEFAULT_STATUS_MESSAGES) - 1
+
+
+def test_tables_are_qualified_and_writes_are_rejected(warehouse: EmbeddedWarehouse) -> None:
+    with pytest.raises(ValueError):
+        DatabricksRepository(SqlQueryRunner(warehouse), catalog="main; DROP", schema="portal")
+    with pytest.raises(ValueError):
+        DatabricksRepository(SqlQueryRunner(warehouse), catalog="main")
+
+    repository = DatabricksRepository(SqlQueryRunner(warehouse))
+    with pytest.raises(NotImplementedError):
+        repository.create_platform(DEFAULT_PLATFORMS[0])
+    with pytest.raises(NotImplementedError):
+        repository.list_work_items()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        StatusResultQuery(limit=4),
+        StatusResultQuery(platform_id="platform-001", limit=2, offset=1),
+        StatusResultQuery(check_id="status-001", descending=False),
+        StatusResultQuery(start_at=parse_timestamp("2024-07-18T08:00:00+00:00"), limit=None),
+    ],
+)
+def test_query_matches_local_fixture_repository(
+    repository: DatabricksRepository, query: StatusResultQuery
+) -> None:
+    assert repository.query_status_results(query) == LocalFixtureRepository().query_status_results(
+        query
+    )
+
+
+@pytest.mark.parametrize(
+    ("method", "query"),
+    [
+        ("query_platforms", PlatformQuery(limit=1)),
+        ("query_status_checks", StatusCheckQuery(limit=2)),
+        (
+            "query_status_checks",
+            StatusCheckQuery(platform_id="platform-001", descending=False, limit=1),
+        ),
+    ],
+)
+def test_created_order_cursor_pages_match_local_fixture_repository(
+    repository: DatabricksRepository,
+    recorder: _Recorder,
+    method: str,
+    query: PlatformQuery | StatusCheckQuery,
+) -> None:
+    local = LocalFixtureRepository()
+
+    pages = 0
+    while True:
+        page = getattr(repository, method)(query)
+        assert page == getattr(local, method)(query)
+        pages += 1
+        if page.next_cursor is None:
+            break
+        query = replace(query, cursor=page.next_cursor, include_total=False)
+
+    assert pages > 1
+    # The keyset predicate leads with a plain range the engine can seek on.
+    op = "<=" if query.descending else ">="
+    assert f"created_at {op} :cursor_0 AND" in recorder.queries[-1].sql
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        StatusResultQuery(limit=None),
+        StatusResultQuery(platform_id="platform-001", limit=1, offset=1),
+        StatusResultQuery(end_at=parse_timestamp("2024-07-18T08:00:00Z"), descending=False),
+    ],
+)
+def test_latest_per_check_matches_local_fixture_repository(
+    repository: DatabricksRepository, recorder: _Recorder, query: StatusResultQuery
+) -> None:
+    local = LocalFixtureRepository()
+
+    assert repository.query_latest_status_results(query) == local.query_latest_status_results(query)
+    assert "ROW_NUMBER() OVER (PARTITION BY check_id" in recorder.queries[0].sql
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        StatusBucketQuery(platform_id="platform-001"),
+        StatusBucketQuery(check_id="status-001", bucket_seconds=600),
+        StatusBucketQuery(
+            platform_id="platform-002",
+            start_at=parse_timestamp("2024-07-18T00:00:00Z"),
+            end_at=parse_timestamp("2024-07-19T00:00:00Z"),
+            points=24,
+        ),
+        StatusBucketQuery(platform_id="missing"),
+    ],
+)
+def test_buckets_match_local_fixture_repository(
+    repository: DatabricksRepository, recorder: _Recorder, query: StatusBucketQuery
+) -> None:
+    local = LocalFixtureRepository()
+
+    series = repository.query_status_buckets(query)
+    assert series == local.query_status_buckets(query)
+    if series.items:
+        # Rows are grouped in SQL; only one per bucket and state is fetched.
+        assert "GROUP BY 1, 2" in recorder.queries[-1].sql
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        StatusResultQuery(platform_id="platform-001"),
+        StatusResultQuery(check_id="status-001", start_at=parse_timestamp("2024-07-18T08:00:00Z")),
+        StatusResultQuery(platform_id="missing"),
+    ],
+)
+def test_result_extent_matches_local_fixture_repository(
+    repository: DatabricksRepository, query: StatusResultQuery
+) -> None:
+    local = LocalFixtureRepository()
+
+    assert repository.query_status_result_extent(query) == local.query_status_result_extent(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        SlaQuery(
+            start_at=parse_timestamp("2024-07-15T06:00:00Z"),
+            end_at=parse_timestamp("2024-07-19T00:00:00Z"),
+        ),
+        SlaQuery(
+            start_at=parse_timestamp("2024-07-18T00:00:00Z"),
+            end_at=parse_timestamp("2024-07-18T12:00:00Z"),
+            platform_id="platform-002",
+        ),
+        SlaQuery(
+            start_at=parse_timestamp("2024-07-01T00:00:00Z"),
+            end_at=parse_timestamp("2024-07-31T00:00:00Z"),
+            check_id="status-001",
+        ),
+    ],
+)
+def test_sla_matches_local_fixture_repository(
+    repository: DatabricksRepository, query: SlaQuery
+) -> None:
+    local = LocalFixtureRepository()
+
+    reports = repository.query_sla(query)
+    assert reports and reports == local.query_sla(query)
+
+
+def test_sla_reuses_cached_days_without_fetching_results(
+    repository: DatabricksRepository, recorder: _Recorder
+) -> None:
+    query = SlaQuery(
+        start_at=parse_timestamp("2024-07-10T00:00:00Z"),
+        end_at=parse_timestamp("2024-07-20T00:00:00Z"),
+    )
+    reports = repository.query_sla(query)
+    assert "ORDER BY check_id, measured_at" in recorder.queries[-1].sql
+
+    recorder.queries.clear()
+    assert repository.query_sla(query) == reports
+    # Every day is complete and cached, so only the grouped day count runs.
+    assert "GROUP BY 1, 2" in recorder.queries[-1].sql
+    assert not any("ORDER BY check_id" in item.sql for item in recorder.queries)
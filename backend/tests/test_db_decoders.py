@@ -0,0 +1,213 @@
+"""Tests for compiled row decoders."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Sequence
+
+import pytest
+
+from app.db.decoders import compile_decoder, decode_mappings, decode_rows, format_timestamp
+from app.db.models import Platform, StatusCheck, StatusResult, to_dict
+from app.db.query import MockQueryRunner, QueryError, SqlQueryRunner
+
+RESULT_COLUMNS = (
+    "id",
+    "check_id",
+    "platform_id",
+    "state",
+    "measured_at",
+    "observed_value",
+    "message",
+    "error_payload",
+    "ingestion_run_id",
+    "created_at",
+    "created_by",
+)
+
+
+@dataclass(frozen=True)
+class _Flagged:
+    id: str
+    flag: bool
+
+
+class _Cursor:
+    def __init__(self, columns: Sequence[str], rows: Sequence[tuple[Any, ...]]) -> None:
+        self.description: Sequence[Sequence[Any]] | None = [
+            (name, None, None, None, None, None, None) for name in columns
+        ]
+        self._rows = list(rows)
+
+    def execute(self, operation: str, parameters: object | None = None) -> None:
+        return None
+
+    def executemany(self, operation: str, seq_of_parameters: Sequence[object]) -> None:
+        return None
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+    def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        return self._rows[0] if self._rows else None
+
+    def close(self) -> None:
+        return None
+
+
+class _Provider:
+    def __init__(self, cursor: _Cursor) -> None:
+        self._cursor = cursor
+
+    def connect(self) -> "_Provider":
+        return self
+
+    def cursor(self) -> _Cursor:
+        return self._cursor
+
+    def release(self, connection: object) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _result_row(**overrides) -> tuple:
+    values = {
+        "id": "result-1",
+        "check_id": "status-1",
+        "platform_id": "platform-1",
+        "state": "green",
+        "measured_at": datetime(2024, 7, 18, 8, 30, tzinfo=timezone.utc),
+        "observed_value": "12",
+        "message": None,
+        "error_payload": None,
+        "ingestion_run_id": "run-1",
+        "created_at": datetime(2024, 7, 18, 8, 31, 0, 250000, tzinfo=timezone.utc),
+        "created_by": "ingest",
+    }
+    values.update(overrides)
+    return tuple(values[column] for column in RESULT_COLUMNS)
+
+
+def test_decoder_builds_models_and_formats_timestamps() -> None:
+    [result] = decode_rows(RESULT_COLUMNS, [_result_row()], StatusResult)
+
+    assert result == StatusResult(
+        id="result-1",
+        check_id="status-1",
+        platform_id="platform-1",
+        state="green",
+        measured_at="2024-07-18T08:30:00Z",
+        created_at="2024-07-18T08:31:00.250000Z",
+        observed_value="12",
+        message=None,
+        ingestion_run_id="run-1",
+    )
+
+
+def test_decoder_is_cached_per_layout_and_model() -> None:
+    first = compile_decoder(RESULT_COLUMNS, StatusResult)
+
+    assert compile_decoder(RESULT_COLUMNS, StatusResult) is first
+    assert compile_decoder(RESULT_COLUMNS[::-1], StatusResult) is not first
+
+
+def test_decoder_coerces_booleans_integers_and_aliases() -> None:
+    columns: tuple[str, ...] = (
+        "id",
+        "platform_id",
+        "name",
+        "check_type",
+        "owner_group",
+        "description",
+        "sla_minutes",
+        "warn_after_minutes",
+        "crit_after_minutes",
+        "state",
+        "version",
+        "created_at",
+        "created_by",
+        "updated_at",
+        "updated_by",
+        "is_deleted",
+    )
+    stamp = datetime(2024, 7, 1, 10, 0, tzinfo=timezone(timedelta(hours=2)))
+    row: tuple[Any, ...] = ("s-1", "p-1", "Freshness", "freshness", None, None, "60", 30, 90)
+    row += ("active", 3)
+    row += (stamp, "me", stamp, "me", "false")
+
+    [check] = decode_rows(columns, [row], StatusCheck)
+
+    assert check.sla_minutes == 60
+    assert check.is_deleted is False
+    assert check.created_at == "2024-07-01T08:00:00Z"
+
+    platform_columns: tuple[str, ...] = ("id", "name", "domain", "owner_group", "state")
+    platform_columns += ("created_at", "created_by", "updated_at", "updated_by")
+    platform_row = ("p-1", "Lakehouse", "data", "team-a", "active", stamp, "me", stamp, "me")
+    [platform] = decode_rows(platform_columns, [platform_row], Platform)
+    assert platform.owner == "team-a"
+
+
+def test_missing_required_column_is_schema_drift() -> None:
+    columns = tuple(column for column in RESULT_COLUMNS if column != "measured_at")
+
+    with pytest.raises(QueryError, match="measured_at"):
+        compile_decoder(columns, StatusResult)
+
+
+def test_null_in_required_field_and_bad_boolean_raise_query_error() -> None:
+    with pytest.raises(QueryError, match="StatusResult.state"):
+        decode_rows(RESULT_COLUMNS, [_result_row(state=None)], StatusResult)
+    with pytest.raises(QueryError, match="boolean"):
+        compile_decoder(("id", "flag"), _Flagged)(("x", "maybe"))
+
+
+def test_fetch_models_uses_decoders_for_sql_and_mock_runners() -> None:
+    sql = "SELECT * FROM status_results"
+    sql_runner = SqlQueryRunner(_Provider(_Cursor(RESULT_COLUMNS, [_result_row()])))
+    mapping = dict(zip(RESULT_COLUMNS, _result_row()))
+    mock_runner = MockQueryRunner({sql: [mapping]})
+
+    from_sql = sql_runner.fetch_models(sql, StatusResult)
+    from_mock = mock_runner.fetch_models(sql, StatusResult)
+
+    assert from_sql == from_mock
+    assert from_sql[0].measured_at == "2024-07-18T08:30:00Z"
+    assert decode_mappings([], StatusResult) == []
+
+
+def test_format_timestamp_treats_naive_values_as_utc() -> None:
+    assert format_timestamp(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02T03:04:05Z"
+
+
+def test_low_cardinality_fields_are_shared_between_rows() -> None:
+    rows = [
+        _result_row(
+            id="".join(["result-", str(n)]),
+            platform_id="".join(["platform-", "1"]),
+            state="".join(["gr", "een"]),
+            observed_value="".join(["1", "2"]),
+        )
+        for n in range(2)
+    ]
+
+    first, second = decode_rows(RESULT_COLUMNS, rows, StatusResult)
+
+    assert first.platform_id is second.platform_id
+    assert first.state is second.state
+    assert first.observed_value is not second.observed_value
+
+
+def test_models_are_slotted_and_to_dict_matches_asdict() -> None:
+    [result] = decode_rows(RESULT_COLUMNS, [_result_row()], StatusResult)
+
+    assert not hasattr(result, "__dict__")
+    assert to_dict(result) == asdict(result)
+    assert list(to_dict(result)) == list(asdict(result))
@@ -0,0 +1,106 @@
+"""Tests for the embedded SQLite warehouse stand-in."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.db.embedded import EmbeddedWarehouse, translate_ddl
+from app.db.mock_data import DEFAULT_PLATFORMS, DEFAULT_STATUS_RESULTS
+from app.db.models import Platform, StatusResult
+from app.db.pool import PoolConfig, ThreadSafeConnectionPool
+from app.db.query import SqlQueryRunner
+
+
+@pytest.fixture
+def warehouse():
+    embedded = EmbeddedWarehouse()
+    embedded.load_fixtures()
+    yield embedded
+    embedded.close()
+
+
+def test_translate_ddl_strips_delta_specifics() -> None:
+    ddl = """
+    -- comment
+    CREATE TABLE IF NOT EXISTS <catalog>.<schema>.t (
+        id STRING NOT NULL,
+        tags ARRAY<STRING>,
+        n INT NOT NULL DEFAULT 1,
+        flag BOOLEAN NOT NULL DEFAULT FALSE,
+        at TIMESTAMP
+    )
+    USING DELTA;
+    """
+
+    translated = translate_ddl(ddl)
+
+    assert translated.startswith("CREATE TABLE IF NOT EXISTS t (")
+    assert "id TEXT NOT NULL" in translated
+    assert "tags TEXT" in translated
+    assert "flag INTEGER NOT NULL DEFAULT 0" in translated
+    assert "DELTA" not in translated and "--" not in translated
+
+
+def test_fixtures_round_trip_through_sql_runner(warehouse: EmbeddedWarehouse) -> None:
+    runner = SqlQueryRunner(warehouse)
+
+    platforms = runner.fetch_models("SELECT * FROM platforms ORDER BY id", Platform)
+    results = runner.fetch_models("SELECT * FROM status_results ORDER BY id", StatusResult)
+
+    assert platforms == sorted(DEFAULT_PLATFORMS, key=lambda item: item.id)
+    assert results == sorted(DEFAULT_STATUS_RESULTS, key=lambda item: item.id)
+    row = runner.fetch_one("SELECT domain, created_by FROM platforms LIMIT 1")
+    assert row == {"domain": "unassigned", "created_by": DEFAULT_PLATFORMS[0].created_by}
+
+
+def test_named_parameters_and_pushdown(warehouse: EmbeddedWarehouse) -> None:
+    runner = SqlQueryRunner(warehouse)
+    latest = max(DEFAULT_STATUS_RESULTS, key=lambda item: (item.measured_at, item.id))
+
+    rows = runner.fetch_all(
+        "SELECT id FROM status_results WHERE platform_id = :platform_id "
+        "ORDER BY measured_at DESC, id DESC LIMIT :limit",
+        {"platform_id": latest.platform_id, "limit": 1},
+    )
+
+    assert rows == [{"id": latest.id}]
+
+
+def test_writes_are_visible_across_pooled_connections(warehouse: EmbeddedWarehouse) -> None:
+    pool = ThreadSafeConnectionPool(warehouse.open_connection, PoolConfig(min_size=0, max_size=2))
+    SqlQueryRunner(warehouse).execute("DELETE FROM status_messages")
+    counts: list[int] = []
+
+    def count_messages() -> None:
+        connection = pool.acquire()
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT COUNT(*) FROM status_messages")
+            row = cursor.fetchone()
+            assert row is not None
+            counts.append(row[0])
+            cursor.close()
+        finally:
+            pool.release(connection)
+
+    threads = [threading.Thread(target=count_messages) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    pool.close()
+
+    assert counts == [0, 0, 0, 0]
+
+
+def test_separate_warehouses_are_isolated() -> None:
+    first, second = EmbeddedWarehouse(), EmbeddedWarehouse()
+    try:
+        first.create_schema(["platforms"])
+        assert first.table_columns("platforms")
+        assert second.table_columns("platforms") == []
+    finally:
+        first.close()
+        second.close()
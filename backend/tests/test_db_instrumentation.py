@@ -0,0 +1,194 @@
+"""Tests for query instrumentation and the query metrics endpoint."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Sequence
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.request_context import RequestContext, reset_request_context, set_request_context
+from app.db.connection import DbApiConnection
+from app.db.deps import get_query_instrumentation
+from app.db.instrumentation import (
+    SLOW_QUERY_LOGGER_NAME,
+    QueryInstrumentation,
+    QueryMetrics,
+    QueryObserver,
+    approximate_bytes,
+)
+from app.db.query import SqlQueryRunner
+from app.main import app
+
+client = TestClient(app)
+
+
+class _Cursor:
+    def __init__(self, rows: Sequence[Sequence[Any]], columns: Sequence[str]) -> None:
+        self._rows = list(rows)
+        self.description: Sequence[Sequence[Any]] | None = [
+            (column, None, None, None, None, None, None) for column in columns
+        ]
+
+    def execute(self, operation: str, parameters: object | None = None) -> None:
+        if operation == "BOOM":
+            raise RuntimeError("warehouse error")
+
+    def executemany(self, operation: str, seq_of_parameters: Sequence[object]) -> None:
+        return None
+
+    def fetchall(self) -> Sequence[Sequence[Any]]:
+        return list(self._rows)
+
+    def fetchmany(self, size: int) -> Sequence[Sequence[Any]]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def fetchone(self) -> Sequence[Any] | None:
+        return self._rows[0] if self._rows else None
+
+    def close(self) -> None:
+        return None
+
+
+class _Connection:
+    def __init__(self, cursor: _Cursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> _Cursor:
+        return self._cursor
+
+    def close(self) -> None:
+        return None
+
+
+class _Provider:
+    def __init__(self, cursor: _Cursor) -> None:
+        self._connection = _Connection(cursor)
+
+    def connect(self) -> _Connection:
+        return self._connection
+
+    def release(self, connection: DbApiConnection) -> None:
+        return None
+
+
+class _Recorder(QueryObserver):
+    def __init__(self) -> None:
+        self.metrics: list[QueryMetrics] = []
+
+    def on_query(self, metrics: QueryMetrics) -> None:
+        self.metrics.append(metrics)
+
+
+def _metrics(endpoint: str, seconds: float, rows: int = 1) -> QueryMetrics:
+    return QueryMetrics(
+        operation="fetch_all",
+        sql="SELECT 1",
+        request_id="req-1",
+        endpoint=endpoint,
+        acquire_seconds=0.0,
+        execute_seconds=seconds,
+        fetch_seconds=0.0,
+        rows=rows,
+        approx_bytes=8 * rows,
+    )
+
+
+def test_runner_reports_rows_bytes_and_request_tags() -> None:
+    recorder = _Recorder()
+    runner = SqlQueryRunner(_Provider(_Cursor([("p-1", "green")], ["id", "state"])), recorder)
+    token = set_request_context(RequestContext("req-42", "GET", "/api/v1/platforms"))
+    try:
+        runner.fetch_all("SELECT id, state FROM platforms")
+    finally:
+        reset_request_context(token)
+
+    [metrics] = recorder.metrics
+    assert metrics.operation == "fetch_all"
+    assert metrics.request_id == "req-42"
+    assert metrics.endpoint == "GET /api/v1/platforms"
+    assert metrics.rows == 1
+    assert metrics.approx_bytes == len("p-1") + len("green")
+    assert metrics.error is None
+    assert min(metrics.acquire_seconds, metrics.execute_seconds, metrics.fetch_seconds) >= 0
+
+
+def test_runner_reports_failed_and_streamed_queries() -> None:
+    recorder = _Recorder()
+    runner = SqlQueryRunner(_Provider(_Cursor([(1,), (2,), (3,)], ["n"])), recorder)
+
+    with pytest.raises(RuntimeError):
+        runner.execute("BOOM")
+    assert sum(1 for _ in runner.iter_rows("SELECT n FROM numbers", batch_size=2)) == 3
+
+    failed, streamed = recorder.metrics
+    assert failed.error == "RuntimeError"
+    assert failed.endpoint == "background"
+    assert streamed.operation == "iter_batches"
+    assert streamed.rows == 3
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_instrumentation_aggregates_per_endpoint_and_logs_slow_queries() -> None:
+    instrumentation = QueryInstrumentation(slow_query_threshold_seconds=0.5, max_endpoints=2)
+    logger = logging.getLogger(SLOW_QUERY_LOGGER_NAME)
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    try:
+        instrumentation.on_query(_metrics("GET /a", 0.1))
+        instrumentation.on_query(_metrics("GET /a", 0.7, rows=3))
+        instrumentation.on_query(_metrics("GET /b", 0.2))
+        instrumentation.on_query(_metrics("GET /c", 0.3))
+    finally:
+        logger.removeHandler(handler)
+
+    stats = {item.endpoint: item for item in instrumentation.snapshot()}
+    assert set(stats) == {"GET /a", "GET /b", "other"}
+    assert stats["GET /a"].queries == 2
+    assert stats["GET /a"].rows == 4
+    assert stats["GET /a"].slow_queries == 1
+    assert stats["GET /a"].max_seconds == pytest.approx(0.7)
+    assert instrumentation.snapshot()[0].endpoint == "GET /a"
+    [record] = handler.records
+    # Fields passed through ``extra`` land in the record's __dict__.
+    assert record.__dict__["request_id"] == "req-1"
+    assert record.__dict__["total_ms"] == pytest.approx(700.0)
+
+
+def test_approximate_bytes_counts_text_and_scalars() -> None:
+    assert approximate_bytes([("abc", 1, None), (b"xy", 2.5, True)]) == 3 + 8 + 2 + 8 + 8
+
+
+def test_query_metrics_endpoint_lists_endpoint_totals() -> None:
+    instrumentation = get_query_instrumentation()
+    instrumentation.reset()
+    instrumentation.on_query(_metrics("GET /api/v1/platforms", 0.25, rows=10))
+
+    response = client.get("/api/v1/metrics/queries")
+
+    assert response.status_code == 200
+    payload = response.json()
+    [item] = payload["items"]
+    assert item["endpoint"] == "GET /api/v1/platforms"
+    assert item["rows"] == 10
+    assert item["total_seconds"] == pytest.approx(0.25)
+    instrumentation.reset()
+
+
+def test_request_context_uses_route_template() -> None:
+    class _Route:
+        path = "/api/v1/platforms/{platform_id}"
+
+    context = RequestContext("req", "GET", "/api/v1/platforms/p-1", scope={"route": _Route()})
+
+    assert context.endpoint == "GET /api/v1/platforms/{platform_id}"
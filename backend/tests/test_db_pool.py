@@ -0,0 +1,166 @@
+"""Tests for the warehouse connection pool."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.db.connection import DbApiConnection
+from app.db.pool import PoolConfig, PoolTimeoutError, ThreadSafeConnectionPool
+
+
+class _FakeConnection:
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.closed = False
+        self.healthy = True
+
+    def cursor(self):  # pragma: no cover - validator is stubbed in these tests
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _fake(connection: DbApiConnection) -> _FakeConnection:
+    assert isinstance(connection, _FakeConnection)
+    return connection
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.created: list[_FakeConnection] = []
+
+    def __call__(self) -> _FakeConnection:
+        connection = _FakeConnection(len(self.created))
+        self.created.append(connection)
+        return connection
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pool(factory: _Factory, clock: _Clock | None = None, **config) -> ThreadSafeConnectionPool:
+    return ThreadSafeConnectionPool(
+        factory,
+        PoolConfig(**config),
+        validator=lambda connection: _fake(connection).healthy,
+        clock=clock or time.monotonic,
+    )
+
+
+def test_open_prefills_min_size_and_reuses_connections() -> None:
+    factory = _Factory()
+    pool = _pool(factory, min_size=2, max_size=3)
+
+    pool.open()
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert len(factory.created) == 2
+    assert second is first
+    stats = pool.stats()
+    assert stats.created == 2
+    assert stats.in_use == 1
+    assert stats.idle == 1
+    assert stats.acquired == 2
+
+
+def test_acquire_times_out_when_exhausted() -> None:
+    factory = _Factory()
+    pool = _pool(factory, min_size=0, max_size=1, acquire_timeout_seconds=0.01)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    assert pool.stats().timeouts == 1
+
+
+def test_blocked_acquire_resumes_after_release() -> None:
+    pool = _pool(_Factory(), min_size=0, max_size=1)
+    held = pool.acquire()
+    acquired: list[object] = []
+
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    waiter.start()
+    while pool.stats().waiting == 0:
+        time.sleep(0.001)
+    pool.release(held)
+    waiter.join(timeout=2)
+
+    assert acquired == [held]
+
+
+def test_invalid_connection_is_replaced_on_checkout() -> None:
+    factory = _Factory()
+    pool = _pool(factory, min_size=1, max_size=2)
+    pool.open()
+    factory.created[0].healthy = False
+
+    connection = pool.acquire()
+
+    assert connection is factory.created[1]
+    assert factory.created[0].closed is True
+    stats = pool.stats()
+    assert stats.validation_failures == 1
+    assert stats.destroyed == 1
+
+
+def test_expired_connections_are_recycled() -> None:
+    factory = _Factory()
+    clock = _Clock()
+    pool = _pool(factory, clock, min_size=0, max_size=2, max_lifetime_seconds=60)
+    connection = pool.acquire()
+    clock.now = 61
+
+    pool.release(connection)
+    replacement = pool.acquire()
+
+    assert _fake(connection).closed is True
+    assert replacement is not connection
+
+
+def test_idle_eviction_keeps_min_size() -> None:
+    factory = _Factory()
+    clock = _Clock()
+    pool = _pool(factory, clock, min_size=1, max_size=3, idle_timeout_seconds=30)
+    held = [pool.acquire() for _ in range(3)]
+    for connection in held:
+        pool.release(connection)
+    clock.now = 31
+
+    evicted = pool.evict_idle()
+
+    assert evicted == 2
+    assert pool.stats().idle == 1
+
+
+def test_release_of_foreign_connection_closes_it() -> None:
+    pool = _pool(_Factory())
+    stranger = _FakeConnection(99)
+
+    pool.release(stranger)
+
+    assert stranger.closed is True
+    assert pool.stats().size == 0
+
+
+def test_double_release_keeps_the_idle_connection_open() -> None:
+    pool = _pool(_Factory(), max_size=1)
+    connection = pool.acquire()
+
+    pool.release(connection)
+    pool.release(connection)
+
+    assert _fake(connection).closed is False
+    assert pool.stats().idle == 1
+    assert pool.acquire() is connection
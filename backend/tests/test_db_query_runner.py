@@ -2,27 +2,43 @@
 
 from __future__ import annotations
 
+import gc
 from typing import Any, Sequence
 
-from app.db.query import MockQueryRunner, QueryCall, SqlQueryRunner
+import pytest
+
+from app.db.connection import DbApiConnection
+from app.db.query import MockQueryRunner, QueryBatchCall, QueryCall, SqlQueryRunner
 
 
 class _StubCursor:
     def __init__(self, rows: Sequence[Sequence[Any]], columns: Sequence[str]) -> None:
         self._rows = list(rows)
-        self.description = [(column, None, None, None, None, None, None) for column in columns]
+        self.description: Sequence[Sequence[Any]] | None = [
+            (column, None, None, None, None, None, None) for column in columns
+        ]
         self.executed: list[tuple[str, object | None]] = []
+        self.fetchmany_sizes: list[int] = []
         self.closed = False
 
     def execute(self, operation: str, parameters: object | None = None) -> None:
         self.executed.append((operation, parameters))
 
+    def executemany(self, operation: str, seq_of_parameters: Sequence[object]) -> None:
+        for parameters in seq_of_parameters:
+            self.executed.append((operation, parameters))
+
     def fetchall(self) -> Sequence[Sequence[Any]]:
         return list(self._rows)
 
     def fetchone(self) -> Sequence[Any] | None:
         return self._rows[0] if self._rows else None
 
+    def fetchmany(self, size: int) -> Sequence[Sequence[Any]]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        self.fetchmany_sizes.append(size)
+        return batch
+
     def close(self) -> None:
         self.closed = True
 
@@ -42,12 +58,12 @@ class _StubConnection:
 class _StubProvider:
     def __init__(self, connection: _StubConnection) -> None:
         self._connection = connection
-        self.released: list[_StubConnection] = []
+        self.released: list[DbApiConnection] = []
 
     def connect(self) -> _StubConnection:
         return self._connection
 
-    def release(self, connection: _StubConnection) -> None:
+    def release(self, connection: DbApiConnection) -> None:
         self.released.append(connection)
         connection.close()
 
@@ -88,3 +104,111 @@ def test_mock_query_runner_records_calls() -> None:
         QueryCall(sql="select 1", params=None),
         QueryCall(sql="update platforms set state = :state", params={"state": "ok"}),
     ]
+
+
+def _streaming_runner(row_count: int) -> tuple[SqlQueryRunner, _StubProvider, _StubCursor]:
+    cursor = _StubCursor(rows=[(f"result-{idx}",) for idx in range(row_count)], columns=["id"])
+    provider = _StubProvider(_StubConnection(cursor))
+    return SqlQueryRunner(provider), provider, cursor
+
+
+def test_iter_batches_uses_fetchmany_and_releases() -> None:
+    runner, provider, cursor = _streaming_runner(5)
+
+    batches = list(runner.iter_batches("select id from status_results", batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0][0] == {"id": "result-0"}
+    assert cursor.fetchmany_sizes == [2, 2, 2, 2]
+    assert cursor.closed is True
+    assert len(provider.released) == 1
+
+
+def test_iter_rows_defers_connect_until_iteration() -> None:
+    runner, provider, _ = _streaming_runner(3)
+
+    rows = runner.iter_rows("select id from status_results", batch_size=2)
+    assert provider.released == []
+
+    assert [row["id"] for row in rows] == ["result-0", "result-1", "result-2"]
+    assert len(provider.released) == 1
+
+
+def test_abandoned_iterator_releases_connection() -> None:
+    runner, provider, cursor = _streaming_runner(10)
+
+    rows = runner.iter_rows("select id from status_results", batch_size=3)
+    assert next(rows) == {"id": "result-0"}
+    del rows
+    gc.collect()
+
+    assert cursor.closed is True
+    assert len(provider.released) == 1
+
+
+def test_mock_query_runner_iter_batches_records_call() -> None:
+    runner = MockQueryRunner({"select id": [{"id": 1}, {"id": 2}, {"id": 3}]})
+
+    batches = list(runner.iter_batches("select id", batch_size=2))
+
+    assert batches == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    assert runner.calls == [QueryCall(sql="select id", params=None)]
+
+
+def test_fetch_columns_transposes_batches() -> None:
+    cursor = _StubCursor(
+        rows=[("result-1", "green"), ("result-2", "red"), ("result-3", "green")],
+        columns=["id", "state"],
+    )
+    provider = _StubProvider(_StubConnection(cursor))
+    runner = SqlQueryRunner(provider)
+
+    columns = runner.fetch_columns("select id, state from status_results", batch_size=2)
+
+    assert columns == {
+        "id": ["result-1", "result-2", "result-3"],
+        "state": ["green", "red", "green"],
+    }
+    assert cursor.closed is True
+    assert len(provider.released) == 1
+
+
+def test_mock_query_runner_fetch_columns() -> None:
+    runner = MockQueryRunner({"select 1": [{"id": "a", "value": 1}, {"id": "b", "value": 2}]})
+
+    assert runner.fetch_columns("select 1") == {"id": ["a", "b"], "value": [1, 2]}
+    assert runner.calls == [QueryCall(sql="select 1", params=None)]
+
+
+def test_fetch_arrow_builds_table_without_native_support() -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    cursor = _StubCursor(rows=[("result-1", 3)], columns=["id", "value"])
+    runner = SqlQueryRunner(_StubProvider(_StubConnection(cursor)))
+
+    table = runner.fetch_arrow("select id, value from status_results")
+
+    assert isinstance(table, pyarrow.Table)
+    assert table.to_pydict() == {"id": ["result-1"], "value": [3]}
+
+
+def test_execute_many_uses_one_connection() -> None:
+    cursor = _StubCursor(rows=[], columns=["id"])
+    provider = _StubProvider(_StubConnection(cursor))
+    runner = SqlQueryRunner(provider)
+    sql = "insert into votes (id) values (:id)"
+
+    runner.execute_many(sql, [{"id": "vote-1"}, {"id": "vote-2"}])
+
+    assert cursor.executed == [(sql, {"id": "vote-1"}), (sql, {"id": "vote-2"})]
+    assert len(provider.released) == 1
+
+
+def test_mock_query_runner_records_batch_calls() -> None:
+    runner = MockQueryRunner()
+
+    runner.execute_many("insert into votes (id) values (:id)", [{"id": "vote-1"}])
+
+    assert runner.batch_calls == [
+        QueryBatchCall(sql="insert into votes (id) values (:id)", params_seq=({"id": "vote-1"},))
+    ]
+    assert runner.calls == []
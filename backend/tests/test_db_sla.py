@@ -0,0 +1,193 @@
+"""Tests for the SLA engine."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.db import sla
+from app.db.fixtures import LocalFixtureRepository
+from app.db.mock_data import DEFAULT_STATUS_CHECKS
+from app.db.models import StatusResult
+from app.db.queries import SlaQuery
+from app.db.sla import SlaDayCache, check_tally, platform_rollups, summarize
+from app.db.synthetic import SyntheticData, SyntheticScale
+from app.db.timeseries import STATE_NAMES, StringTable, format_epoch_us, to_epoch_us
+
+MINUTE = 60 * 1_000_000
+T0 = to_epoch_us(datetime(2024, 7, 18, tzinfo=timezone.utc))
+
+
+def _points(*entries: tuple[int, str]):
+    states = StringTable(STATE_NAMES)
+    codes = [states.code(state) for _, state in entries]
+    return [T0 + minute * MINUTE for minute, _ in entries], codes, states.values()
+
+
+def test_states_hold_until_the_next_result_or_go_stale() -> None:
+    points = _points((-5, "red"), (10, "green"), (20, "red"), (30, "green"), (100, "yellow"))
+
+    tally = summarize(points, T0, T0 + 120 * MINUTE, 30 * MINUTE)
+
+    # red carries in from -5 and goes stale at 25; green from 30 goes stale at 60.
+    assert tally.state_us == {
+        "red": 10 * MINUTE + 10 * MINUTE,
+        "green": 10 * MINUTE + 30 * MINUTE,
+        "unknown": 40 * MINUTE,
+        "yellow": 20 * MINUTE,
+    }
+    assert tally.breaches == [
+        (T0, T0 + 10 * MINUTE),
+        (T0 + 20 * MINUTE, T0 + 30 * MINUTE),
+        (
+            T0 + 60 * MINUTE,
+            T0 + 100 * MINUTE,
+        ),
+    ]
+    # Nothing before the first result is unknown, and so a breach.
+    assert summarize(_points((10, "green")), T0, T0 + 20 * MINUTE, MINUTE).breaches == [
+        (T0, T0 + 10 * MINUTE),
+        (T0 + 11 * MINUTE, T0 + 20 * MINUTE),
+    ]
+
+
+def test_report_uptime_mttr_and_open_breaches() -> None:
+    check = DEFAULT_STATUS_CHECKS[0]
+    points = _points((0, "green"), (10, "red"), (40, "green"), (50, "red"))
+    end = T0 + 60 * MINUTE
+    tally = summarize(points, T0, end, check.crit_after_minutes * MINUTE)
+
+    report = sla.check_report(check, tally, T0, end, format_epoch_us)
+
+    assert report.uptime == pytest.approx(20 / 60)
+    assert report.state_seconds == {"green": 1200.0, "red": 2400.0}
+    assert (report.breaches, report.open_breaches, report.mttr_seconds) == (2, 1, 1800.0)
+
+    other = replace(report, check_id="other", uptime=1.0, breaches=1, open_breaches=0)
+    (rollup,) = platform_rollups([report, other])
+    assert (rollup.check_id, rollup.checks, rollup.breaches, rollup.open_breaches) == (
+        None,
+        2,
+        3,
+        1,
+    )
+    assert rollup.uptime == pytest.approx((20 / 60 + 1.0) / 2)
+    assert rollup.mttr_seconds == 1800.0
+
+
+def test_vectorized_summary_matches_the_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    data = SyntheticData(SyntheticScale(platforms=1, checks_per_platform=2, results_per_check=400))
+    repository = data.build_repository()
+    points = repository.snapshot().results.state_points(data.check_id(1))
+    start = points[0][0] + 7 * MINUTE
+    end = points[0][-1] - 90 * MINUTE
+
+    expected = summarize(points, start, end, 40 * MINUTE)
+    monkeypatch.setattr(sla, "VECTORIZE_MIN_ROWS", 0)
+
+    assert summarize(points, start, end, 40 * MINUTE) == expected
+
+
+def test_completed_days_are_cached_and_late_results_invalidate_them() -> None:
+    data = SyntheticData(
+        SyntheticScale(platforms=1, checks_per_platform=2, results_per_check=4 * 96)
+    )
+    repository = data.build_repository()
+    start = data.scale.start_at + timedelta(hours=5)
+    query = SlaQuery(start_at=start, end_at=start + timedelta(days=3))
+    cache = repository.snapshot().sla_days
+
+    first = repository.query_sla(query)
+    misses = cache.misses
+    assert repository.query_sla(query) == first
+    assert cache.misses == misses and cache.hits == 2 * 2
+
+    late = replace(
+        repository.snapshot().results.results()[0],
+        id="late",
+        check_id=data.check_id(0),
+        state="red",
+        measured_at=format_epoch_us(to_epoch_us(start + timedelta(days=1, hours=20))),
+    )
+    repository.add_status_results([late])
+    updated = repository.query_sla(query)
+
+    # Only the touched check's touched day is recomputed.
+    assert cache.misses == misses + 1
+    assert updated[1] == first[1]
+    assert updated[0] != first[0]
+    fresh = LocalFixtureRepository(
+        platforms=data.platforms(),
+        status_checks=data.status_checks(),
+        status_results=[*data.iter_status_results(), late],
+    )
+    assert fresh.query_sla(query) == updated
+
+
+def test_a_fleet_wide_report_larger_than_the_cache_is_served_from_it_again() -> None:
+    data = SyntheticData(
+        SyntheticScale(platforms=2, checks_per_platform=4, results_per_check=5 * 96)
+    )
+    repository = data.build_repository()
+    cache = repository.snapshot().sla_days
+    cache.max_days = 10
+    query = SlaQuery(start_at=data.scale.start_at, end_at=data.scale.start_at + timedelta(days=5))
+
+    first = repository.query_sla(query)
+    misses = cache.misses
+
+    # 8 checks x 5 days outgrow the initial bound; the report reserves room for them.
+    assert repository.query_sla(query) == first
+    assert len(cache) == cache.max_days == 8 * 5
+    assert (cache.misses, cache.hits) == (misses, 8 * 5)
+
+
+def test_check_tally_without_a_cache_loads_points_once() -> None:
+    points = _points((0, "green"), (600, "red"), (3000, "green"))
+    calls: list[tuple[int, int]] = []
+
+    def load(start_us: int, end_us: int):
+        calls.append((start_us, end_us))
+        return points
+
+    end = T0 + 4 * 24 * 60 * MINUTE
+    cached = check_tally("c", T0, end, 60 * MINUTE, load, lambda *_: 3, SlaDayCache())
+    assert check_tally("c", T0, end, 60 * MINUTE, load, lambda *_: 3) == cached
+    assert len(calls) == 2
+    assert summarize(points, T0, end, 60 * MINUTE) == cached
+
+
+def _status_result(check_id: str, minute: int, state: str) -> StatusResult:
+    measured = format_epoch_us(T0 + minute * MINUTE)
+    return StatusResult(
+        id=f"{check_id}-{minute}",
+        check_id=check_id,
+        platform_id="platform-001",
+        state=state,
+        measured_at=measured,
+        created_at=measured,
+    )
+
+
+def test_a_check_reporting_under_two_series_is_merged_in_time_order() -> None:
+    repository = LocalFixtureRepository(
+        status_checks=[DEFAULT_STATUS_CHECKS[0]],
+        status_results=[
+            _status_result("status-001", 0, "green"),
+            replace(_status_result("status-001", 10, "red"), platform_id="platform-002"),
+            _status_result("status-001", 20, "green"),
+        ],
+    )
+
+    (report,) = repository.query_sla(
+        SlaQuery(
+            start_at=datetime(2024, 7, 18, tzinfo=timezone.utc),
+            end_at=datetime(2024, 7, 18, 0, 30, tzinfo=timezone.utc),
+        )
+    )
+
+    assert report.state_seconds == {"green": 1200.0, "red": 600.0}
+    assert (report.breaches, report.open_breaches) == (1, 0)
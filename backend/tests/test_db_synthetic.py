@@ -0,0 +1,76 @@
+"""Tests for the synthetic data generator."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from app.db.embedded import EmbeddedWarehouse
+from app.db.queries import StatusResultQuery
+from app.db.query import SqlQueryRunner
+from app.db.synthetic import SyntheticData, SyntheticScale
+
+SMALL = SyntheticScale(platforms=4, checks_per_platform=3, results_per_check=200, seed=7)
+
+
+def test_output_is_deterministic_per_seed_and_independent_of_call_order() -> None:
+    first = SyntheticData(SMALL)
+    second = SyntheticData(SMALL)
+
+    results = first.status_results()
+    second.work_items()
+
+    assert second.status_results() == results
+    assert second.platforms() == first.platforms()
+    other_seed = SyntheticData(SyntheticScale(**{**SMALL.__dict__, "seed": 8}))
+    assert other_seed.status_results() != results
+
+
+def test_collections_match_the_requested_scale() -> None:
+    data = SyntheticData(SMALL)
+    checks = data.status_checks()
+    results = data.status_results()
+
+    assert len(data.platforms()) == 4
+    assert len(checks) == SMALL.status_checks == 12
+    assert {check.platform_id for check in checks} == {p.id for p in data.platforms()}
+    assert len(data.ingestion_runs()) == SMALL.results_per_check
+    assert 0.9 * SMALL.expected_results < len(results) <= SMALL.expected_results
+    assert len({result.id for result in results}) == len(results)
+    assert [r.measured_at for r in results] == sorted(r.measured_at for r in results)
+    assert all(r.created_at > r.measured_at for r in results)
+
+
+def test_state_distribution_is_mostly_green_with_incidents() -> None:
+    scale = SyntheticScale(platforms=10, checks_per_platform=10, results_per_check=300)
+    counts = Counter(result.state for result in SyntheticData(scale).iter_status_results())
+    total = sum(counts.values())
+
+    assert counts["green"] / total > 0.8
+    assert counts["yellow"] and counts["red"] and counts["unknown"]
+
+
+def test_feeds_the_local_repository_and_embedded_warehouse() -> None:
+    data = SyntheticData(SMALL)
+    repository = data.build_repository()
+    warehouse = EmbeddedWarehouse()
+    try:
+        loaded = data.load_warehouse(warehouse, batch_size=500)
+        row = SqlQueryRunner(warehouse).fetch_one(
+            "SELECT COUNT(*) AS n, COUNT(DISTINCT ingestion_run_id) AS runs FROM status_results"
+        )
+    finally:
+        warehouse.close()
+
+    total = repository.query_status_results(StatusResultQuery(limit=1)).total
+    assert row is not None
+    assert loaded == total == row["n"]
+    assert row["runs"] <= SMALL.results_per_check
+    assert len(repository.list_status_checks()) == SMALL.status_checks
+
+
+def test_production_scale_is_sized_without_generating() -> None:
+    scale = SyntheticScale.production()
+
+    assert scale.platforms == 500
+    assert scale.status_checks == 20_000
+    assert scale.expected_results > 10_000_000
@@ -0,0 +1,263 @@
+"""Tests for the columnar status-result store."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from app.db.buckets import observed_number, state_severity, worst_state
+from app.db.mock_data import DEFAULT_STATUS_RESULTS
+from app.db.models import StatusResult, to_dict
+from app.db.queries import StatusBucketQuery, StatusResultQuery
+from app.db.synthetic import SyntheticData, SyntheticScale
+from app.db.timeseries import TimeSeriesStore, format_epoch_us, parse_epoch_us, to_epoch_us
+
+
+def _result(result_id: str, measured_at: str, check_id: str = "status-1", **extra) -> StatusResult:
+    values = {
+        "id": result_id,
+        "check_id": check_id,
+        "platform_id": "platform-1",
+        "state": "green",
+        "measured_at": measured_at,
+        "created_at": measured_at,
+    }
+    values.update(extra)
+    return StatusResult(**values)
+
+
+def _sorted(results, descending: bool = True) -> list[StatusResult]:
+    return sorted(
+        results,
+        key=lambda item: (
+            parse_epoch_us(item.measured_at),
+            parse_epoch_us(item.created_at),
+            item.id,
+        ),
+        reverse=descending,
+    )
+
+
+def test_round_trip_is_byte_identical_including_non_canonical_timestamps() -> None:
+    odd = _result(
+        "odd",
+        "2024-07-18T10:30:00+02:00",
+        created_at="2024-07-18T08:30:00.500Z",
+        observed_value=None,
+        message="m",
+        ingestion_run_id="run-1",
+        state="maintenance",
+    )
+    store = TimeSeriesStore()
+    store.extend([*DEFAULT_STATUS_RESULTS, odd])
+
+    assert store.results() == _sorted([*DEFAULT_STATUS_RESULTS, odd], descending=False)
+    assert format_epoch_us(parse_epoch_us("2024-07-18T08:30:00Z")) == "2024-07-18T08:30:00Z"
+
+
+def test_out_of_order_appends_and_time_range_slicing() -> None:
+    store = TimeSeriesStore()
+    store.extend(_result(f"r{minute}", f"2024-07-18T08:{minute:02d}:00Z") for minute in (5, 1, 3))
+    store.extend([_result("r2", "2024-07-18T08:02:00Z")])
+
+    page = store.query(
+        StatusResultQuery(
+            start_at=datetime(2024, 7, 18, 8, 2, tzinfo=timezone.utc),
+            end_at=datetime(2024, 7, 18, 8, 3, tzinfo=timezone.utc),
+        )
+    )
+
+    assert [item.id for item in page.items] == ["r3", "r2"]
+    assert page.total == 2
+    assert [item.id for item in store.results()] == ["r1", "r2", "r3", "r5"]
+
+
+def test_cursor_pages_merge_across_series() -> None:
+    data = SyntheticData(SyntheticScale(platforms=2, checks_per_platform=3, results_per_check=20))
+    results = data.status_results()
+    store = TimeSeriesStore()
+    store.extend(results)
+    expected = _sorted(results)
+
+    seen: list[StatusResult] = []
+    query = StatusResultQuery(limit=7)
+    while True:
+        page = store.query(query)
+        assert page.total == len(results)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        query = replace(query, cursor=page.next_cursor)
+
+    assert seen == expected
+    by_platform = store.query(StatusResultQuery(platform_id=data.platform_id(1), limit=None))
+    assert by_platform.items == [r for r in expected if r.platform_id == data.platform_id(1)]
+
+
+def test_state_counts_use_the_state_column() -> None:
+    store = TimeSeriesStore()
+    states = ["green", "green", "red", "yellow", "green"]
+    store.extend(
+        _result(f"r{n}", f"2024-07-18T08:0{n}:00Z", state=state) for n, state in enumerate(states)
+    )
+
+    assert store.state_counts("status-1") == {"green": 3, "red": 1, "yellow": 1}
+    assert store.state_counts(
+        "status-1", start_at=datetime(2024, 7, 18, 8, 2, tzinfo=timezone.utc)
+    ) == {"red": 1, "yellow": 1, "green": 1}
+    assert store.state_counts("missing") == {}
+
+
+def test_with_results_leaves_the_original_store_untouched() -> None:
+    original = TimeSeriesStore()
+    original.extend(
+        [_result("a", "2024-07-18T08:00:00Z"), _result("b", "2024-07-18T08:00:00Z", "c2")]
+    )
+
+    updated = original.with_results([_result("c", "2024-07-18T09:00:00Z")])
+
+    assert [item.id for item in original.results()] == ["a", "b"]
+    assert [item.id for item in updated.results()] == ["a", "b", "c"]
+    assert updated.series("c2")[0] is original.series("c2")[0]
+    assert updated.series("status-1")[0] is not original.series("status-1")[0]
+
+
+def test_too_many_states_is_rejected() -> None:
+    store = TimeSeriesStore()
+    with pytest.raises(ValueError):
+        store.extend(
+            _result(f"r{n}", "2024-07-18T08:00:00Z", state=f"state-{n}") for n in range(300)
+        )
+
+
+def _brute_latest(results, query: StatusResultQuery) -> list[StatusResult]:
+    newest: dict[str, StatusResult] = {}
+    for result in _sorted(results):
+        if query.platform_id and result.platform_id != query.platform_id:
+            continue
+        if query.check_id and result.check_id != query.check_id:
+            continue
+        measured = datetime.fromisoformat(result.measured_at.replace("Z", "+00:00"))
+        if query.start_at and measured < query.start_at:
+            continue
+        if query.end_at and measured > query.end_at:
+            continue
+        newest.setdefault(result.check_id, result)
+    return list(newest.values())
+
+
+def test_latest_per_check_is_maintained_on_append_and_honours_filters() -> None:
+    data = SyntheticData(SyntheticScale(platforms=2, checks_per_platform=3, results_per_check=12))
+    results = data.status_results()
+    store = TimeSeriesStore()
+    store.extend(results[: len(results) // 2])
+    store = store.with_results(results[len(results) // 2 :])
+    # A check reporting under a second platform gets a second series.
+    moved = _result(
+        "moved", "2024-07-01T00:20:00Z", data.check_id(0), platform_id=data.platform_id(1)
+    )
+    store = store.with_results([moved])
+    results.append(moved)
+
+    middle = datetime(2024, 7, 1, 1, 0, tzinfo=timezone.utc)
+    for query in (
+        StatusResultQuery(limit=None),
+        StatusResultQuery(platform_id=data.platform_id(1), limit=None),
+        StatusResultQuery(check_id=data.check_id(0), limit=None),
+        StatusResultQuery(end_at=middle, limit=None),
+        StatusResultQuery(platform_id=data.platform_id(1), end_at=middle, limit=None),
+    ):
+        page = store.latest(query)
+        assert page.items == _brute_latest(results, query)
+        assert page.total == len(page.items)
+
+    first = store.latest(StatusResultQuery(limit=4))
+    rest = store.latest(StatusResultQuery(limit=4, cursor=first.next_cursor))
+    assert first.items + rest.items == _brute_latest(results, StatusResultQuery())
+    assert rest.next_cursor is None
+
+
+def _brute_buckets(results, width: int) -> list[dict]:
+    grouped: dict[int, list[StatusResult]] = {}
+    for result in results:
+        grouped.setdefault(parse_epoch_us(result.measured_at) // (width * 1_000_000), []).append(
+            result
+        )
+    buckets = []
+    for index in sorted(grouped):
+        members = grouped[index]
+        states = [item.state for item in members]
+        parsed = [observed_number(item.observed_value) for item in members]
+        numbers = [number for number in parsed if number is not None]
+        measured = sorted(parse_epoch_us(item.measured_at) for item in members)
+        buckets.append(
+            {
+                "start_at": format_epoch_us(index * width * 1_000_000),
+                "count": len(members),
+                "worst_state": max(states, key=state_severity),
+                "state_counts": {state: states.count(state) for state in sorted(set(states))},
+                "first_measured_at": format_epoch_us(measured[0]),
+                "last_measured_at": format_epoch_us(measured[-1]),
+                "observed_count": len(numbers),
+                "observed_min": min(numbers, default=None),
+                "observed_max": max(numbers, default=None),
+            }
+        )
+    return buckets
+
+
+def test_buckets_aggregate_each_window_like_a_full_scan() -> None:
+    data = SyntheticData(SyntheticScale(platforms=2, checks_per_platform=3, results_per_check=48))
+    results = data.status_results()
+    store = TimeSeriesStore()
+    store.extend(results)
+    start = datetime(2024, 7, 1, 1, 0, tzinfo=timezone.utc)
+    end = datetime(2024, 7, 1, 3, 0, tzinfo=timezone.utc)
+
+    query = StatusBucketQuery(platform_id=data.platform_id(1), start_at=start, end_at=end, points=8)
+    series = store.buckets(query)
+    assert series.bucket_seconds == 900
+    matching = [
+        item
+        for item in results
+        if item.platform_id == data.platform_id(1)
+        and to_epoch_us(start) <= parse_epoch_us(item.measured_at) <= to_epoch_us(end)
+    ]
+    expected = _brute_buckets(matching, 900)
+    actual = [to_dict(bucket) for bucket in series.items]
+    assert [{key: item[key] for key in expected[0]} for item in actual] == expected
+    assert sum(bucket.count for bucket in series.items) == len(matching)
+
+    # Without bounds the data's extent is sized: twelve hours in about four points.
+    unbounded = store.buckets(StatusBucketQuery(check_id=data.check_id(0), points=4))
+    assert unbounded.bucket_seconds == 10800
+    hourly = store.buckets(StatusBucketQuery(check_id=data.check_id(0), bucket_seconds=3600))
+    assert [bucket.start_at for bucket in hourly.items][:2] == [
+        "2024-07-01T00:00:00Z",
+        "2024-07-01T01:00:00Z",
+    ]
+    assert store.buckets(StatusBucketQuery(check_id="missing")).items == []
+
+
+def test_bucket_worst_state_and_observed_values() -> None:
+    store = TimeSeriesStore()
+    store.extend(
+        [
+            _result("a", "2024-07-18T08:00:00Z", state="green", observed_value="freshness=6m"),
+            _result("b", "2024-07-18T08:01:00Z", state="unknown", observed_value="n/a"),
+            _result("c", "2024-07-18T08:02:00Z", state="yellow", observed_value="lag=-1.5s"),
+            _result("d", "2024-07-18T08:06:00Z", state="unknown"),
+        ]
+    )
+
+    first, second = store.buckets(StatusBucketQuery(check_id="status-1", bucket_seconds=300)).items
+
+    assert (first.worst_state, first.count, first.end_at) == ("yellow", 3, "2024-07-18T08:05:00Z")
+    assert first.state_counts == {"green": 1, "unknown": 1, "yellow": 1}
+    assert (first.observed_count, first.observed_min, first.observed_max) == (2, -1.5, 6.0)
+    assert first.observed_avg == pytest.approx(2.25)
+    assert (second.worst_state, second.observed_count, second.observed_avg) == ("unknown", 0, None)
+    assert worst_state(["green", "maintenance", "red"]) == "red"
+    assert worst_state(["green", "maintenance"]) == "maintenance"
@@ -0,0 +1,144 @@
+"""Tests for request-scoped connection affinity."""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import pytest
+
+from app.db import deps
+from app.db.circuit import BreakerConfig, CircuitBreaker, CircuitBreakerQueryRunner, LastGoodResults
+from app.db.connection import DbApiConnection
+from app.db.unit_of_work import PinnedConnectionProvider, unit_of_work
+
+
+class _Cursor:
+    description: Sequence[Sequence[Any]] | None = [("value", None, None, None, None, None, None)]
+
+    def execute(self, operation: str, parameters: object | None = None) -> None:
+        return None
+
+    def executemany(self, operation: str, seq_of_parameters: Sequence[object]) -> None:
+        return None
+
+    def fetchall(self) -> Sequence[Sequence[Any]]:
+        return [(1,)]
+
+    def fetchmany(self, size: int) -> Sequence[Sequence[Any]]:
+        return []
+
+    def fetchone(self) -> Sequence[Any] | None:
+        return (1,)
+
+    def close(self) -> None:
+        return None
+
+
+class _Connection:
+    def cursor(self) -> _Cursor:
+        return _Cursor()
+
+    def close(self) -> None:
+        return None
+
+
+class _CountingProvider:
+    def __init__(self) -> None:
+        self.connects = 0
+        self.fail = False
+        self.released: list[DbApiConnection] = []
+
+    def connect(self) -> _Connection:
+        if self.fail:
+            raise ConnectionError("warehouse unreachable")
+        self.connects += 1
+        return _Connection()
+
+    def release(self, connection: DbApiConnection) -> None:
+        self.released.append(connection)
+
+
+def test_unit_of_work_pins_one_connection() -> None:
+    provider = _CountingProvider()
+
+    with unit_of_work(provider) as runner:
+        runner.fetch_all("SELECT 1 FROM platforms")
+        runner.fetch_one("SELECT 1 FROM status_checks")
+        runner.execute("UPDATE platforms SET state = 'ok'")
+        assert provider.released == []
+
+    assert provider.connects == 1
+    assert len(provider.released) == 1
+
+
+def test_unit_of_work_without_queries_never_connects() -> None:
+    provider = _CountingProvider()
+
+    with unit_of_work(provider):
+        pass
+
+    assert provider.connects == 0
+    assert provider.released == []
+
+
+def test_pinned_provider_rejects_use_after_close() -> None:
+    pinned = PinnedConnectionProvider(_CountingProvider())
+    pinned.close()
+
+    with pytest.raises(RuntimeError):
+        pinned.connect()
+
+
+def test_pinned_connection_is_not_shared_with_a_call_still_holding_it() -> None:
+    provider = _CountingProvider()
+    pinned = PinnedConnectionProvider(provider)
+    held = pinned.connect()
+
+    other = pinned.connect()
+    assert other is not held and provider.connects == 2
+    pinned.release(other)
+    pinned.close()
+
+    # The pinned connection goes back only once the call holding it is done.
+    assert provider.released == [other]
+    pinned.release(held)
+    assert provider.released == [other, held]
+
+
+def test_request_dependency_releases_after_request(monkeypatch) -> None:
+    provider = _CountingProvider()
+    monkeypatch.setattr(deps, "get_connection_provider", lambda: provider)
+
+    dependency = deps.get_request_query_runner()
+    runner = next(dependency)
+    runner.fetch_all("SELECT 1 FROM platforms")
+    runner.fetch_all("SELECT 1 FROM status_results")
+    with pytest.raises(StopIteration):
+        next(dependency)
+
+    assert provider.connects == 1
+    assert len(provider.released) == 1
+
+
+def test_request_runner_is_guarded_by_the_shared_breaker(monkeypatch) -> None:
+    provider = _CountingProvider()
+    breaker = CircuitBreaker(BreakerConfig(call_timeout_seconds=None))
+    last_good = LastGoodResults()
+    monkeypatch.setattr(deps, "get_connection_provider", lambda: provider)
+    monkeypatch.setattr(deps, "get_circuit_breaker", lambda: breaker)
+    monkeypatch.setattr(deps, "get_last_good_results", lambda: last_good)
+
+    results = []
+    for fail in (False, True):
+        provider.fail = fail
+        dependency = deps.get_request_query_runner()
+        runner = next(dependency)
+        assert isinstance(runner, CircuitBreakerQueryRunner) and runner.breaker is breaker
+        results.append(runner.fetch_result("SELECT 1 FROM platforms"))
+        with pytest.raises(StopIteration):
+            next(dependency)
+    breaker.stop()
+
+    assert [result.stale for result in results] == [False, True]
+    assert results[1].rows == [{"value": 1}]
+    assert breaker.stats().failures == 1
@@ -0,0 +1,116 @@
+"""Tests for the NumPy query path of the status-result store."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from app.db import timeseries
+from app.db.models import StatusResult
+from app.db.queries import StatusResultQuery
+from app.db.synthetic import SyntheticData, SyntheticScale
+from app.db.timeseries import TimeSeriesStore
+from app.db.vectorized import ResultFrame
+
+pytest.importorskip("numpy")
+
+DATA = SyntheticData(SyntheticScale(platforms=3, checks_per_platform=4, results_per_check=30))
+WINDOW_START = datetime(2024, 7, 1, 2, 0, tzinfo=timezone.utc)
+WINDOW_END = datetime(2024, 7, 1, 5, 0, tzinfo=timezone.utc)
+
+
+def _results() -> list[StatusResult]:
+    results = DATA.status_results()
+    # Rows from different checks that tie on (measured_at, created_at) must fall back to id.
+    tied = results[40]
+    for suffix, check in (("b", DATA.check_id(5)), ("a", DATA.check_id(9))):
+        results.append(replace(tied, id=f"{tied.id}-{suffix}", check_id=check))
+    # Bulk-formatted timestamps must match format_timestamp; raw forms are kept verbatim.
+    results.append(replace(tied, id="fraction", measured_at="2024-07-01T03:00:00.250000Z"))
+    results.append(replace(tied, id="offset", measured_at="2024-07-01T05:00:00+02:00"))
+    return results
+
+
+@pytest.fixture
+def stores(monkeypatch: pytest.MonkeyPatch) -> tuple[TimeSeriesStore, TimeSeriesStore]:
+    monkeypatch.setattr(timeseries, "VECTORIZE_MIN_ROWS", 0)
+    python, vectorized = TimeSeriesStore(vectorize=False), TimeSeriesStore()
+    python.extend(_results())
+    vectorized.extend(_results())
+    return python, vectorized
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        StatusResultQuery(limit=None),
+        StatusResultQuery(limit=7, offset=30),
+        StatusResultQuery(descending=False, limit=11, offset=3),
+        StatusResultQuery(platform_id=DATA.platform_id(1), limit=None),
+        StatusResultQuery(check_id=DATA.check_id(2), descending=False, limit=5),
+        StatusResultQuery(start_at=WINDOW_START, end_at=WINDOW_END, limit=9, offset=4),
+        StatusResultQuery(platform_id="missing", limit=None),
+    ],
+)
+def test_vectorized_pages_match_the_python_merge(
+    stores: tuple[TimeSeriesStore, TimeSeriesStore], query: StatusResultQuery
+) -> None:
+    python, vectorized = stores
+
+    assert vectorized.query(query) == python.query(query)
+
+
+def test_vectorized_empty_pages_match_the_python_merge(
+    stores: tuple[TimeSeriesStore, TimeSeriesStore],
+) -> None:
+    python, vectorized = stores
+    past_end = StatusResultQuery(limit=25, offset=100_000)
+    no_match = StatusResultQuery(start_at=datetime(2030, 1, 1, tzinfo=timezone.utc), limit=None)
+
+    for query in (past_end, no_match):
+        page = vectorized.query(query)
+        assert page == python.query(query)
+        assert page.items == []
+
+
+def test_frame_holds_only_the_candidate_rows(
+    stores: tuple[TimeSeriesStore, TimeSeriesStore], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    python, vectorized = stores
+    frames: list[ResultFrame] = []
+
+    def record(spans):
+        frames.append(ResultFrame(spans))
+        return frames[-1]
+
+    monkeypatch.setattr(timeseries, "ResultFrame", record)
+    query = StatusResultQuery(
+        platform_id=DATA.platform_id(1), start_at=WINDOW_START, end_at=WINDOW_END, limit=None
+    )
+
+    page = vectorized.query(query)
+
+    assert page == python.query(query)
+    assert [len(frame) for frame in frames] == [page.total]
+    assert page.total is not None and 0 < page.total < len(vectorized)
+
+
+def test_vectorized_cursor_walk_matches_and_follows_appends(
+    stores: tuple[TimeSeriesStore, TimeSeriesStore],
+) -> None:
+    python, vectorized = stores
+    for descending in (True, False):
+        query = StatusResultQuery(descending=descending, limit=13, include_total=False)
+        while True:
+            page = vectorized.query(query)
+            assert page == python.query(query)
+            if page.next_cursor is None:
+                break
+            query = replace(query, cursor=page.next_cursor)
+
+    newest = replace(DATA.status_results()[-1], id="newest", measured_at="2030-01-01T00:00:00Z")
+    updated = vectorized.with_results([newest])
+    assert updated.query(StatusResultQuery(limit=1)).items == [newest]
+    assert vectorized.query(StatusResultQuery(limit=1)).items != [newest]
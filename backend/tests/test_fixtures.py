@@ -1,6 +1,21 @@
 """Local fixture repository tests."""
 
+import threading
+from dataclasses import replace
+
+import pytest
+
+from app.db import fixtures
+from app.db.decoders import parse_timestamp
 from app.db.fixtures import LocalFixtureRepository
+from app.db.models import StatusCheck
+from app.db.queries import (
+    InvalidCursorError,
+    StatusCheckQuery,
+    StatusMessageQuery,
+    StatusResultQuery,
+    WorkItemQuery,
+)
 
 
 def test_list_platforms() -> None:
@@ -28,3 +43,150 @@ def test_filter_work_items_by_state() -> None:
     items = repo.list_work_items(state="open")
     assert items
     assert all(item.state == "open" for item in items)
+
+
+def test_query_status_results_pages_with_cursor() -> None:
+    repo = LocalFixtureRepository()
+    everything = repo.query_status_results(StatusResultQuery(limit=None))
+    first = repo.query_status_results(StatusResultQuery(limit=3))
+    second = repo.query_status_results(StatusResultQuery(limit=3, cursor=first.next_cursor))
+
+    assert first.total == second.total == len(everything.items)
+    assert first.items + second.items == everything.items[:6]
+    keys = [(item.measured_at, item.id) for item in everything.items]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_query_status_results_rejects_malformed_cursor() -> None:
+    repo = LocalFixtureRepository()
+    with pytest.raises(InvalidCursorError):
+        repo.query_status_results(StatusResultQuery(cursor="not-a-cursor"))
+
+
+def test_query_status_messages_filters_by_platform() -> None:
+    repo = LocalFixtureRepository()
+    platform_id = next(m.platform_id for m in repo.list_status_messages() if m.platform_id)
+    page = repo.query_status_messages(StatusMessageQuery(platform_id=platform_id))
+    assert page.items
+    assert all(message.platform_id == platform_id for message in page.items)
+
+
+def test_update_status_check_moves_platform_index() -> None:
+    repo = LocalFixtureRepository()
+    check = repo.list_status_checks()[0]
+    target = next(p.id for p in repo.list_platforms() if p.id != check.platform_id)
+
+    repo.update_status_check(replace(check, platform_id=target))
+
+    assert check.id not in {item.id for item in repo.list_status_checks(check.platform_id)}
+    assert check.id in {item.id for item in repo.list_status_checks(target)}
+    updated = repo.get_status_check(check.id)
+    assert updated is not None and updated.platform_id == target
+    with pytest.raises(KeyError):
+        repo.update_status_check(replace(check, id="missing"))
+
+
+def test_status_check_and_work_item_cursors_follow_updates() -> None:
+    repo = LocalFixtureRepository()
+    check = repo.list_status_checks()[0]
+    repo.update_status_check(replace(check, name="renamed", created_at="2030-01-01T00:00:00Z"))
+
+    first = repo.query_status_checks(StatusCheckQuery(limit=1))
+    second = repo.query_status_checks(StatusCheckQuery(limit=1, cursor=first.next_cursor))
+    everything = repo.query_status_checks(StatusCheckQuery(limit=None))
+
+    assert first.items[0].name == "renamed"
+    assert first.items + second.items == everything.items[:2]
+    assert everything.total == len(repo.list_status_checks())
+    assert len({item.id for item in everything.items}) == everything.total
+
+    open_items = repo.query_work_items(WorkItemQuery(state="open", limit=None))
+    assert open_items.items
+    assert [item.id for item in open_items.items] == [
+        item.id
+        for item in sorted(
+            repo.list_work_items(state="open"), key=lambda item: (item.created_at, item.id)
+        )[::-1]
+    ]
+
+
+def test_single_writes_bisect_into_the_same_order_as_a_merge(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def write_and_list(bisect_changes: int) -> list[StatusCheck]:
+        monkeypatch.setattr(fixtures, "_BISECT_CHANGES", bisect_changes)
+        repo = LocalFixtureRepository()
+        first, second = repo.list_status_checks()[:2]
+        repo.update_status_check(replace(first, created_at=second.created_at))
+        repo.update_status_check(replace(second, name="renamed"))
+        repo.create_status_check(replace(first, id="status-new", created_at="2000-01-01T00:00:00Z"))
+        return repo.query_status_checks(StatusCheckQuery(limit=None)).items
+
+    assert write_and_list(32) == write_and_list(0)
+
+
+def test_added_results_land_in_time_and_check_indexes() -> None:
+    repo = LocalFixtureRepository()
+    template = repo.list_status_results()[0]
+    added = [
+        replace(template, id=f"result-new-{minute}", measured_at=f"2030-01-01T00:{minute:02d}:00Z")
+        for minute in (30, 10, 20)
+    ]
+
+    assert repo.add_status_results(added) == 3
+
+    window = StatusResultQuery(
+        check_id=template.check_id,
+        start_at=parse_timestamp("2030-01-01T00:10:00Z"),
+        end_at=parse_timestamp("2030-01-01T00:20:00Z"),
+        descending=False,
+    )
+    page = repo.query_status_results(window)
+    assert [item.id for item in page.items] == ["result-new-10", "result-new-20"]
+    assert page.total == 2
+    assert repo.list_status_results()[-1].id == "result-new-30"
+
+
+def test_snapshot_is_unaffected_by_later_writes() -> None:
+    repo = LocalFixtureRepository()
+    before = repo.snapshot()
+    check = before.list_status_checks()[0]
+    template = before.list_status_results()[0]
+
+    repo.create_status_check(replace(check, id="status-new"))
+    repo.add_status_results([replace(template, id="result-new")])
+
+    assert before.get_status_check("status-new") is None
+    assert "result-new" not in {item.id for item in before.list_status_results()}
+    assert repo.get_status_check("status-new") is not None
+    assert repo.snapshot() is not before
+
+
+def test_concurrent_writers_and_readers_see_consistent_snapshots() -> None:
+    repo = LocalFixtureRepository()
+    template = repo.list_status_checks()[0]
+    errors: list[str] = []
+
+    def write(worker: int) -> None:
+        for n in range(50):
+            repo.create_status_check(replace(template, id=f"status-{worker}-{n}"))
+
+    def read() -> None:
+        for _ in range(200):
+            snapshot = repo.snapshot()
+            by_platform = sum(
+                len(snapshot.list_status_checks(platform.id))
+                for platform in snapshot.list_platforms()
+            )
+            if by_platform != len(snapshot.list_status_checks()):
+                errors.append("platform index out of step with id index")
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+    threads += [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert errors == []
+    assert len(repo.list_status_checks(template.platform_id)) >= 200
@@ -5,6 +5,9 @@ from __future__ import annotations
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.v1 import catalog
+from app.db.fixtures import LocalFixtureRepository
+from app.db.mock_data import DEFAULT_WORK_ITEMS
 from app.main import app
 
 client = TestClient(app)
@@ -62,6 +65,52 @@ def test_status_messages_pagination_and_ordering() -> None:
     _assert_pagination("/api/v1/status-messages", ("created_at", "id"))
 
 
+def test_work_items_pagination_and_ordering(monkeypatch: pytest.MonkeyPatch) -> None:
+    _assert_pagination("/api/v1/work-items", ("created_at", "id"))
+
+    # Newest first, like the other lists, rather than in insertion order.
+    older, newer = DEFAULT_WORK_ITEMS[-1], DEFAULT_WORK_ITEMS[0]
+    repository = LocalFixtureRepository(work_items=[older, newer])
+    monkeypatch.setattr(catalog, "get_repository", lambda: repository)
+    items = client.get("/api/v1/work-items").json()["items"]
+    assert [item["id"] for item in items] == [newer.id, older.id]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/v1/platforms",
+        "/api/v1/status-checks",
+        "/api/v1/status-results",
+        "/api/v1/status-messages",
+        "/api/v1/work-items",
+    ],
+)
+def test_cursor_pagination_walks_the_offset_order(path: str) -> None:
+    everything = client.get(path, params={"limit": 200}).json()
+    assert everything["next_cursor"] is None
+
+    seen: list[dict] = []
+    params: dict = {"limit": 2}
+    while True:
+        data = client.get(path, params=params).json()
+        seen.extend(data["items"])
+        if data["next_cursor"] is None:
+            break
+        # Only the first page is counted.
+        params["cursor"] = data["next_cursor"]
+        assert client.get(path, params=params).json()["total"] is None
+
+    assert seen == everything["items"]
+
+
+def test_malformed_cursor_is_rejected() -> None:
+    response = client.get("/api/v1/status-results", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "invalid_cursor"
+
+
 def test_status_results_filters() -> None:
     response = client.get("/api/v1/status-results")
     assert response.status_code == 200
@@ -149,3 +198,101 @@ def test_status_results_latest() -> None:
 
     assert len(filtered_items) == 1
     assert filtered_items[0]["id"] == expected_latest["id"]
+
+
+def test_status_results_timeseries_buckets() -> None:
+    results = client.get("/api/v1/status-results", params={"limit": 200}).json()["items"]
+    platform_id = results[0]["platform_id"]
+    expected = [item for item in results if item["platform_id"] == platform_id]
+
+    response = client.get(
+        "/api/v1/status-results/timeseries",
+        params={"platform_id": platform_id, "bucket_seconds": 3600},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["bucket_seconds"] == 3600
+    buckets = data["items"]
+    assert buckets == sorted(buckets, key=lambda bucket: bucket["start_at"])
+    assert sum(bucket["count"] for bucket in buckets) == len(expected)
+    for bucket in buckets:
+        assert bucket["start_at"] <= bucket["first_measured_at"] <= bucket["last_measured_at"]
+        assert bucket["last_measured_at"] < bucket["end_at"]
+        assert bucket["worst_state"] in bucket["state_counts"]
+
+    sized = client.get(
+        "/api/v1/status-results/timeseries",
+        params={
+            "platform_id": platform_id,
+            "start_at": "2024-07-01T00:00:00+00:00",
+            "end_at": "2024-07-31T02:00:00+02:00",
+            "points": 30,
+        },
+    )
+    assert sized.status_code == 200
+    assert sized.json()["bucket_seconds"] == 86400
+    # The window is echoed normalized, as /sla does.
+    assert (sized.json()["start_at"], sized.json()["end_at"]) == (
+        "2024-07-01T00:00:00Z",
+        "2024-07-31T00:00:00Z",
+    )
+    assert (data["start_at"], data["end_at"]) == (None, None)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"check_id": "status-001", "points": 0},
+        {"check_id": "status-001", "bucket_seconds": 10},
+        {
+            "check_id": "status-001",
+            "bucket_seconds": 60,
+            "start_at": "2024-07-01T00:00:00Z",
+            "end_at": "2024-07-31T00:00:00Z",
+        },
+        # Open ends are measured to the data's extent, not skipped.
+        {"check_id": "status-001", "bucket_seconds": 60, "start_at": "2024-07-01T00:00:00Z"},
+        {"check_id": "status-001", "bucket_seconds": 60, "end_at": "2024-07-31T00:00:00Z"},
+    ],
+)
+def test_status_results_timeseries_rejects_bad_parameters(params: dict) -> None:
+    response = client.get("/api/v1/status-results/timeseries", params=params)
+    assert response.status_code == 400
+
+
+def test_status_results_sla_reports_checks_and_platform_rollups() -> None:
+    window = {"start_at": "2024-07-15T00:00:00Z", "end_at": "2024-07-19T00:00:00Z"}
+    response = client.get("/api/v1/status-results/sla", params=window)
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["start_at"], data["end_at"]) == (window["start_at"], window["end_at"])
+
+    checks, platforms = data["checks"], data["platforms"]
+    assert checks and [item["check_id"] for item in checks] == sorted(
+        item["check_id"] for item in checks
+    )
+    for report in checks:
+        assert 0 <= report["uptime"] <= 1
+        assert sum(report["state_seconds"].values()) == pytest.approx(4 * 86400)
+        assert report["open_breaches"] <= report["breaches"]
+    assert {item["platform_id"] for item in platforms} == {item["platform_id"] for item in checks}
+    assert sum(item["checks"] for item in platforms) == len(checks)
+
+    check_id = checks[0]["check_id"]
+    single = client.get("/api/v1/status-results/sla", params={**window, "check_id": check_id})
+    assert single.status_code == 200
+    assert single.json()["checks"] == [checks[0]]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"start_at": "2024-07-19T00:00:00Z", "end_at": "2024-07-19T00:00:00Z"},
+        {"start_at": "2023-01-01T00:00:00Z", "end_at": "2024-07-19T00:00:00Z"},
+        {"start_at": "yesterday"},
+    ],
+)
+def test_status_results_sla_rejects_bad_windows(params: dict) -> None:
+    response = client.get("/api/v1/status-results/sla", params=params)
+    assert response.status_code == 400
@@ -0,0 +1,155 @@
+"""Tests for warehouse warm-up, keepalive, and readiness."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import Settings
+from app.db.query import MockQueryRunner
+from app.db.warmup import (
+    KEEPALIVE_SQL,
+    WarehouseWarmer,
+    WarmupState,
+    parse_active_hours,
+    within_active_hours,
+)
+from app.main import create_app
+
+
+class _Pool:
+    def __init__(self) -> None:
+        self.opened = False
+        self.closed = False
+        self.evictions = 0
+
+    def open(self) -> None:
+        self.opened = True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def evict_idle(self) -> int:
+        self.evictions += 1
+        return 0
+
+
+class _Connector:
+    token_provider = None
+
+    def __init__(self) -> None:
+        self.pool = _Pool()
+
+    def open_pool(self) -> None:
+        self.pool.open()
+
+    def close_pool(self) -> None:
+        self.pool.close()
+
+
+def _at_hour(hour: int) -> datetime:
+    return datetime(2024, 7, 18, hour, 0, tzinfo=timezone.utc)
+
+
+def test_warm_up_opens_pool_and_queries_hot_tables() -> None:
+    connector = _Connector()
+    runner = MockQueryRunner()
+    state = WarmupState(required=True)
+    warmer = WarehouseWarmer(connector, runner, state, tables=("platforms", "status_results"))
+
+    assert state.ready is False
+    warmer.warm_up()
+
+    assert connector.pool.opened is True
+    assert [call.sql for call in runner.calls] == [
+        "SELECT * FROM platforms LIMIT 1",
+        "SELECT * FROM status_results LIMIT 1",
+    ]
+    assert state.ready is True
+    assert state.error is None
+
+
+def test_warm_up_failure_still_marks_ready_with_error() -> None:
+    class _FailingRunner(MockQueryRunner):
+        def fetch_all(self, sql, params=None):
+            raise RuntimeError("warehouse stopped")
+
+    state = WarmupState(required=True)
+    WarehouseWarmer(_Connector(), _FailingRunner(), state).warm_up()
+
+    assert state.ready is True
+    assert "warehouse stopped" in (state.error or "")
+
+
+def test_keepalive_respects_active_hours() -> None:
+    runner = MockQueryRunner()
+    clock_hour = {"value": 6}
+    warmer = WarehouseWarmer(
+        _Connector(),
+        runner,
+        WarmupState(),
+        active_hours=parse_active_hours("07-19"),
+        clock=lambda: _at_hour(clock_hour["value"]),
+    )
+
+    assert warmer.keepalive_once() is False
+    clock_hour["value"] = 8
+    assert warmer.keepalive_once() is True
+    assert [call.sql for call in runner.calls] == [KEEPALIVE_SQL]
+
+
+def test_active_hours_wrap_midnight() -> None:
+    hours = parse_active_hours("22-06")
+
+    assert within_active_hours(hours, _at_hour(23))
+    assert within_active_hours(hours, _at_hour(5))
+    assert not within_active_hours(hours, _at_hour(12))
+    with pytest.raises(ValueError):
+        parse_active_hours("morning")
+
+
+def test_readyz_reports_not_ready_until_warm() -> None:
+    app = create_app()
+    app.state.warmup = WarmupState(required=True)
+    client = TestClient(app)
+
+    response = client.get("/api/v1/readyz")
+    assert response.status_code == 503
+    assert response.json() == {"status": "warming", "ready": False}
+
+    app.state.warmup.mark_ready()
+    assert client.get("/api/v1/readyz").json() == {"status": "ok", "ready": True}
+
+
+def test_shutdown_closes_the_pool_without_a_warmer(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Breaker:
+        def start_probing(self, probe) -> None:
+            pass
+
+        def stop(self) -> None:
+            pass
+
+    class _Runner:
+        breaker = _Breaker()
+
+        def probe(self) -> None:
+            pass
+
+    settings = Settings(
+        databricks_host="https://example.cloud.databricks.com",
+        databricks_warehouse_http_path="/sql/1.0/warehouses/abc",
+        databricks_token="token",
+        warehouse_warmup_enabled=False,
+    )
+    connector = _Connector()
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+    monkeypatch.setattr(main, "get_connection_provider", lambda: connector)
+    monkeypatch.setattr(main, "get_query_runner", lambda: _Runner())
+
+    with TestClient(main.create_app()):
+        assert connector.pool.closed is False
+
+    assert connector.pool.closed is True